@@ -3,7 +3,7 @@ import streamlit as st
 import pandas as pd
 from pathlib import Path
 import pkgutil, importlib, io, yaml
-import logging, sys
+import logging, sys, threading
 from pipeline.logger import get_logger, make_run_logger, log_event, log_exception
 import json as _json
 import datetime as _dt
@@ -23,32 +23,10 @@ logging.basicConfig(
 logger = get_logger("contracts-ai.ui")
 
 import re as _re_dbg
-
-SEC_HDRS = {
-    1: _re_dbg.compile(r'(§\s*1\s+Vertragsgegenstand|^\s*1[.)]?\s+Vertragsgegenstand)', _re_dbg.I | _re_dbg.M),
-    2: _re_dbg.compile(r'(§\s*2\s+(Pflichten|Leistungsumfang)|^\s*2[.)]?\s+(Pflichten|Leistungsumfang))', _re_dbg.I | _re_dbg.M),
-    3: _re_dbg.compile(r'(§\s*3\s+(Vergütung|Verguetung|Zahlung)|^\s*3[.)]?\s+(Vergütung|Verguetung|Zahlung))', _re_dbg.I | _re_dbg.M),
-    4: _re_dbg.compile(r'(§\s*4\s+(Vertragsdauer|Laufzeit|Kündigung|Kuendigung)|^\s*4[.)]?\s+(Vertragsdauer|Laufzeit|Kündigung|Kuendigung))', _re_dbg.I | _re_dbg.M),
-}
+from core.sections import SectionIndex
 
 def _find_section_span(txt: str, num: int):
-    rx_start = SEC_HDRS.get(num)
-    if not rx_start: return None
-    m = rx_start.search(txt)
-    if not m: return None
-    start = m.start()
-    end = len(txt)
-    for nxt in range(num+1, 5):
-        rxn = SEC_HDRS.get(nxt)
-        if not rxn: continue
-        n = rxn.search(txt, m.end())
-        if n:
-            end = min(end, n.start())
-    try:
-        log_event(_runlg, 'run_finish', run_id=run_id)
-    except Exception:
-        pass
-    return (start, end)
+    return SectionIndex.of(txt).span(num)
 
 def _slice(txt: str, span):
     s, e = span
@@ -87,119 +65,80 @@ def _fmt_date_dbg(s: str | None) -> str | None:
 
 
 # --- Project imports
-from core.registry import REGISTRY
+from core.registry import REGISTRY, load_extractors
+from pipeline.extractor_set import ExtractorSet
 from core.schemas import ExtractItem, ExtractBatch
 from pipeline.postprocess import build_entities_links, build_price_schedule_from_tables
 from pipeline.summarize import summarize, summarize_keyfacts
 from pipeline.export import export_results
 from pipeline.reader import read_docx_with_fallback, repack_paragraphs
+from io_ops.docx_model import load_docx
+from io_ops.writers import batches_to_df
+from io_ops.formats import detect_reader, decode_text
 from pipeline.export import align_keyfacts_to_schema
 from core.contract_schema import CONTRACT_SCHEMA, schema_columns_flat
 from pipeline.textprep import normalize_text
 from pipeline.normalize import normalize_spans, summarize_de
+from pipeline.cache import ResultCache, MemoryLRU, content_digest, pipeline_key
+
+# Memory-only result cache shared across Streamlit reruns in this process;
+# keyed by the upload, the extractors and the policies file
+_UI_CACHE = ResultCache(MemoryLRU(16))
+_POLICIES_PATH = str(Path(__file__).resolve().parents[1] / "rules" / "policies.yml")
 
 # Load all extractors (Plugin Registry)
-import extractors
-for _, modname, _ in pkgutil.iter_modules(extractors.__path__):
-    if modname not in ("__init__", "base"):
-        importlib.import_module(f"extractors.{modname}")
+load_extractors()
+
+_EXTRACTORS = None
+# Streamlit runs every session (and every rerun) in its own thread, while an
+# ExtractorSet holds the scan of the document it is extracting: one run at a time
+_EXTRACTORS_LOCK = threading.Lock()
+
+
+def _extractor_set() -> ExtractorSet:
+    """All registered extractors, constructed once per process and reused across reruns.
+
+    Call with ``_EXTRACTORS_LOCK`` held, and keep it while extracting.
+    """
+    global _EXTRACTORS
+    classes = list(REGISTRY.get("extractors", []))
+    if _EXTRACTORS is None or _EXTRACTORS[0] != classes:
+        _EXTRACTORS = (classes, ExtractorSet(classes, logger=logger))
+    return _EXTRACTORS[1]
 
 st.set_page_config(page_title="Vertragsanalyse (DE)", layout="wide")
 
 
 # --- Helpers
 def _batches_to_df(batches):
-    rows = []
-    for b in batches:
-        items = getattr(b, "items", [])
-        for it in items:
-            rows.append({
-                "doc_id": getattr(b, "doc_id", ""),
-                "type": getattr(it, "item_type", ""),
-                "subtype": getattr(it, "subtype", ""),
-                "text_raw": getattr(it, "text_raw", ""),
-                "value_norm": getattr(it, "value_norm", None),
-                "currency": getattr(it, "currency", None),
-                "unit": getattr(it, "unit", None),
-                "page": getattr(it, "page", None),
-                "para": getattr(it, "para", None),
-                "start": getattr(it, "start", None),
-                "end": getattr(it, "end", None),
-                "confidence": getattr(it, "confidence", None),
-                "extractor": getattr(it, "extractor", ""),
-                "version": getattr(it, "version", ""),
-            })
-    df = pd.DataFrame(rows)
-    if not df.empty:
-        df = df.reset_index(drop=True)
-        df["span_id"] = ["sp_" + str(i + 1).zfill(6) for i in range(len(df))]
-    else:
-        df = pd.DataFrame(columns=[
-            "doc_id","type","subtype","text_raw","value_norm","currency","unit",
-            "page","para","start","end","confidence","extractor","version","span_id"
-        ])
-    try:
-        log_event(_runlg, 'run_finish', run_id=run_id)
-    except Exception:
-        pass
-    return df
+    return batches_to_df(batches)
 
 
 # --- Robust readers
 
 # --- Robust readers (clean) ---
-def _read_text(file):
-    """Return textual content from an uploaded file-like object."""
-    suffix = Path(file.name).suffix.lower()
+# The reader is detected from the upload's bytes (io_ops.formats), not its name.
+def _read_text_and_tables(file):
+    """Return (text, tables) from an uploaded file-like object."""
     data = file.read()
-    if suffix == ".txt":
-        try:
-            return data.decode("utf-8")
-        except Exception:
-            return data.decode("latin-1", errors="ignore")
-    elif suffix == ".docx":
-        try:
-            from docx import Document
-            import io as _io
-            doc = Document(_io.BytesIO(data))
-            return "\n".join(p.text for p in doc.paragraphs)
-        except Exception:
-            return ""
-    # Fallback for any other extension
     try:
-        return data.decode("utf-8")
+        reader = detect_reader(data)
+    except ValueError:
+        return decode_text(data), []
+    try:
+        if reader.__reader_name__ == "docx":
+            # UI layout: body paragraphs only, tables returned separately
+            m = load_docx(io.BytesIO(data))
+            return "\n".join(p for p in m.paragraphs if p), m.tables_stripped
+        doc, tables = reader().read(data)
+        return doc.text, tables
     except Exception:
-        return data.decode("latin-1", errors="ignore")
+        return "", []
 
 
-def _read_text_and_tables(file):
-    """Return (text, tables) from an uploaded file-like object."""
-    suffix = Path(file.name).suffix.lower()
-    data = file.read()
-    if suffix == ".docx":
-        try:
-            from docx import Document
-            import io as _io
-            doc = Document(_io.BytesIO(data))
-            parts = []
-            for p in doc.paragraphs:
-                if p.text:
-                    parts.append(p.text)
-            tables = []
-            for t in doc.tables:
-                rows = []
-                for r in t.rows:
-                    rows.append([c.text.strip() for c in r.cells])
-                tables.append(rows)
-            return "\n".join(parts), tables
-        except Exception:
-            return "", []
-    else:
-        try:
-            text = data.decode("utf-8")
-        except Exception:
-            text = data.decode("latin-1", errors="ignore")
-        return text, []
+def _read_text(file):
+    """Return textual content from an uploaded file-like object."""
+    return _read_text_and_tables(file)[0]
 
 global results_dir
 try:
@@ -221,18 +160,8 @@ except NameError:
 RUN_ON_IMPORT = False
 if RUN_ON_IMPORT:
     doc_id = Path(file.name).stem
-    batches = []
-    for ext_cls in REGISTRY["extractors"]:
-        try:
-            ext = ext_cls()
-        except Exception:
-            logger.exception("Extractor init failed: %s", getattr(ext_cls, "__name__", ext_cls))
-            continue
-        try:
-            batches.append(ext.extract(doc_id, text))
-        except Exception:
-            logger.exception("Extractor run failed: %s", getattr(ext, "__name__", type(ext)))
-            continue
+    with _EXTRACTORS_LOCK:
+        batches = _extractor_set().extract(doc_id, text)
 
     df_spans = _batches_to_df(batches)
     # Enrich spans and derive KeyFacts
@@ -263,7 +192,7 @@ if RUN_ON_IMPORT:
 
     # Summaries
     sum_en = summarize(df_spans)
-    keyfacts = summarize_keyfacts(text, sections, df_spans)
+    keyfacts = summarize_keyfacts(text, SectionIndex.of(text), df_spans)
     diagnostics = {'warnings': warnings if 'warnings' in locals() else []}
     out_xlsx = str(results_dir / f"{run_id}_result.xlsx")
     out_json = str(results_dir / f"{run_id}_result.json")
@@ -314,36 +243,39 @@ def run_local_pipeline(uploaded_file):
         suffix = Path(uploaded_file.name).suffix.lower()
     except Exception:
         suffix = ""
-    # Read text (+tables for .docx), without touching Streamlit widgets
-    try:
-        if suffix == ".docx":
-            text, tables = _read_text_and_tables(uploaded_file)
-        else:
-            text = _read_text(uploaded_file)
-            tables = []
-    except Exception:
-        text, tables = "", []
-
     # Prepare identifiers & logger-safe run_id
     try:
         doc_id = Path(uploaded_file.name).stem
     except Exception:
         doc_id = "doc"
 
+    # Cache lookup: a Streamlit rerun on an unchanged upload (same extractors and
+    # policies) returns the previous result without running any stage again
+    cache_key = None
+    try:
+        uploaded_file.seek(0)
+        cache_key = pipeline_key(content_digest(uploaded_file.read()), REGISTRY.get("extractors", []),
+                                 policies_path=_POLICIES_PATH, extra=(suffix, doc_id))
+        uploaded_file.seek(0)
+    except Exception:
+        cache_key = None
+    cached = _UI_CACHE.get(cache_key) if cache_key else None
+    if cached is not None:
+        *frames, excel_bytes = cached
+        return (*frames, io.BytesIO(excel_bytes))
+
+    # Read text (+tables for .docx), without touching Streamlit widgets
+    try:
+        text, tables = _read_text_and_tables(uploaded_file)
+    except Exception:
+        text, tables = "", []
+
     # Collect batches from registered extractors (if any)
     batches = []
     try:
-        for ext_cls in REGISTRY.get("extractors", []):
-            try:
-                ext = ext_cls()
-            except Exception:
-                logger.exception("Extractor init failed: %s", getattr(ext_cls, "__name__", ext_cls))
-                continue
-            try:
-                batches.append(ext.extract(doc_id, text))
-            except Exception:
-                logger.exception("Extractor run failed: %s", getattr(ext, "__name__", type(ext)))
-                continue
+        # constructed once per process; failing extractors are logged and skipped
+        with _EXTRACTORS_LOCK:
+            batches = _extractor_set().extract(doc_id, text)
     except Exception:
         pass
 
@@ -519,6 +451,8 @@ def run_local_pipeline(uploaded_file):
         excel_buf = _tmp
     except Exception:
         pass
+    if cache_key:
+        _UI_CACHE.put(cache_key, (text, df_spans, comp_df, ents_df, links_df, summary_de, excel_buf.getvalue()))
     return text, df_spans, comp_df, ents_df, links_df, summary_de, excel_buf
 
 
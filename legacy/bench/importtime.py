@@ -0,0 +1,99 @@
+"""Cold-start benchmark for the pipeline entry points.
+
+Each entry module is imported in a fresh interpreter under ``python -X importtime``;
+the cumulative time of the top-level import (interpreter start-up excluded) is
+compared with ``bench/importtime_baseline.json``. The run fails when a module is
+slower than ``baseline * tolerance + slack_ms`` or when it imports one of the
+``forbidden`` heavy modules (pandas, PyMuPDF, python-docx, …) at import time.
+
+    python -m bench.importtime            # check against the baseline
+    python -m bench.importtime --update   # re-record the baseline on this machine
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+BASELINE = Path(__file__).with_name("importtime_baseline.json")
+
+ENTRY_POINTS = ("pipeline.runner_api", "pipeline.batch", "pipeline.reader", "io_ops.formats")
+FORBIDDEN = ("pandas", "numpy", "fitz", "docx", "docx2txt", "lxml", "pydantic", "extractors", "pipeline.stages")
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    """``{module: (depth, cumulative_us)}`` from ``-X importtime`` output (first occurrence wins)."""
+    out = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        out.setdefault(name.strip(), (depth, int(cumulative)))
+    return out
+
+
+def measure(module: str) -> tuple[float, list[str]]:
+    """One cold import of ``module``: (milliseconds, forbidden modules it pulled in)."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=ROOT, capture_output=True, text=True, check=True)
+    mods = parse_importtime(proc.stderr)
+    # a submodule is a top-level entry when its package was imported first
+    ms = sum(us for name, (depth, us) in mods.items()
+             if depth == 0 and (name == module or module.startswith(name + "."))) / 1000
+    heavy = [m for m in FORBIDDEN if m in mods]
+    return ms, heavy
+
+
+def run(modules=ENTRY_POINTS, repeat: int = 5) -> dict[str, dict]:
+    res = {}
+    for m in modules:
+        samples, heavy = [], []
+        for _ in range(repeat):
+            ms, heavy = measure(m)
+            samples.append(ms)
+        res[m] = {"ms": round(statistics.median(samples), 1), "forbidden": heavy}
+    return res
+
+
+def check(results: dict, baseline: dict) -> list[str]:
+    tol, slack = baseline.get("tolerance", 1.5), baseline.get("slack_ms", 30)
+    problems = []
+    for m, r in results.items():
+        if r["forbidden"]:
+            problems.append(f"{m}: imports {', '.join(r['forbidden'])} at import time")
+        base = baseline.get("modules", {}).get(m)
+        if base is not None and r["ms"] > base * tol + slack:
+            problems.append(f"{m}: {r['ms']:.1f} ms > baseline {base:.1f} ms × {tol} + {slack} ms")
+    return problems
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--repeat", type=int, default=5)
+    ap.add_argument("--update", action="store_true", help="write the measured times as the new baseline")
+    args = ap.parse_args(argv)
+
+    results = run(repeat=args.repeat)
+    for m, r in results.items():
+        print(f"{m:<24} {r['ms']:8.1f} ms" + (f"  forbidden: {r['forbidden']}" if r["forbidden"] else ""))
+    baseline = json.loads(BASELINE.read_text(encoding="utf-8")) if BASELINE.exists() else {}
+    if args.update:
+        baseline["modules"] = {m: r["ms"] for m, r in results.items()}
+        baseline.setdefault("tolerance", 1.5)
+        baseline.setdefault("slack_ms", 30)
+        BASELINE.write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+        print(f"baseline written → {BASELINE}")
+        return 0
+    problems = check(results, baseline)
+    for p in problems:
+        print("REGRESSION:", p)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
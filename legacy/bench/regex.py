@@ -0,0 +1,173 @@
+"""Scaling benchmark for extractor regexes.
+
+Every compiled pattern of every registered extractor (class attributes,
+``scan_patterns()`` and module-level patterns) is timed over two inputs at
+``size``, ``2 * size`` and ``4 * size`` characters: the sample contracts in
+``data/input`` repeated, and an adversarial text that brings the pattern up to
+its open-ended ``.*?``/``[^…]*`` part again and again between filler that never
+completes a match (the case where a ``keyword.*?value`` pattern reads to the end
+of the document from every keyword). A pattern is flagged when doubling the input multiplies its time by
+more than ``2 ** max_exponent`` and the largest run takes at least ``min_ms``.
+
+Patterns are timed the way extractors run them, through
+``core.regex_guard.guard``; ``--raw`` times them as written.
+
+    python -m bench.regex                  # guarded patterns; exit code 1 on super-linear ones
+    python -m bench.regex --raw            # find the patterns that need the guard
+    python -m bench.regex --size 20000 --top 20
+"""
+from __future__ import annotations
+
+import argparse
+import math
+import re
+import sys
+import time
+from pathlib import Path
+
+try:  # Python >= 3.11
+    from re import _parser as _sre_parse, _constants as _sre_c
+except ImportError:  # pragma: no cover - older interpreters
+    import sre_parse as _sre_parse, sre_constants as _sre_c
+
+ROOT = Path(__file__).resolve().parents[1]
+
+FILLER = "lorem ipsum dolor sit amet consectetur adipiscing elit "
+# digit-led patterns (amounts, dates) without a closing unit or currency
+NUMBERS = "1.000" * 40 + " "
+
+
+def patterns() -> list[tuple[str, re.Pattern]]:
+    """``(name, pattern)`` for every distinct compiled pattern the registered extractors use."""
+    from core.registry import load_extractors
+    out, seen = [], set()
+
+    def add(name, rx):
+        if isinstance(rx, re.Pattern) and id(rx) not in seen:
+            seen.add(id(rx))
+            out.append((name, rx))
+
+    for cls in load_extractors():
+        ext = getattr(cls, "__extractor_name__", cls.__name__)
+        try:
+            inst = cls()
+        except Exception:
+            inst = None
+        for k in dir(cls):
+            add(f"{ext}.{k}", getattr(cls, k, None))
+        if inst is not None and hasattr(inst, "scan_patterns"):
+            for i, rx in enumerate(inst.scan_patterns()):
+                add(f"{ext}.scan_patterns[{i}]", rx)
+        mod = sys.modules.get(cls.__module__)
+        for k, v in vars(mod).items() if mod else ():
+            add(f"{cls.__module__}.{k}", v)
+    return out
+
+
+_CONTRACTS = []
+
+
+def contract_text(n: int) -> str:
+    """The sample contracts, repeated to ``n`` characters."""
+    if not _CONTRACTS:
+        from io_ops.formats import read_document
+        for p in sorted((ROOT / "data" / "input").iterdir()):
+            try:
+                _CONTRACTS.append(read_document(str(p))[0].text)
+            except Exception:
+                continue
+    unit = "\n".join(_CONTRACTS) or FILLER
+    return (unit * (n // len(unit) + 1))[:n]
+
+
+_SAMPLE_CHAR = {_sre_c.CATEGORY_DIGIT: "1", _sre_c.CATEGORY_SPACE: " ", _sre_c.CATEGORY_WORD: "a"}
+
+
+def _head(items) -> tuple[str, bool]:
+    """Shortest text matching ``items`` up to the first open-ended ``.*``/``[^…]*`` scan; (text, reached it)."""
+    out = []
+    for op, av in items:
+        if op is _sre_c.LITERAL:
+            out.append(chr(av))
+        elif op is _sre_c.ANY:
+            out.append("a")
+        elif op is _sre_c.IN:
+            o, a = av[0]
+            out.append(chr(a) if o is _sre_c.LITERAL else chr(a[0]) if o is _sre_c.RANGE
+                       else _SAMPLE_CHAR.get(a, "a") if o is _sre_c.CATEGORY else "a")
+        elif op is _sre_c.SUBPATTERN or op is _sre_c.BRANCH:
+            text, stop = _head(av[-1].data if op is _sre_c.SUBPATTERN else av[1][0].data)
+            out.append(text)
+            if stop:
+                return "".join(out), True
+        elif op in (_sre_c.MAX_REPEAT, _sre_c.MIN_REPEAT):
+            lo, hi, item = av
+            first = item.data[0][0] if item.data else None
+            if hi == _sre_c.MAXREPEAT and (first is _sre_c.ANY or (first is _sre_c.IN and item.data[0][1][0][0] is _sre_c.NEGATE)):
+                return "".join(out), True
+            out.append(_head(item.data)[0] * lo)
+    return "".join(out), False
+
+
+def adversarial_text(rx: re.Pattern, n: int) -> str:
+    """What ``rx`` needs up to its open-ended scan, then filler that never completes it, repeated to ``n`` characters."""
+    try:
+        head = _head(_sre_parse.parse(rx.pattern, rx.flags).data)[0].strip()
+    except Exception:
+        head = ""
+    unit = f"{head} {FILLER}" if len(head) >= 2 else NUMBERS + FILLER
+    return (unit * (n // len(unit) + 1))[:n]
+
+
+def timed(rx: re.Pattern, text: str, repeat: int = 3) -> float:
+    """Best-of-``repeat`` seconds for a full ``finditer`` scan."""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for _ in rx.finditer(text):
+            pass
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+
+def scaling(rx: re.Pattern, make_text, size: int, repeat: int = 3) -> dict:
+    """Times at 1x/2x/4x ``size`` and the exponent ``log2(t(4x) / t(2x))`` (1 = linear, 2 = quadratic)."""
+    ts = [timed(rx, make_text(size * k), repeat) for k in (1, 2, 4)]
+    exponent = math.log2(ts[2] / ts[1]) if ts[1] > 0 else 0.0
+    return {"ms": [round(t * 1000, 2) for t in ts], "exponent": round(exponent, 2)}
+
+
+def run(size: int = 8000, raw: bool = False, repeat: int = 3) -> list[dict]:
+    from core.regex_guard import guard
+    rows = []
+    for name, rx in patterns():
+        timed_rx = rx if raw else guard(rx)
+        for kind, make in (("contract", contract_text), ("adversarial", lambda n: adversarial_text(rx, n))):
+            rows.append({"pattern": name, "input": kind, **scaling(timed_rx, make, size, repeat)})
+    return rows
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--size", type=int, default=8000, help="smallest input in characters")
+    ap.add_argument("--raw", action="store_true", help="time the patterns without the scan-window guard")
+    ap.add_argument("--repeat", type=int, default=3)
+    ap.add_argument("--max-exponent", type=float, default=1.5)
+    ap.add_argument("--min-ms", type=float, default=5.0, help="ignore patterns faster than this at 4x size")
+    ap.add_argument("--top", type=int, default=10, help="slowest patterns to list")
+    args = ap.parse_args(argv)
+
+    sys.path.insert(0, str(ROOT))
+    rows = run(args.size, args.raw, args.repeat)
+    rows.sort(key=lambda r: r["ms"][-1], reverse=True)
+    flagged = [r for r in rows if r["exponent"] > args.max_exponent and r["ms"][-1] >= args.min_ms]
+    for r in rows[:args.top]:
+        print(f"{r['pattern']:<45} {r['input']:<12} {' / '.join(f'{m:8.2f}' for m in r['ms'])} ms  x^{r['exponent']:.2f}")
+    for r in flagged:
+        print(f"SUPER-LINEAR {r['pattern']} on {r['input']} input: x^{r['exponent']:.2f}, {r['ms'][-1]:.1f} ms at {4 * args.size} chars")
+    print(f"{len({r['pattern'] for r in rows})} patterns, {len(flagged)} flagged")
+    return 1 if flagged else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""Memory benchmark for the spans table schema.
+
+The sample contracts in ``data/input`` are extracted once. Their spans are
+then repeated as ``--docs`` documents, each with its own ``doc_id``, and
+concatenated the way ``pipeline.batch`` builds a corpus-level frame. This is
+done twice:
+
+* plain: the dtypes ``pd.DataFrame`` infers. Strings are ``object`` on pandas 2
+  and ``str`` on pandas 3; offsets are ``int64``, or ``object`` with gaps;
+* schema: ``core.spanframe.span_dtypes`` per document, joined with ``concat_spans``.
+
+The deep ``memory_usage`` of both frames is printed per column and in total.
+
+    python -m bench.spanmem
+    python -m bench.spanmem --docs 2000
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def document_columns() -> list[dict]:
+    """Spans columns (``core.spans.to_columns``) of every sample contract, located on its pages."""
+    import yaml
+    from core.spans import to_columns
+    from io_ops.formats import read_document
+    from pipeline.extractor_set import ExtractorSet
+    cfg = yaml.safe_load((ROOT / "pipeline" / "config.yml").read_text(encoding="utf-8")) or {}
+    extractors = ExtractorSet.from_config(cfg)
+    out = []
+    for path in sorted((ROOT / "data" / "input").iterdir()):
+        doc, _ = read_document(str(path))
+        cols = to_columns(extractors.run(path.stem, doc.text))
+        if cols["doc_id"]:
+            out.append(cols)
+    return out
+
+
+def corpus(columns: list[dict], docs: int, schema: bool):
+    """Spans frame of ``docs`` documents cycling through ``columns``; ``schema``: in the spans schema."""
+    import pandas as pd
+    from core.spanframe import concat_spans, span_dtypes
+    frames = []
+    for i in range(docs):
+        df = pd.DataFrame(columns[i % len(columns)]).assign(doc_id=f"doc_{i:06d}")
+        frames.append(span_dtypes(df) if schema else df)
+    return concat_spans(frames) if schema else pd.concat(frames, ignore_index=True)
+
+
+def main(argv=None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    ap.add_argument("--docs", type=int, default=500, help="documents in the corpus frame")
+    args = ap.parse_args(argv)
+
+    sys.path.insert(0, str(ROOT))
+    from core.spanframe import text_dtype
+    columns = document_columns()
+    if not columns:
+        print("no spans in data/input")
+        return 1
+    plain, compact = corpus(columns, args.docs, False), corpus(columns, args.docs, True)
+    before, after = plain.memory_usage(deep=True, index=False), compact.memory_usage(deep=True, index=False)
+    print(f"{len(plain)} spans in {args.docs} documents; text dtype: {text_dtype() or 'unchanged (no pyarrow)'}")
+    for col in plain.columns:
+        print(f"{col:<12} {str(plain[col].dtype):<10} {before[col] / 2**20:8.2f} MiB   "
+              f"{str(compact[col].dtype):<10} {after[col] / 2**20:8.2f} MiB")
+    print(f"{'total':<12} {'':<10} {before.sum() / 2**20:8.2f} MiB   {'':<10} {after.sum() / 2**20:8.2f} MiB"
+          f"   ({after.sum() / before.sum():.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
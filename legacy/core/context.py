@@ -0,0 +1,85 @@
+"""Per-document text views, computed once and shared.
+
+Extractors and helpers used to derive their own full copies of a document:
+``money``, ``dates`` and ``terms`` each ran ``normalize_digits`` over the
+whole text, every keyword index lowercased it again, and ``detect_roles``
+lowercased it once per party. ``DocumentContext.of(text)`` holds those views
+for one text and computes each on first use:
+
+* ``digits``: Arabic-Indic digits mapped to ASCII (``core.utils.normalize_digits``);
+  the text itself when it has none, so views keyed on it are shared too.
+* ``lower``: ``str.lower`` of the text; ``folded``: ``core.scan.fold`` (how
+  ``re.IGNORECASE`` compares).
+* ``lines`` / ``line_starts`` / ``line_of(pos)``: ``splitlines(keepends=True)``
+  and the offset of every line.
+
+Extractors reach the context of the text they are given through
+``BaseExtractor.context(text)``; the attached ``core.scan.DocumentScan`` holds the
+document's.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+
+from core.utils import RecentByIdentity, normalize_digits
+
+
+class DocumentContext:
+    """Lazily computed views of one document text."""
+
+    __slots__ = ("text", "_digits", "_lower", "_folded", "_lines", "_line_starts")
+
+    def __init__(self, text: str):
+        self.text = text
+        self._digits = self._lower = self._folded = self._lines = self._line_starts = None
+
+    @classmethod
+    def of(cls, text: str) -> DocumentContext:
+        """The context of ``text``, shared for the last few texts seen."""
+        return _RECENT(text)
+
+    @property
+    def digits(self) -> str:
+        if self._digits is None:
+            d = normalize_digits(self.text)
+            self._digits = self.text if d == self.text else d
+        return self._digits
+
+    @property
+    def lower(self) -> str:
+        if self._lower is None:
+            self._lower = self.text.lower()
+        return self._lower
+
+    @property
+    def folded(self) -> str:
+        if self._folded is None:
+            from core.scan import fold
+            self._folded = fold(self.text)
+        return self._folded
+
+    @property
+    def lines(self) -> list[str]:
+        if self._lines is None:
+            self._lines = self.text.splitlines(keepends=True)
+        return self._lines
+
+    @property
+    def line_starts(self) -> list[int]:
+        """Start offset of every line in ``lines``, then ``len(text)``."""
+        if self._line_starts is None:
+            out, pos = [0], 0
+            for ln in self.lines:
+                pos += len(ln)
+                out.append(pos)
+            self._line_starts = out
+        return self._line_starts
+
+    def line_of(self, pos: int) -> int:
+        """Index in ``lines`` of the line containing offset ``pos``."""
+        starts = self.line_starts
+        return max(0, min(bisect_right(starts, pos), len(starts) - 1) - 1)
+
+
+# recently used contexts, by identity of their text
+_RECENT = RecentByIdentity(DocumentContext)
@@ -0,0 +1,66 @@
+"""Document text plus sorted page/paragraph start offsets.
+
+Readers build a ``DocumentText``; extractors keep working on the flat
+``.text``, and ``locate`` maps span ``start`` offsets back to 1-based page and
+paragraph numbers in one vectorized ``searchsorted`` call.
+"""
+from __future__ import annotations
+
+import re
+
+import numpy as np
+
+# paragraphs in plain text (TXT/PDF): blocks separated by blank lines
+_PARA_BREAK = re.compile(r"\n[ \t\r\f\v]*\n\s*")
+
+
+def paragraph_starts(text: str) -> list[int]:
+    return [0] + [m.end() for m in _PARA_BREAK.finditer(text or "") if m.end() < len(text)]
+
+
+class DocumentText:
+    """``page_starts``/``para_starts`` are ascending offsets into ``text``.
+
+    ``page_starts`` is None when the format has no pages (TXT/DOCX);
+    ``para_starts`` defaults to blank-line separated blocks of ``text``.
+    """
+
+    __slots__ = ("text", "page_starts", "para_starts")
+
+    def __init__(self, text: str, page_starts=None, para_starts=None):
+        self.text = text or ""
+        self.page_starts = None if page_starts is None else np.asarray(page_starts, dtype=np.int64)
+        if para_starts is None:
+            para_starts = paragraph_starts(self.text)
+        self.para_starts = np.asarray(para_starts, dtype=np.int64)
+
+    def __getstate__(self):
+        return self.text, self.page_starts, self.para_starts
+
+    def __setstate__(self, state):
+        self.text, self.page_starts, self.para_starts = state
+
+    def __len__(self):
+        return len(self.text)
+
+    @property
+    def n_pages(self) -> int | None:
+        return None if self.page_starts is None else len(self.page_starts)
+
+    @staticmethod
+    def _index(starts, offsets, valid):
+        if starts is None or not len(starts):
+            return None
+        # side="right": an offset equal to a start belongs to that block; result is 1-based
+        idx = np.searchsorted(starts, offsets, side="right")
+        return np.where(valid, np.maximum(idx, 1), 0)
+
+    def locate(self, offsets) -> tuple[np.ndarray | None, np.ndarray | None]:
+        """Map offsets to (pages, paras), 1-based int arrays; 0 where the offset is missing.
+
+        Either array is None when the document carries no such boundaries.
+        """
+        off = np.asarray(offsets, dtype="float64")
+        valid = ~np.isnan(off)
+        off = np.where(valid, off, 0).astype(np.int64)
+        return self._index(self.page_starts, off, valid), self._index(self.para_starts, off, valid)
@@ -0,0 +1,137 @@
+"""Per-document keyword-proximity index.
+
+Context classification tests "is any keyword of this set near the match", i.e.
+``any(k in text[a:b].lower() for k in keywords)`` for a window around every
+match: matches × keywords × window work. ``KeywordIndex`` answers the same
+question from the sorted occurrences of the keyword set in the whole text
+(found once with ``str.find``) plus a suffix minimum of their ends, so each
+query is one ``bisect``.
+
+Finding the occurrences costs about one pass over the text per keyword, which
+only pays off for documents with many matches. A keyword set therefore checks
+windows directly until the windows it has scanned add up to the text length,
+then switches to its index; sparse documents never build one.
+
+Answers are identical to the window test on ``text[a:b].lower()``.
+``casefold=True`` compares the way ``re.IGNORECASE`` does instead (see
+``core.scan.fold``). ``str.lower`` changes the length of a text containing
+U+0130 (İ); offsets would not line up, so such texts always use windows.
+"""
+from __future__ import annotations
+
+from bisect import bisect_left
+
+from core.context import DocumentContext
+from core.scan import fold
+
+
+class _KeywordSet:
+    __slots__ = ("keywords", "budget", "starts", "ends", "min_end")
+
+    def __init__(self, keywords, budget):
+        self.keywords = keywords
+        self.budget = budget  # window chars left to scan before indexing
+        self.starts = None
+
+    def index(self, norm):
+        pairs, find = [], norm.find
+        for k in self.keywords:
+            i = find(k)
+            while i >= 0:
+                pairs.append((i, i + len(k)))
+                i = find(k, i + 1)
+        pairs.sort()
+        self.starts = [s for s, _ in pairs]
+        self.ends = [e for _, e in pairs]
+        # min_end[i]: earliest end among occurrences starting at or after starts[i]
+        self.min_end = list(self.ends)
+        for i in range(len(pairs) - 2, -1, -1):
+            if self.min_end[i + 1] < self.min_end[i]:
+                self.min_end[i] = self.min_end[i + 1]
+
+
+class KeywordIndex:
+    def __init__(self, text: str, casefold: bool = False):
+        self.text = text
+        self.casefold = casefold
+        self._case = fold if casefold else str.lower
+        self._norm = None  # case-mapped text, built when the first keyword set is indexed
+        self._sets = {}
+        self._probes = {}
+
+    def _set(self, keywords) -> _KeywordSet:
+        key = tuple(keywords)
+        ks = self._sets.get(key)
+        if ks is None:
+            # window tests compare raw keywords with the lowered window; casefold folds both sides
+            kws = tuple(dict.fromkeys(map(fold, key) if self.casefold else key))
+            ks = self._sets[key] = _KeywordSet(kws, len(self.text))
+        return ks
+
+    def _indexed(self, ks: _KeywordSet, start: int, end: int) -> bool:
+        """Whether ``ks`` answers from its index; otherwise charges the window to its budget."""
+        if ks.starts is not None:
+            return True
+        if ks.budget > 0:
+            ks.budget -= end - start
+            return False
+        if self._norm is None:
+            ctx = DocumentContext.of(self.text)
+            norm = ctx.folded if self.casefold else ctx.lower
+            self._norm = norm if len(norm) == len(self.text) else False
+        if self._norm is False:
+            return False
+        ks.index(self._norm)
+        return True
+
+    def probe(self, keywords):
+        """``f(start, end)`` answering ``within(keywords, start, end)``; bind it once per extract."""
+        f = self._probes.get(tuple(keywords))
+        if f is not None:
+            return f
+        ks, text, case = self._set(keywords), self.text, self._case
+        if "" in ks.keywords:  # an empty keyword is in every window
+            f = lambda start, end: True
+        else:
+            starts = min_end = None
+            n = 0
+
+            def f(start, end):
+                nonlocal starts, min_end, n
+                if start < 0:
+                    start = 0
+                if starts is None:
+                    if not self._indexed(ks, start, end):
+                        ctx = case(text[start:end])
+                        return any(k in ctx for k in ks.keywords)
+                    starts, min_end, n = ks.starts, ks.min_end, len(ks.starts)
+                i = bisect_left(starts, start)
+                return i < n and min_end[i] <= end
+        self._probes[tuple(keywords)] = f
+        return f
+
+    def within(self, keywords, start: int, end: int) -> bool:
+        """``any(k in text[start:end].lower() for k in keywords)``; ``start`` is clamped at 0."""
+        return self.probe(keywords)(start, end)
+
+    def first(self, keywords, start: int, end: int) -> tuple[int, int] | None:
+        """Span of the leftmost keyword occurrence inside ``text[start:end]`` (shortest on ties)."""
+        start = max(0, start)
+        ks = self._set(keywords)
+        if not self._indexed(ks, start, end):
+            # per character keeps offsets even where lower() would expand U+0130
+            window = self.text[start:end]
+            ctx = self._case(window)
+            if len(ctx) != len(window):
+                ctx = "".join(self._case(c)[:1] for c in window)
+            hits = [(ctx.find(k), len(k)) for k in ks.keywords if k and k in ctx]
+            if not hits:
+                return None
+            s, n = min(hits)
+            return start + s, start + s + n
+        i = bisect_left(ks.starts, start)
+        while i < len(ks.starts) and ks.starts[i] < end:
+            if ks.ends[i] <= end:
+                return ks.starts[i], ks.ends[i]
+            i += 1
+        return None
@@ -0,0 +1,82 @@
+"""Bounded scan windows for extractor patterns.
+
+Patterns such as ``\\bmindestlaufzeit\\b.*?\\b(\\d{1,4})\\s*monate?n\\b`` scan from
+every keyword to the end of the text when the closing part never appears:
+quadratic in the document length. ``guard(rx)`` returns the same pattern with
+every unbounded repeat (``*``, ``+``, ``{m,}``) capped at ``MAX_REPEAT``
+characters, so each match attempt reads a bounded window and a whole scan
+stays linear. Matches that fit in the window are unchanged; a keyword and its
+value further apart than that are not one clause anyway.
+
+``BaseExtractor.finditer``/``search`` apply the guard (``scan_window`` on the
+extractor; ``None`` switches it off). Nested repeats (``(a+)+``) can still
+backtrack exponentially inside a window; the parallel extraction mode's time
+budgets (``pipeline.extractor_set``) cover those.
+"""
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+MAX_REPEAT = 1000
+
+_OPEN_RANGE = re.compile(r"\{(\d*),\}")
+
+
+def cap_repeats(pattern: str, limit: int = MAX_REPEAT) -> str:
+    """``pattern`` with ``*``/``+``/``{m,}`` rewritten to ``{0,limit}``/``{1,limit}``/``{m,limit}``."""
+    out, i, n = [], 0, len(pattern)
+    in_class = after_repeat = False
+    while i < n:
+        c = pattern[i]
+        if c == "\\":
+            out.append(pattern[i:i + 2])
+            i += 2
+            after_repeat = False
+            continue
+        if in_class:
+            if c == "]":
+                in_class = False
+            out.append(c)
+            i += 1
+            continue
+        if c == "[":
+            # a "]" right after "[" or "[^" is a literal member
+            j = i + 1 + (pattern[i + 1:i + 2] == "^")
+            j += pattern[j:j + 1] == "]"
+            out.append(pattern[i:j])
+            in_class = True
+            after_repeat = False
+            i = j
+            continue
+        if c in "*+" and not after_repeat:
+            out.append("{0,%d}" % limit if c == "*" else "{1,%d}" % limit)
+            after_repeat = True
+            i += 1
+            continue
+        m = _OPEN_RANGE.match(pattern, i) if not after_repeat else None
+        if m:
+            lo = int(m.group(1) or 0)
+            out.append("{%d,%d}" % (lo, max(lo, limit)))
+            after_repeat = True
+            i = m.end()
+            continue
+        # "?"/"+" right after a repeat are its lazy/possessive suffix
+        after_repeat = c == "?" or (c == "}" and bool(re.search(r"\{\d*(,\d*)?$", "".join(out))))
+        out.append(c)
+        i += 1
+    return "".join(out)
+
+
+@lru_cache(maxsize=None)
+def guard(rx: re.Pattern, limit: int = MAX_REPEAT) -> re.Pattern:
+    """``rx`` with bounded repeats (``rx`` itself when it has none, or for bytes/VERBOSE patterns)."""
+    if isinstance(rx.pattern, bytes) or rx.flags & re.VERBOSE:
+        return rx
+    capped = cap_repeats(rx.pattern, limit)
+    if capped == rx.pattern:
+        return rx
+    try:
+        return re.compile(capped, rx.flags)
+    except re.error:
+        return rx
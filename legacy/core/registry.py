@@ -1,5 +1,7 @@
+import importlib
+import pkgutil
 
-REGISTRY = {"extractors": []}
+REGISTRY = {"extractors": [], "readers": []}
 
 def register_extractor(name: str, version: str):
     def deco(cls):
@@ -8,3 +10,30 @@ def register_extractor(name: str, version: str):
         REGISTRY["extractors"].append(cls)
         return cls
     return deco
+
+def register_reader(name: str, version: str, suffixes=(), priority: int = 0):
+    """Readers are tried by descending ``priority``; the first whose ``sniff`` accepts the input wins."""
+    def deco(cls):
+        cls.__reader_name__ = name
+        cls.__version__ = version
+        cls.suffixes = tuple(s.lower() for s in suffixes)
+        cls.priority = priority
+        REGISTRY["readers"].append(cls)
+        return cls
+    return deco
+
+_extractors_loaded = False
+
+def load_extractors(package: str = "extractors"):
+    """Import every module of the extractors package once, registering them via their decorators.
+
+    Called on first use by the pipeline entry points instead of at import time.
+    """
+    global _extractors_loaded
+    if not _extractors_loaded:
+        pkg = importlib.import_module(package)
+        for _, modname, _ in pkgutil.iter_modules(pkg.__path__):
+            if modname not in ("__init__", "base"):
+                importlib.import_module(f"{package}.{modname}")
+        _extractors_loaded = True
+    return REGISTRY["extractors"]
@@ -0,0 +1,225 @@
+"""Shared single-pass scanning for extractor patterns.
+
+Most extractor patterns start with a keyword (``Anfahrtskosten``, ``Gerichtsstand``,
+``Verfügbarkeit`` …). ``literal_prefixes`` reads the leading literals of a
+pattern from its regex parse tree; ``DocumentScan`` locates the literals of all
+patterns the enabled extractors declare (``BaseExtractor.scan_patterns``) in one
+pre-pass over the document, case-folded for ``re.IGNORECASE`` patterns. An
+extractor's ``self.finditer(rx, text)`` runs ``rx.match`` only at the
+positions where one of its literals occurs, instead of trying the pattern at
+every offset of the text.
+
+Matches are the real ``re.Match`` objects and come out exactly as
+``rx.finditer(text)`` would produce them. Patterns without a usable literal
+prefix (``\\d``-led amounts, dates, e-mails) simply fall back to
+``rx.finditer``.
+"""
+from __future__ import annotations
+
+import heapq
+import re
+from functools import lru_cache
+
+from core.context import DocumentContext
+
+try:  # Python >= 3.11
+    from re import _parser as _sre_parse, _constants as _sre_c
+    from re._casefix import _EXTRA_CASES as _CASE_FIXES
+except ImportError:  # pragma: no cover - older interpreters
+    import sre_parse as _sre_parse, sre_constants as _sre_c
+    from sre_compile import _ignorecase_fixes as _CASE_FIXES
+
+# leading literals are cut to this length; shorter ones are too frequent to help
+PREFIX_MAX = 4
+PREFIX_MIN = 2
+MAX_LITERALS = 32
+
+# re.IGNORECASE treats these groups as equal on top of simple lowercasing (ſ/s, ı/i, µ/μ, σ/ς …)
+_FOLD_TABLE = {k: min((k, *v)) for k, v in _CASE_FIXES.items()}
+# str.translate walks every character through the dict (slow on Arabic text); these are rare
+_FOLD_RX = re.compile("[%s]" % "".join(chr(k) for k, v in _FOLD_TABLE.items() if k != v))
+
+
+def _fold_char(m):
+    return chr(_FOLD_TABLE[ord(m.group())])
+
+
+def fold(s: str) -> str:
+    """Case-fold the way ``re.IGNORECASE`` compares characters; length-preserving."""
+    # U+0130's full lowercase is two code points; re uses the simple mapping "i"
+    return _FOLD_RX.sub(_fold_char, s.replace("İ", "i").lower())
+
+
+def _lead(items):
+    """Set of strings every match of ``items`` starts with, or None if unknown."""
+    if not items:
+        return {""}
+    op, av = items[0]
+    rest = items[1:]
+    if op is _sre_c.LITERAL or op is _sre_c.IN:
+        if op is _sre_c.LITERAL:
+            chars = [chr(av)]
+        else:
+            if any(o is not _sre_c.LITERAL for o, _ in av):
+                return None
+            chars = [chr(a) for _, a in av]
+        tail = _lead(rest)
+        if tail is None:
+            return set(chars)
+        return {(c + s)[:PREFIX_MAX] for c in chars for s in tail}
+    if op in (_sre_c.AT, _sre_c.ASSERT, _sre_c.ASSERT_NOT):
+        return _lead(rest)  # zero-width
+    if op is _sre_c.SUBPATTERN:
+        _, add_flags, del_flags, sub = av
+        if add_flags or del_flags:
+            return None
+        return _lead(list(sub.data) + rest)
+    if op is _sre_c.BRANCH:
+        out = set()
+        for alt in av[1]:
+            r = _lead(list(alt.data) + rest)
+            if r is None:
+                return None
+            out |= r
+        return out
+    if op in (_sre_c.MAX_REPEAT, _sre_c.MIN_REPEAT):
+        lo, _, item = av
+        r = _lead(list(item.data))
+        if r is None:
+            return None
+        if lo == 0:
+            r2 = _lead(rest)
+            return None if r2 is None else r | r2
+        return r
+    return None
+
+
+@lru_cache(maxsize=None)
+def literal_prefixes(rx: re.Pattern) -> tuple[str, ...] | None:
+    """Leading literals of ``rx`` (case-folded for IGNORECASE patterns), or None if it must be scanned."""
+    if rx.flags & (re.ASCII | re.LOCALE | re.VERBOSE) or isinstance(rx.pattern, bytes):
+        return None
+    try:
+        lits = _lead(list(_sre_parse.parse(rx.pattern, rx.flags).data))
+    except Exception:
+        return None
+    if not lits or len(lits) > MAX_LITERALS or min(map(len, lits)) < PREFIX_MIN:
+        return None
+    if rx.flags & re.IGNORECASE:
+        lits = {fold(s) for s in lits}
+    return tuple(sorted(lits))
+
+
+class _View:
+    """Literal hit lists for one text (the raw document or e.g. its digit-normalized copy)."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self._folded = None
+        self._hits = {}
+        self._keywords = {}
+
+    @property
+    def folded(self):
+        if self._folded is None:
+            f = DocumentContext.of(self.text).folded
+            # a length change would shift offsets; IGNORECASE patterns then scan normally
+            self._folded = f if len(f) == len(self.text) else False
+        return self._folded
+
+    def hits(self, lit: str, folded: bool) -> list[int]:
+        key = (lit, folded)
+        out = self._hits.get(key)
+        if out is None:
+            s = self.folded if folded else self.text
+            out, find = [], s.find
+            i = find(lit)
+            while i >= 0:
+                out.append(i)
+                i = find(lit, i + 1)
+            self._hits[key] = out
+        return out
+
+
+class DocumentScan:
+    """Per-document scan state; extractors reach it through ``BaseExtractor.finditer``."""
+
+    def __init__(self, text: str, patterns=()):
+        self.text = text
+        self.context = DocumentContext.of(text)
+        self._views = {}
+        self.prepare(patterns, text)
+
+    def attach(self, ext):
+        """Index ``ext.scan_patterns()`` and let ``ext.finditer`` use this scan."""
+        if hasattr(ext, "scan_patterns"):  # duck-typed extractors without BaseExtractor just run
+            self.prepare(ext.scan_patterns(), self.text)
+            ext._scan = self
+        return ext
+
+    def view(self, text: str) -> _View:
+        hit = self._views.get(id(text))
+        if hit is not None and hit[0] is text:
+            return hit[1]
+        # an equal copy (e.g. a digit-normalized text made outside ``DocumentContext``) shares the view
+        for v in {id(v): v for _, v in self._views.values()}.values():
+            if v.text == text:
+                break
+        else:
+            v = _View(text)
+        # keep ``text`` referenced so its id cannot be reused while cached
+        self._views[id(text)] = (text, v)
+        return v
+
+    def keywords(self, text: str, casefold: bool = False):
+        """The ``core.keywords.KeywordIndex`` of ``text``, shared by all attached extractors."""
+        v = self.view(text)
+        kw = v._keywords.get(casefold)
+        if kw is None:
+            from core.keywords import KeywordIndex
+            kw = v._keywords[casefold] = KeywordIndex(v.text, casefold)
+        return kw
+
+    def prepare(self, patterns, text: str):
+        """Pre-pass: locate the literals of all ``patterns`` in ``text`` at once."""
+        v = self.view(text)
+        for rx in patterns:
+            lits = literal_prefixes(rx)
+            if lits and (not rx.flags & re.IGNORECASE or v.folded):
+                for lit in lits:
+                    v.hits(lit, bool(rx.flags & re.IGNORECASE))
+
+    def finditer(self, rx: re.Pattern, text: str):
+        """Same matches as ``rx.finditer(text)``."""
+        lits = literal_prefixes(rx)
+        if not lits:
+            return rx.finditer(text)
+        v = self.view(text)
+        ic = bool(rx.flags & re.IGNORECASE)
+        if ic and not v.folded:
+            return rx.finditer(text)
+        return self._matches(rx, v.text, [v.hits(lit, ic) for lit in lits])
+
+    @staticmethod
+    def _matches(rx, text, hit_lists):
+        match = rx.match
+        nxt = 0
+        positions = hit_lists[0] if len(hit_lists) == 1 else heapq.merge(*hit_lists)
+        for pos in positions:
+            # like finditer: the next match starts at or after the end of the previous one;
+            # prefixes are non-empty, so matches are never empty
+            if pos < nxt:
+                continue
+            m = match(text, pos)
+            if m is not None:
+                nxt = m.end()
+                yield m
+
+
+def attach_scan(extractors, text: str) -> DocumentScan:
+    """One ``DocumentScan`` for ``text`` shared by ``extractors`` (instances), with all their
+    declared patterns indexed up front."""
+    scan = DocumentScan(text)
+    for ext in extractors:
+        scan.attach(ext)
+    return scan
@@ -0,0 +1,124 @@
+"""Per-document index of section headings.
+
+``SectionIndex.of(text)`` finds every ``§ N Title`` heading and every line-leading
+``N. Title`` / ``N) Title`` / ``N Title`` heading of a document in two scans, once;
+the normalizer, the section extractors, the UI and ``summarize_keyfacts`` look
+sections up in it instead of each searching the whole text with their own
+header regexes. Lookups keep the boundaries those searches produced:
+
+* ``paragraph(num)``: from the first ``§ num`` heading to the next ``§`` heading
+  that starts a line (``pipeline.normalize``).
+* ``span(num)``: from the first ``§ num Title`` or line-leading ``num. Title``
+  with a title from ``SECTION_TITLES`` to the next such heading of a later
+  section (service contract extractor, UI).
+
+The index behaves like the ``{"1": text, …}`` mapping ``summarize_keyfacts`` takes.
+"""
+from __future__ import annotations
+
+import re
+from typing import NamedTuple
+
+from core.utils import RecentByIdentity
+
+# service-contract layout: section number -> accepted title words (prefixes, case-insensitive)
+SECTION_TITLES = {
+    1: ("Vertragsgegenstand",),
+    2: ("Pflichten", "Leistungsumfang"),
+    3: ("Vergütung", "Verguetung", "Zahlung"),
+    4: ("Vertragsdauer", "Laufzeit", "Kündigung", "Kuendigung"),
+}
+
+_PARAGRAPH = re.compile(r"§\s*(\d+)\s+(\w+)")
+_NUMBERED = re.compile(r"^\s*(\d+)([.)]?)\s+(\w+)", re.M)
+
+
+class Heading(NamedTuple):
+    num: str
+    title: str
+    marker: str  # "§" for paragraph headings, else "." / ")" / "" after the number
+    start: int  # where the heading's match starts (a line start for numbered headings)
+    end: int  # end of the title word
+    ws: int  # start of the whitespace run before the number or "§"
+    tok: int  # position of the number or "§"
+
+
+def _ws_start(text: str, i: int) -> int:
+    while i and text[i - 1].isspace():
+        i -= 1
+    return i
+
+
+class SectionIndex:
+    """Headings of one text, in order of position."""
+
+    def __init__(self, text: str):
+        self.text = text = text or ""
+        heads = [Heading(m.group(1), m.group(2), "§", m.start(), m.end(), _ws_start(text, m.start()), m.start())
+                 for m in _PARAGRAPH.finditer(text)]
+        heads += [Heading(m.group(1), m.group(3), m.group(2), m.start(), m.end(), _ws_start(text, m.start(1)), m.start(1))
+                  for m in _NUMBERED.finditer(text)]
+        heads.sort(key=lambda h: (h.start, h.marker != "§"))
+        self.headings = heads
+
+    @classmethod
+    def of(cls, text: str) -> SectionIndex:
+        """The index of ``text``, built once for the last few texts seen."""
+        return _RECENT(text)
+
+    def first(self, num, titles=(), paragraph: bool = True, numbered: bool = True, after: int = 0) -> Heading | None:
+        """First heading numbered ``num`` starting at or after ``after`` whose title starts with one of ``titles``."""
+        num, titles = str(num), tuple(t.lower() for t in titles)
+        for h in self.headings:
+            if h.start < after or h.num != num or not (paragraph if h.marker == "§" else numbered):
+                continue
+            if not titles or h.title.lower().startswith(titles):
+                return h
+        return None
+
+    def line_break(self, h: Heading, chars: str = "\n") -> int:
+        """Position of the first of ``chars`` in the whitespace before ``h``, or -1."""
+        found = [p for p in (self.text.find(c, h.ws, h.tok) for c in chars) if p >= 0]
+        return min(found) if found else -1
+
+    def paragraph(self, num) -> tuple[int, int] | None:
+        """``(start, end)`` of ``§ num``: up to the line break before the next line-leading ``§`` heading."""
+        h = self.first(num, numbered=False)
+        if h is None:
+            return None
+        text = self.text
+        end = len(text) - 1 if text.endswith("\n") and len(text) - 1 >= h.end else len(text)
+        for nxt in self.headings:
+            if nxt.marker == "§" and nxt.start > h.start:
+                p = self.line_break(nxt)
+                if p >= h.end:
+                    end = min(end, p)
+                    break
+        return h.start, end
+
+    def section(self, num) -> str | None:
+        """Text of ``paragraph(num)``."""
+        span = self.paragraph(num)
+        return None if span is None else self.text[span[0]:span[1]]
+
+    def span(self, num, titles: dict = SECTION_TITLES) -> tuple[int, int] | None:
+        """``(start, end)`` of section ``num`` of ``titles``: up to the first heading of any later section."""
+        h = self.first(num, titles.get(num, ()))
+        if h is None:
+            return None
+        end = len(self.text)
+        for n, ts in titles.items():
+            if n > num:
+                nxt = self.first(n, ts, after=h.end)
+                if nxt is not None:
+                    end = min(end, nxt.start)
+        return h.start, end
+
+    def get(self, key, default=None):
+        """``section(key)`` or ``default``, as on a ``{"1": text}`` mapping."""
+        text = self.section(key)
+        return default if text is None else text
+
+
+# recently indexed texts, by identity
+_RECENT = RecentByIdentity(SectionIndex)
@@ -0,0 +1,195 @@
+"""Spans frame indexed by ``(type, subtype)``.
+
+The summaries (``pipeline.summarize``, the ``_enrich_summary_*`` helpers of
+``pipeline.runner_api``) and most compliance rules (``rules.engine``) look spans
+up by subtype, each with its own ``df[df["subtype"] == x]`` scan of the whole
+frame. ``SpanFrame`` groups the row positions by ``(type, subtype)`` once (a
+pandas groupby) and answers every lookup from that index:
+
+* ``rows(type, subtype)``: the same rows, in the same order and with the same
+  index, as the boolean-mask selection; ``None`` leaves a column unfiltered.
+* ``exists``, ``first``, ``first_row``, ``values`` and ``span_ids`` on top.
+
+The index is built on the first lookup, so a frame without ``type``/``subtype``
+columns fails there (``KeyError``), like the mask it replaces. Build one per
+spans frame and pass it around; functions taking a spans frame accept either
+(``SpanFrame.of``).
+
+The module also holds the spans frame schema (``span_dtypes``). Repeated labels
+(``type``, ``subtype``, ``extractor`` …) are categories; text is a string
+column, Arrow-backed when pyarrow is installed; offsets are nullable integers.
+``concat_spans`` keeps that schema across documents.
+"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+_NO_ROWS = np.empty(0, dtype=np.intp)
+
+# spans frame schema, see span_dtypes
+CATEGORY_COLUMNS = ("doc_id", "type", "subtype", "currency", "unit", "extractor", "version")
+TEXT_COLUMNS = ("text_raw", "value_norm")
+INT_COLUMNS = ("page", "para", "start", "end")
+_text_dtype = False  # not looked up yet
+
+
+class SpanFrame:
+    """A spans ``DataFrame`` (``df``; may be None) with row positions grouped by ``(type, subtype)``."""
+
+    def __init__(self, df: pd.DataFrame | None):
+        self.df = df
+        self._pairs = None
+        self._by_type = {}
+        self._by_subtype = {}
+
+    @classmethod
+    def of(cls, spans) -> SpanFrame:
+        """``spans`` itself if it is a ``SpanFrame``, else a new one around the frame."""
+        return spans if isinstance(spans, SpanFrame) else cls(spans)
+
+    @property
+    def empty(self) -> bool:
+        return self.df is None or self.df.empty
+
+    def __len__(self) -> int:
+        return 0 if self.df is None else len(self.df)
+
+    def _index(self) -> dict:
+        if self._pairs is None:
+            df = self.df
+            if df is None or df.empty:
+                self._pairs = {}
+            else:
+                groups = df.groupby([df["type"], df["subtype"]], sort=False, observed=True, dropna=False).indices
+                self._pairs = {k: np.asarray(v, dtype=np.intp) for k, v in groups.items()}
+        return self._pairs
+
+    def _positions(self, type=None, subtype=None) -> np.ndarray | None:
+        """Row positions of ``(type, subtype)``; None for "all rows"."""
+        pairs = self._index()
+        if type is None and subtype is None:
+            return None
+        if type is not None and subtype is not None:
+            return pairs.get((type, subtype), _NO_ROWS)
+        cache, slot = (self._by_type, 0) if subtype is None else (self._by_subtype, 1)
+        key = type if subtype is None else subtype
+        pos = cache.get(key)
+        if pos is None:
+            parts = [v for k, v in pairs.items() if k[slot] == key]
+            pos = cache[key] = np.sort(np.concatenate(parts)) if parts else _NO_ROWS
+        return pos
+
+    def rows(self, type=None, subtype=None) -> pd.DataFrame:
+        """``df[(df["type"] == type) & (df["subtype"] == subtype)]``; an empty frame when ``df`` is None."""
+        if self.df is None:
+            return pd.DataFrame()
+        pos = self._positions(type, subtype)
+        return self.df if pos is None else self.df.iloc[pos]
+
+    def exists(self, type=None, subtype=None) -> bool:
+        if self.empty:
+            return False
+        pos = self._positions(type, subtype)
+        return pos is None or len(pos) > 0
+
+    def first_row(self, subtype=None, type=None) -> pd.Series | None:
+        """First matching row, or None."""
+        if self.empty:
+            return None
+        pos = self._positions(type, subtype)
+        if pos is not None and not len(pos):
+            return None
+        return self.df.iloc[0 if pos is None else pos[0]]
+
+    def first(self, subtype=None, col: str = "value_norm", type=None, default=None):
+        """``col`` of the first matching row (missing values included), or ``default`` when no row matches."""
+        if self.empty:
+            return default
+        pos = self._positions(type, subtype)
+        if pos is not None and not len(pos):
+            return default
+        return self.df[col].iloc[0 if pos is None else int(pos[0])]
+
+    def values(self, subtype=None, col: str = "value_norm", type=None) -> list:
+        """Non-missing ``col`` values of the matching rows, in frame order."""
+        if self.empty:
+            return []
+        return self.rows(type, subtype)[col].dropna().tolist()
+
+    def span_ids(self, subtype=None, n: int = 5, type=None) -> list[str]:
+        """``span_id``s (else index labels) of the first ``n`` matching rows."""
+        return span_ids(self.rows(type, subtype), n)
+
+
+def span_ids(df: pd.DataFrame | None, n: int = 5) -> list[str]:
+    """``span_id``s (else index labels) of the first ``n`` rows of ``df``."""
+    if df is None or len(df) == 0:
+        return []
+    if "span_id" in df.columns:
+        return [str(x) for x in df["span_id"].head(n).tolist()]
+    return [str(i) for i in df.index.astype(str).tolist()[:n]]
+
+
+def text_dtype():
+    """Arrow-backed string dtype with NaN for missing values, or None without pyarrow."""
+    global _text_dtype
+    if _text_dtype is False:
+        try:
+            import pyarrow  # noqa: F401
+        except ImportError:
+            _text_dtype = None
+        else:
+            try:
+                _text_dtype = pd.StringDtype("pyarrow", na_value=np.nan)
+            except TypeError:  # pandas < 2.3
+                _text_dtype = pd.StringDtype("pyarrow_numpy")
+    return _text_dtype
+
+
+def span_dtypes(df: pd.DataFrame | None) -> pd.DataFrame | None:
+    """``df`` with the spans schema applied, column by column and in place.
+
+    ``CATEGORY_COLUMNS`` become categorical. ``TEXT_COLUMNS`` holding only
+    strings get ``text_dtype()``, if there is one. ``INT_COLUMNS`` become
+    ``Int64``. A column that cannot take its dtype keeps the one it has.
+    """
+    if df is None or df.empty:
+        return df
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype("category")
+    text = text_dtype()
+    for col in TEXT_COLUMNS if text is not None else ():
+        if col in df.columns and df[col].dtype != text and pd.api.types.infer_dtype(df[col], skipna=True) in ("string", "empty"):
+            df[col] = df[col].astype(text)
+    for col in INT_COLUMNS:
+        if col in df.columns and df[col].dtype != "Int64":
+            try:
+                df[col] = pd.to_numeric(df[col]).astype("Int64")
+            except (TypeError, ValueError):
+                pass
+    return df
+
+
+def add_categories(df: pd.DataFrame, col: str, values) -> None:
+    """Make ``values`` categories of ``df[col]`` if it is categorical, so they can be assigned to its rows."""
+    s = df[col]
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        new = [v for v in values if v not in s.cat.categories]
+        if new:
+            df[col] = s.cat.add_categories(new)
+
+
+def concat_spans(frames) -> pd.DataFrame:
+    """``pd.concat(frames, ignore_index=True)`` in the spans schema.
+
+    ``pd.concat`` turns a categorical column into ``object`` when the frames'
+    categories differ, so each category column is first given the union of them.
+    """
+    frames = [span_dtypes(f.copy(deep=False)) for f in frames]
+    for col in CATEGORY_COLUMNS:
+        if len(frames) > 1 and all(col in f.columns for f in frames):
+            cats = pd.unique(np.concatenate([np.asarray(f[col].cat.categories, dtype=object) for f in frames]))
+            frames = [f.assign(**{col: f[col].cat.set_categories(cats)}) for f in frames]
+    return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,155 @@
+"""Columnar span storage for extractor output.
+
+An extractor with thousands of matches (amounts, dates, durations) used to build
+one validated pydantic ``ExtractItem`` per match, and the writer then turned
+each object back into a dict before building the spans DataFrame.
+``SpanBuffer`` keeps one list per ``ExtractItem`` field instead: ``add`` appends
+a row without creating an object, ``validate`` checks all rows at once, and
+``to_columns(batches)`` joins the buffers of a document into the columns of
+the spans frame in one step (``io_ops.writers.batches_to_df``).
+
+A buffer answers like the ``ExtractBatch`` it replaces (``doc_id``, ``items``,
+``model_dump()``); ``batch()`` builds the real one. Extractors may return
+either, and ``to_columns`` accepts both.
+"""
+from __future__ import annotations
+
+import sys
+from typing import get_args
+
+from core.schemas import ExtractBatch, ExtractItem, ItemType
+
+FIELDS = tuple(ExtractItem.model_fields)
+# spans frame column -> ExtractItem field (doc_id comes from the batch)
+FRAME_COLUMNS = {"doc_id": None, "type": "item_type", **{f: f for f in FIELDS if f != "item_type"}}
+
+_ITEM_TYPES = frozenset(get_args(ItemType))
+_STR = ("text_raw", "extractor", "version")
+_OPTIONAL_STR = ("subtype", "value_norm", "currency", "unit")
+_OPTIONAL_INT = ("page", "para", "start", "end")
+_intern = sys.intern
+
+
+class SpanBuffer:
+    """Spans of one document, one list per ``ExtractItem`` field.
+
+    ``extractor``/``version`` given here fill those fields of every added row.
+    Short, repetitive strings (``item_type``, ``subtype``, ``currency``,
+    ``unit``) are interned, so a column of 10 000 ``"duration_days"`` holds one
+    string.
+    """
+
+    __slots__ = ("doc_id", "_extractor", "_version") + FIELDS
+
+    def __init__(self, doc_id: str, extractor: str = "", version: str = ""):
+        self.doc_id = doc_id
+        self._extractor = extractor
+        self._version = version
+        for f in FIELDS:
+            setattr(self, f, [])
+
+    def add(self, item_type: str, text_raw: str, subtype: str | None = None, value_norm: str | None = None,
+            currency: str | None = None, unit: str | None = None, start: int | None = None, end: int | None = None,
+            page: int | None = None, para: int | None = None, confidence: float = 1.0) -> None:
+        """Append one span; the fields of ``ExtractItem``, checked by ``validate``."""
+        self.item_type.append(_intern(item_type))
+        self.subtype.append(subtype if subtype is None else _intern(subtype))
+        self.text_raw.append(text_raw)
+        self.value_norm.append(value_norm)
+        self.currency.append(currency if currency is None else _intern(currency))
+        self.unit.append(unit if unit is None else _intern(unit))
+        self.page.append(page)
+        self.para.append(para)
+        self.start.append(start)
+        self.end.append(end)
+        self.confidence.append(confidence)
+        self.extractor.append(self._extractor)
+        self.version.append(self._version)
+
+    def extend(self, other) -> None:
+        """Append the rows of another buffer or ``ExtractBatch`` (or an iterable of ``ExtractItem``)."""
+        if isinstance(other, ExtractBatch):
+            other = other.items
+        if isinstance(other, SpanBuffer):
+            for f in FIELDS:
+                getattr(self, f).extend(getattr(other, f))
+            return
+        for it in other:
+            for f in FIELDS:
+                getattr(self, f).append(getattr(it, f))
+
+    def __len__(self) -> int:
+        return len(self.text_raw)
+
+    def validate(self) -> SpanBuffer:
+        """Check every row against the ``ExtractItem`` schema at once; ``ValueError`` names the first bad row."""
+        n = len(self)
+        if any(len(getattr(self, f)) != n for f in FIELDS):
+            raise ValueError("SpanBuffer columns differ in length")
+
+        def fail(field, i, value):
+            raise ValueError(f"{type(self).__name__} row {i}: invalid {field} {value!r}")
+
+        for i, v in enumerate(self.item_type):
+            if v not in _ITEM_TYPES:
+                fail("item_type", i, v)
+        for f in _STR:
+            for i, v in enumerate(getattr(self, f)):
+                if type(v) is not str:
+                    fail(f, i, v)
+        for f in _OPTIONAL_STR:
+            for i, v in enumerate(getattr(self, f)):
+                if v is not None and type(v) is not str:
+                    fail(f, i, v)
+        for f in _OPTIONAL_INT:
+            for i, v in enumerate(getattr(self, f)):
+                if v is not None and (type(v) is not int):
+                    fail(f, i, v)
+        conf = self.confidence
+        if not all(type(v) is float for v in conf):
+            for i, v in enumerate(conf):
+                if type(v) is not float:
+                    try:
+                        conf[i] = float(v)
+                    except (TypeError, ValueError):
+                        fail("confidence", i, v)
+        return self
+
+    def rows(self):
+        """One ``{field: value}`` dict per span."""
+        cols = [getattr(self, f) for f in FIELDS]
+        return [dict(zip(FIELDS, r)) for r in zip(*cols)]
+
+    # --- ExtractBatch compatibility ---
+    @property
+    def items(self) -> list[ExtractItem]:
+        """The spans as (unvalidated) ``ExtractItem`` objects; see ``validate``."""
+        return [ExtractItem.model_construct(**r) for r in self.rows()]
+
+    def batch(self) -> ExtractBatch:
+        return ExtractBatch.model_construct(doc_id=self.doc_id, items=self.items)
+
+    def model_dump(self) -> dict:
+        return {"doc_id": self.doc_id, "items": self.rows()}
+
+    def __getstate__(self):
+        return {s: getattr(self, s) for s in self.__slots__}
+
+    def __setstate__(self, state):
+        for k, v in state.items():
+            setattr(self, k, v)
+
+
+def to_columns(batches) -> dict[str, list]:
+    """Spans frame columns (``FRAME_COLUMNS``) of ``SpanBuffer``s and ``ExtractBatch``es, in order."""
+    cols = {c: [] for c in FRAME_COLUMNS}
+    for b in batches:
+        buf = b if isinstance(b, SpanBuffer) else None
+        if buf is None:
+            buf = SpanBuffer(b.doc_id)
+            buf.extend(b.items)
+        cols["doc_id"].extend([buf.doc_id] * len(buf))
+        for c, f in FRAME_COLUMNS.items():
+            if f is not None:
+                cols[c].extend(getattr(buf, f))
+    return cols
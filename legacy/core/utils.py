@@ -1,3 +1,5 @@
+import threading
+
 
 AR_NUMS = "٠١٢٣٤٥٦٧٨٩"
 EN_NUMS = "0123456789"
@@ -22,3 +24,44 @@ MONTHS_DE = {
     "november":"11","nov.":"11","nov":"11",
     "dezember":"12","dez.":"12","dez":"12"
 }
+
+
+class RecentByIdentity:
+    """``build(obj)`` for the last ``maxsize`` objects used, looked up by identity.
+
+    Safe to share between threads (Streamlit sessions): the table is only
+    touched under a lock, and ``build`` runs outside it. The object is kept
+    referenced while cached, so its ``id`` cannot be reused for another one.
+    """
+
+    def __init__(self, build, maxsize: int = 8):
+        self._build = build
+        self._maxsize = maxsize
+        self._items: dict[int, tuple[object, object]] = {}
+        self._lock = threading.Lock()
+
+    def _get(self, obj):
+        hit = self._items.pop(id(obj), None)
+        if hit is None or hit[0] is not obj:
+            return None
+        self._items[id(obj)] = hit  # most recently used last
+        return hit[1]
+
+    def __call__(self, obj):
+        with self._lock:
+            value = self._get(obj)
+        if value is not None:
+            return value
+        built = self._build(obj)
+        with self._lock:
+            value = self._get(obj)  # another thread may have built it meanwhile
+            if value is not None:
+                return value
+            while len(self._items) >= self._maxsize:
+                del self._items[next(iter(self._items))]
+            self._items[id(obj)] = (obj, built)
+        return built
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
@@ -0,0 +1,99 @@
+"""German numbers and dates of span values, parsed a column at a time.
+
+``value_norm`` holds what the extractors and ``normalize_spans`` wrote: text
+such as ``"1.200,50"``, ``"19 %"``, ``"01.02.2024"`` or ``"2024-02-01"``, and
+the odd number. ``typed_values`` parses the whole column once and adds
+
+* ``value_num`` (float64): the digits, ``.`` and ``,`` of the value. With both
+  separators the dot groups thousands (``"1.200,50"`` → 1200.5); a lone comma is
+  the decimal point (``"19,5"`` → 19.5), a lone dot too (``"1.200"`` → 1.2).
+* ``value_date`` (datetime64): ``YYYY-MM-DD``, ``D.M.YYYY`` or ``D/M/YYYY``,
+  a two-digit year being 20YY. Anything else, or no such day, is NaT.
+
+Rules and summaries read those columns through ``value_nums`` and
+``value_dates``, which parse a frame without them (one built by hand) on the fly. ``parse_numbers`` and ``parse_dates`` work on any
+column; ``iso_date`` is the scalar date normalizer of the extractors.
+"""
+from __future__ import annotations
+
+import re
+
+import numpy as np
+import pandas as pd
+
+_NOT_NUMBER = r"[^0-9.,]"
+_ISO = r"^(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})$"
+_DMY = r"^(?P<day>\d{1,2})(?P<sep>[./])(?P<month>\d{1,2})(?P=sep)(?P<year>\d{2,4})$"
+_DATE_LIKE = r"^\d{1,4}[-./]\d{1,2}[-./]\d{2,4}$"
+_DMY_RE = re.compile(_DMY)
+_ISO_RE = re.compile(_ISO)
+
+
+def _each_distinct(values: pd.Series, parse, missing) -> pd.Series:
+    """``parse`` run on the distinct non-missing ``values`` only, spread back; ``missing`` for the rest."""
+    codes, uniques = pd.factorize(values)
+    parsed = parse(pd.Series(uniques, dtype=values.dtype if len(uniques) else object)).to_numpy()
+    out = np.append(parsed, np.array([missing], dtype=parsed.dtype))[codes]  # code -1 picks ``missing``
+    return pd.Series(out, index=values.index, name=values.name)
+
+
+def _numbers(s: pd.Series) -> pd.Series:
+    n, s = len(s), s.astype(str)
+    s = s[s.str.contains(r"\d", na=False)]  # the rest has no number; the string steps below are the cost
+    s = s.str.replace(_NOT_NUMBER, "", regex=True)
+    dot, comma = s.str.contains(".", regex=False), s.str.contains(",", regex=False)
+    s = s.where(~(dot & comma), s.str.replace(".", "", regex=False))
+    s = s.str.replace(",", ".", regex=False)
+    return pd.to_numeric(s, errors="coerce").astype("float64").reindex(range(n))
+
+
+def _dates(s: pd.Series) -> pd.Series:
+    n, s = len(s), s.astype(str).str.strip()
+    s = s[s.str.match(_DATE_LIKE, na=False)]  # a cheap match first, the extracts are the cost
+    iso, dmy = s.str.extract(_ISO), s.str.extract(_DMY)
+    dmy["year"] = dmy["year"].where(dmy["year"].str.len() != 2, "20" + dmy["year"])
+    y, m, d = (iso[col].fillna(dmy[col]).str.zfill(w) for col, w in (("year", 4), ("month", 2), ("day", 2)))
+    dates = pd.to_datetime(y + "-" + m + "-" + d, format="%Y-%m-%d", errors="coerce").astype("datetime64[s]")
+    return dates.where(dates.dt.year > 0).reindex(range(n))  # no year 0 in ``datetime``
+
+
+def parse_numbers(values: pd.Series) -> pd.Series:
+    """``values`` (any dtype; non-strings as ``str``) as float64, NaN where no number is found."""
+    return _each_distinct(values, _numbers, np.nan)
+
+
+def parse_dates(values: pd.Series) -> pd.Series:
+    """``values`` (stripped) as datetime64, NaT where they are not an ISO or German date."""
+    return _each_distinct(values, _dates, np.datetime64("NaT", "s"))
+
+
+def typed_values(df: pd.DataFrame | None) -> pd.DataFrame | None:
+    """``df`` with ``value_num`` and ``value_date`` parsed from ``value_norm``, in place."""
+    if df is None or df.empty or "value_norm" not in df.columns:
+        return df
+    df["value_num"] = parse_numbers(df["value_norm"])
+    df["value_date"] = parse_dates(df["value_norm"])
+    return df
+
+
+def value_nums(rows: pd.DataFrame) -> pd.Series:
+    """``value_num`` of spans ``rows``, parsed from ``value_norm`` when the column is missing."""
+    return rows["value_num"] if "value_num" in rows.columns else parse_numbers(rows["value_norm"])
+
+
+def value_dates(rows: pd.DataFrame) -> pd.Series:
+    """``value_date`` of spans ``rows``, parsed from ``value_norm`` when the column is missing."""
+    return rows["value_date"] if "value_date" in rows.columns else parse_dates(rows["value_norm"])
+
+
+def iso_date(s: str | None) -> str | None:
+    """``YYYY-MM-DD`` of a German ``D.M.YYYY`` / ``D/M/YYYY`` date; other text unchanged, None for empty."""
+    if not s:
+        return None
+    if _ISO_RE.match(s):
+        return s
+    m = _DMY_RE.match(s)
+    if not m:
+        return s
+    y = int(m["year"])
+    return f"{y + 2000 if y < 100 else y:04d}-{int(m['month']):02d}-{int(m['day']):02d}"
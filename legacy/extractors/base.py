@@ -1,8 +1,62 @@
-
+import re
+from core.context import DocumentContext
+from core.regex_guard import MAX_REPEAT, guard
 from core.schemas import ExtractBatch
+from core.spans import SpanBuffer
 
 class BaseExtractor:
     name = "base"
     version = "0.0.1"
+    # core.scan.DocumentScan of the current document, attached by the pipeline
+    _scan = None
+    # longest run any unbounded repeat may scan (core.regex_guard); None scans unbounded
+    scan_window = MAX_REPEAT
+    # chars of context any span depends on (longest match plus keyword window): with a
+    # margin, a revised document is re-extracted only around its changes
+    # (pipeline.incremental); None means spans may depend on the whole text
+    context_margin = None
+
+    @classmethod
+    def data_digest(cls) -> str:
+        """Digest of data files the extractor reads (e.g. a lexicon); part of result cache keys."""
+        return ""
+
+    def scan_patterns(self) -> list:
+        """Compiled ``rx*`` class attributes; the shared document scan indexes their leading keywords."""
+        cls = type(self)
+        return [getattr(cls, k) for k in dir(cls) if k.startswith("rx") and isinstance(getattr(cls, k), re.Pattern)]
+
+    def finditer(self, rx, text):
+        """Same matches as ``rx.finditer(text)`` within ``scan_window``, served by the shared scan when one is attached."""
+        if self.scan_window:
+            rx = guard(rx, self.scan_window)
+        if self._scan is None:
+            return rx.finditer(text)
+        return self._scan.finditer(rx, text)
+
+    def search(self, rx, text):
+        return next(iter(self.finditer(rx, text)), None)
+
+    def keyword_index(self, text, casefold=False):
+        """``core.keywords.KeywordIndex`` of ``text``: the shared one when a scan is attached,
+        otherwise built once per text for this instance."""
+        if self._scan is not None:
+            return self._scan.keywords(text, casefold)
+        kw = self.__dict__.get("_keywords")
+        if kw is None or kw.text is not text or kw.casefold != casefold:
+            from core.keywords import KeywordIndex
+            kw = self._keywords = KeywordIndex(text, casefold)
+        return kw
+
+    def context(self, text) -> DocumentContext:
+        """``core.context.DocumentContext`` of ``text`` (digit-normalized, lowered, line views), shared per document."""
+        if self._scan is not None and self._scan.text is text:
+            return self._scan.context
+        return DocumentContext.of(text)
+
+    def spans(self, doc_id: str) -> SpanBuffer:
+        """Empty ``SpanBuffer`` for ``doc_id`` whose rows carry this extractor's name and version."""
+        return SpanBuffer(doc_id, type(self).__name__, getattr(self, "__version__", self.version))
+
     def extract(self, doc_id: str, text: str) -> ExtractBatch:
         raise NotImplementedError
@@ -11,11 +11,11 @@ class ContactsExtractor(BaseExtractor):
 
     def extract(self, doc_id, text):
         items = []
-        for m in self.rx_email.finditer(text):
+        for m in self.finditer(self.rx_email, text):
             items.append(ExtractItem(item_type="contact", subtype="email",
                                      text_raw=m.group(0), value_norm=m.group(0).lower(),
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
-        for m in self.rx_phone.finditer(text):
+        for m in self.finditer(self.rx_phone, text):
             ph = m.group(1).strip()
             items.append(ExtractItem(item_type="contact", subtype="phone",
                                      text_raw=ph, value_norm=ph.replace(" ", ""),
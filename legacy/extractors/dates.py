@@ -1,9 +1,9 @@
 
 import re
-from core.schemas import ExtractItem, ExtractBatch
 from core.registry import register_extractor
 from extractors.base import BaseExtractor
-from core.utils import normalize_digits, MONTHS_AR, MONTHS_DE
+from core.regex_guard import MAX_REPEAT
+from core.utils import MONTHS_AR, MONTHS_DE
 
 @register_extractor(name="dates", version="1.2.0")
 class DateExtractor(BaseExtractor):
@@ -15,35 +15,42 @@ class DateExtractor(BaseExtractor):
         re.IGNORECASE
     )
     window = 60  # chars around match to detect keywords
+    # longest guarded match ("1 <spaces> Januar <spaces> 2024", ~2 000 chars) plus window
+    context_margin = 3 * MAX_REPEAT
 
-    def _classify(self, text, start, end):
-        left = text[max(0, start - self.window):start]
-        right = text[end:end + self.window]
-        ctx = (left + " " + right).lower()
-
-        # Arabic & English & German keywords
-        start_kw = [
-            "يبدأ","بدء","سريان","effective","commence","start",
-            "beginnt","beginn","wirksam","gültig ab","gueltig ab","in kraft","inkrafttreten","inkraft"
-        ]
-        end_kw = [
-            "ينتهي","انتهاء","تنتهي","expires","expiry","end",
-            "endet","laufzeitende","beendet","ablauf","auslauf","endet am"
-        ]
-        deadline_kw = [
-            "الموعد النهائي","موعد نهائي","قبل","deadline","last date",
-            "frist","spätestens","spaetestens","stichtag","abgabetermin","liefertermin"
-        ]
-
-        def has_any(words):
-            return any(w in ctx for w in words)
+    # Arabic & English & German keywords, checked in this order
+    start_kw = (
+        "يبدأ","بدء","سريان","effective","commence","start",
+        "beginnt","beginn","wirksam","gültig ab","gueltig ab","in kraft","inkrafttreten","inkraft"
+    )
+    end_kw = (
+        "ينتهي","انتهاء","تنتهي","expires","expiry","end",
+        "endet","laufzeitende","beendet","ablauf","auslauf","endet am"
+    )
+    deadline_kw = (
+        "الموعد النهائي","موعد نهائي","قبل","deadline","last date",
+        "frist","spätestens","spaetestens","stichtag","abgabetermin","liefertermin"
+    )
+    # (subtype, keywords, keywords with a space); the context is left window + " " + right
+    # window, and only keywords with a space can span that join
+    _classes = tuple((st, kws, tuple(k for k in kws if " " in k))
+                     for st, kws in (("start_date", start_kw), ("end_date", end_kw), ("deadline", deadline_kw)))
+    _join = max(len(k) for _, _, sp in _classes for k in sp) - 1
 
-        if has_any(start_kw):
-            return "start_date"
-        if has_any(end_kw):
-            return "end_date"
-        if has_any(deadline_kw):
-            return "deadline"
+    def _classify(self, text, start, end):
+        kw = self.keyword_index(text)
+        w = self.window
+        joined = None
+        for subtype, words, spaced in self._classes:
+            near = kw.probe(words)
+            if near(start - w, start) or near(end, end + w):
+                return subtype
+            if spaced:
+                if joined is None:
+                    n = min(w, self._join)
+                    joined = (text[max(0, start - n):start] + " " + text[end:end + n]).lower()
+                if any(k in joined for k in spaced):
+                    return subtype
         return None
 
     def _normalize_month_name(self, raw):
@@ -69,19 +76,12 @@ class DateExtractor(BaseExtractor):
         return raw
 
     def extract(self, doc_id, text):
-        text = normalize_digits(text)
-        items = []
-        for m in self.rx.finditer(text):
+        text = self.context(text).digits
+        spans = self.spans(doc_id)
+        add = spans.add
+        for m in self.finditer(self.rx, text):
             raw = m.group(0)
             val = self._normalize_month_name(raw)
             subtype = self._classify(text, m.start(), m.end())
-            items.append(ExtractItem(
-                item_type="date",
-                subtype=subtype,
-                text_raw=raw,
-                value_norm=val,
-                start=m.start(), end=m.end(),
-                extractor=self.__class__.__name__,
-                version=self.__version__
-            ))
-        return ExtractBatch(doc_id=doc_id, items=items)
+            add("date", raw, subtype, val, start=m.start(), end=m.end())
+        return spans.validate()
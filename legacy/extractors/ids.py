@@ -11,11 +11,11 @@ class IdsExtractor(BaseExtractor):
 
     def extract(self, doc_id, text):
         items = []
-        for m in self.rx_contract.finditer(text):
+        for m in self.finditer(self.rx_contract, text):
             items.append(ExtractItem(item_type="id", subtype="contract_number",
                                      text_raw=m.group(0).strip(), value_norm=m.group(1).strip(),
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
-        for m in self.rx_customer.finditer(text):
+        for m in self.finditer(self.rx_customer, text):
             items.append(ExtractItem(item_type="id", subtype="customer_number",
                                      text_raw=m.group(0).strip(), value_norm=m.group(2).strip(),
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
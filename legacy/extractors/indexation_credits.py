@@ -21,37 +21,37 @@ class IndexationCreditsExtractor(BaseExtractor):
         t = text
 
         # Indexation presence
-        for m in self.rx_index_vpi.finditer(t):
+        for m in self.finditer(self.rx_index_vpi, t):
             items.append(ExtractItem(item_type="pricing", subtype="indexation_present",
                                      text_raw=m.group(0), value_norm="present",
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
 
         # Yearly raise with percent
-        for m in self.rx_raise_pct_year.finditer(t):
+        for m in self.finditer(self.rx_raise_pct_year, t):
             items.append(ExtractItem(item_type="pricing", subtype="index_raise_percent_pa",
                                      text_raw=m.group(0), value_norm=m.group(2), unit="percent_pa",
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
 
         # Cap percent if stated
-        for m in self.rx_cap_pct.finditer(t):
+        for m in self.finditer(self.rx_cap_pct, t):
             items.append(ExtractItem(item_type="pricing", subtype="index_cap_percent",
                                      text_raw=m.group(0), value_norm=m.group(1), unit="percent",
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
 
         # Service credits (presence + trigger threshold + credit %)
         credit_found = False
-        for m in self.rx_credit.finditer(t):
+        for m in self.finditer(self.rx_credit, t):
             credit_found = True
             items.append(ExtractItem(item_type="pricing", subtype="service_credit_present",
                                      text_raw=m.group(0), value_norm="present",
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
 
-        for m in self.rx_uptime_trigger.finditer(t):
+        for m in self.finditer(self.rx_uptime_trigger, t):
             items.append(ExtractItem(item_type="pricing", subtype="service_credit_trigger_uptime_lt",
                                      text_raw=m.group(0), value_norm=m.group(1), unit="percent",
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
 
-        for m in self.rx_credit_pct.finditer(t):
+        for m in self.finditer(self.rx_credit_pct, t):
             items.append(ExtractItem(item_type="pricing", subtype="service_credit_percent",
                                      text_raw=m.group(0), value_norm=m.group(1), unit="percent",
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
@@ -12,15 +12,15 @@ class LegalExtractor(BaseExtractor):
 
     def extract(self, doc_id, text):
         items = []
-        if self.rx_law.search(text):
+        if self.search(self.rx_law, text):
             items.append(ExtractItem(item_type="clause", subtype="governing_law",
                                      text_raw="deutsches Recht", value_norm="DE",
                                      start=None, end=None, extractor=self.__class__.__name__, version=self.__version__))
-        if self.rx_cisg_excl.search(text):
+        if self.search(self.rx_cisg_excl, text):
             items.append(ExtractItem(item_type="clause", subtype="cisg_excluded",
                                      text_raw="CISG excluded", value_norm="yes",
                                      start=None, end=None, extractor=self.__class__.__name__, version=self.__version__))
-        m = self.rx_juris.search(text)
+        m = self.search(self.rx_juris, text)
         if m:
             city = m.group(1)
             items.append(ExtractItem(item_type="clause", subtype="jurisdiction",
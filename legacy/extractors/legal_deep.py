@@ -36,42 +36,42 @@ class LegalDeepExtractor(BaseExtractor):
         items = []
         t = text
 
-        for m in self.rx_pay_days.finditer(t):
+        for m in self.finditer(self.rx_pay_days, t):
             items.append(ExtractItem(item_type="money", subtype="payment_due_days",
                                      text_raw=m.group(0), value_norm=m.group(2),
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
 
-        for m in self.rx_skonto.finditer(t):
+        for m in self.finditer(self.rx_skonto, t):
             items.append(ExtractItem(item_type="money", subtype="skonto_percent",
                                      text_raw=m.group(0), value_norm=m.group(2), unit="percent",
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
 
-        for m in self.rx_verzug_pct.finditer(t):
+        for m in self.finditer(self.rx_verzug_pct, t):
             items.append(ExtractItem(item_type="money", subtype="default_interest_percent",
                                      text_raw=m.group(0), value_norm=m.group(2), unit="percent",
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
-        for m in self.rx_basiszins.finditer(t):
+        for m in self.finditer(self.rx_basiszins, t):
             items.append(ExtractItem(item_type="money", subtype="default_interest_over_basis",
                                      text_raw=m.group(0), value_norm=m.group(1), unit="percent_over_basis",
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
 
-        for m in self.rx_liab_cap_amt.finditer(t):
+        for m in self.finditer(self.rx_liab_cap_amt, t):
             items.append(ExtractItem(item_type="clause", subtype="liability_cap_amount",
                                      text_raw=m.group(0), value_norm=m.group(2),
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
-        for m in self.rx_liab_cap_pct.finditer(t):
+        for m in self.finditer(self.rx_liab_cap_pct, t):
             items.append(ExtractItem(item_type="clause", subtype="liability_cap_percent",
                                      text_raw=m.group(0), value_norm=m.group(2), unit="percent",
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
 
         for rx, sub in [(self.rx_dsgvo,"dsgvo"), (self.rx_avv,"avv"), (self.rx_toms,"toms"),
                         (self.rx_compete,"non_compete"), (self.rx_poach,"non_solicit")]:
-            for m in rx.finditer(t):
+            for m in self.finditer(rx, t):
                 items.append(ExtractItem(item_type="clause", subtype=sub,
                                          text_raw=m.group(0), value_norm="present",
                                          start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
 
-        for m in self.rx_sitz.finditer(t):
+        for m in self.finditer(self.rx_sitz, t):
             # normalize to city string
             city = m.group(1).strip()
             items.append(ExtractItem(item_type="party", subtype="seat_city",
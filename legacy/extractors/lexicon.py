@@ -9,54 +9,103 @@ def _sanitize_yaml_regex_escapes(raw_text: str) -> str:
     pattern = _re.compile(r'(?<!\\)\\([sdwbnrtDWBS.])')
     return pattern.sub(r'\\\\\1', raw_text)
 
+# libyaml's loader when PyYAML was built with it
+_YamlLoader = getattr(_yaml, 'CSafeLoader', _yaml.SafeLoader)
+
 def _safe_load_yaml_with_regex(path):
     raw = path.read_text(encoding='utf-8')
     try:
-        return _yaml.safe_load(raw)
+        return _yaml.load(raw, Loader=_YamlLoader)
     except _yaml.YAMLError as e:
         _logging.getLogger('contracts-ai.lexicon').warning('YAML parse failed; applying sanitizer: %s', e)
         fixed = _sanitize_yaml_regex_escapes(raw)
-        return _yaml.safe_load(fixed)
+        return _yaml.load(fixed, Loader=_YamlLoader)
 
 
-import re, yaml
+import hashlib
+import re
+import threading
 from pathlib import Path
 from core.schemas import ExtractItem, ExtractBatch
 from core.registry import register_extractor
 from extractors.base import BaseExtractor
 
-@register_extractor(name="lexicon", version="0.1.0")
-class LexiconExtractor(BaseExtractor):
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        path = Path(__file__).resolve().parents[1] / "lexicon" / "medtech_de.yml"
-        spec = _safe_load_yaml_with_regex(path)
+LEXICON_PATH = Path(__file__).resolve().parents[1] / "lexicon" / "medtech_de.yml"
+
+
+class Lexicon:
+    """Compiled concepts of one lexicon file, shared by every ``LexiconExtractor`` in the process."""
+
+    def __init__(self, spec, digest=""):
+        self.digest = digest
         self.concepts = []
-        for c in spec.get("concepts", []):
-            patt = [re.compile(p, re.IGNORECASE) for p in c.get("patterns", [])]
+        for c in (spec or {}).get("concepts", []):
             self.concepts.append({
                 "id": c["id"],
                 "label": c["label"],
                 "category": c.get("category",""),
                 "description": c.get("description",""),
-                "patterns": patt
+                "patterns": [re.compile(p, re.IGNORECASE) for p in c.get("patterns", [])]
             })
+        # (concept, pattern) in extraction order
+        self.matchers = [(c, rx) for c in self.concepts for rx in c["patterns"]]
+
+
+# path -> ((st_mtime_ns, st_size), Lexicon)
+_LEXICONS = {}
+_LEXICON_LOCK = threading.Lock()
+
+
+def load_lexicon(path=LEXICON_PATH) -> Lexicon:
+    """The compiled lexicon at ``path``; parsed once per process and again only after the file changes."""
+    path = Path(path)
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    hit = _LEXICONS.get(path)
+    if hit is None or hit[0] != stamp:
+        with _LEXICON_LOCK:
+            hit = _LEXICONS.get(path)
+            if hit is None or hit[0] != stamp:
+                digest = hashlib.sha256(path.read_bytes()).hexdigest()
+                hit = _LEXICONS[path] = (stamp, Lexicon(_safe_load_yaml_with_regex(path), digest))
+    return hit[1]
+
+
+@register_extractor(name="lexicon", version="0.1.0")
+class LexiconExtractor(BaseExtractor):
+    lexicon_path = LEXICON_PATH
+
+    @property
+    def lexicon(self) -> Lexicon:
+        # looked up per use, so long-lived instances (ExtractorSet) pick up an edited file
+        return load_lexicon(self.lexicon_path)
+
+    @property
+    def concepts(self):
+        return self.lexicon.concepts
+
+    @classmethod
+    def data_digest(cls):
+        return load_lexicon(cls.lexicon_path).digest
+
+    def scan_patterns(self):
+        return [rx for _, rx in self.lexicon.matchers]
 
     def extract(self, doc_id, text):
         items = []
-        for c in self.concepts:
-            for rx in c["patterns"]:
-                for m in rx.finditer(text):
-                    raw = m.group(0)
-                    items.append(ExtractItem(
-                        item_type="other",  # was "concept"; constrained by ItemType Literal
-                        
-                        subtype=c["id"],
-                        text_raw=raw,
-                        value_norm=c["label"],
-                        start=m.start(),
-                        end=m.end(),
-                        extractor=self.__class__.__name__,
-                        version=self.__version__
-                    ))
-        return ExtractBatch(doc_id=doc_id, items=items)
\ No newline at end of file
+        lexicon = self.lexicon
+        for c, rx in lexicon.matchers:
+            for m in self.finditer(rx, text):
+                raw = m.group(0)
+                items.append(ExtractItem(
+                    item_type="other",  # was "concept"; constrained by ItemType Literal
+                    
+                    subtype=c["id"],
+                    text_raw=raw,
+                    value_norm=c["label"],
+                    start=m.start(),
+                    end=m.end(),
+                    extractor=self.__class__.__name__,
+                    version=self.__version__
+                ))
+        return ExtractBatch(doc_id=doc_id, items=items)
@@ -1,9 +1,8 @@
 
 import re
-from core.schemas import ExtractItem, ExtractBatch
 from core.registry import register_extractor
 from extractors.base import BaseExtractor
-from core.utils import normalize_digits
+from core.regex_guard import MAX_REPEAT
 
 @register_extractor(name="money", version="1.2.0")
 class MoneyExtractor(BaseExtractor):
@@ -23,124 +22,96 @@ class MoneyExtractor(BaseExtractor):
     rx_iban = re.compile(r'\b[A-Z]{2}\d{2}[A-Z0-9]{1,30}\b')
 
     window = 80
-
-    def _ctx(self, text, start, end):
-        return (text[max(0, start-self.window):min(len(text), end+self.window)]).lower()
+    # longest guarded match (money_plus "Netto … EUR": three \s* and digit groups, ~7 000 chars) plus window
+    context_margin = 8 * MAX_REPEAT
+
+    # context keywords, matched against the lowercased text within ±window of a match
+    kw_per_month = ("شهري", "شهريًا", "per month", "p.m", "/month", "بالشهر", "monatlich", "pro monat", "/monat")
+    kw_per_year = ("سنوي", "سنوياً", "per year", "p.a", "/year", "بالسنة", "jährlich", "pro jahr", "/jahr")
+    kw_extra = ("رسوم إضافية", "تكاليف إضافية", "extra cost", "surcharge", "fee", "zusätzliche gebühren", "zusatzkosten", "aufschlag")
+    kw_vat = ("vat", "ضريبة القيمة المضافة", "القيمة المضافة", "ضريبة", "tax", "mwst", "ust", "umsatzsteuer", "mehrwertsteuer")
+    kw_notice = ("إشعار", "اخطار", "إخطار", "notice", "بلاغ", "إبلاغ", "kündigungsfrist", "kuendigungsfrist", "frist")
+    kw_renew = ("تجدد", "تلقائي", "auto renew", "renewal", "verlängert", "verlanger", "verlängerung", "automatische verlängerung")
+    # checked in order; the first currency with a keyword wins
+    kw_currency = (
+        ("EUR", ("eur", "€", "euro", "يورو")),
+        ("USD", ("usd", "$", "dollar", "دولار")),
+        ("SAR", ("sar", "ريال")),
+        ("SYP", ("syp", "ل.س", "ليرة")),
+    )
 
     def _currency_from_text(self, s: str):
         s = s.lower()
-        if "eur" in s or "€" in s or "euro" in s or "يورو" in s:
-            return "EUR"
-        if "usd" in s or "$" in s or "dollar" in s or "دولار" in s:
-            return "USD"
-        if "sar" in s or "ريال" in s:
-            return "SAR"
-        if "syp" in s or "ل.س" in s or "ليرة" in s:
-            return "SYP"
+        for cur, words in self.kw_currency:
+            if any(w in s for w in words):
+                return cur
         return None
 
     def extract(self, doc_id, text):
-        t = normalize_digits(text)
-        items = []
+        t = self.context(text).digits
+        # keyword probes over the shared index; each answers "keyword within text[a:b]"
+        kw = self.keyword_index(t)
+        w = self.window
+        per_month, per_year, extra, vat, notice, renew = map(kw.probe, (
+            self.kw_per_month, self.kw_per_year, self.kw_extra, self.kw_vat, self.kw_notice, self.kw_renew))
+        currency_near = [(cur, kw.probe(words)) for cur, words in self.kw_currency]
+        spans = self.spans(doc_id)
+        add = spans.add
 
         # Money
-        for m in self.rx_money.finditer(t):
+        for m in self.finditer(self.rx_money, t):
+            a, b = m.start() - w, m.end() + w
             raw = m.group(0).strip()
-            ctx = self._ctx(t, m.start(), m.end())
             subtype = None
             unit = None
 
             # per month/year
-            if any(k in ctx for k in ["شهري", "شهريًا", "per month", "p.m", "/month", "بالشهر", "monatlich", "pro monat", "/monat"]):
+            if per_month(a, b):
                 subtype, unit = "cost_per_month", "month"
-            elif any(k in ctx for k in ["سنوي", "سنوياً", "per year", "p.a", "/year", "بالسنة", "jährlich", "pro jahr", "/jahr"]):
+            elif per_year(a, b):
                 subtype, unit = "cost_per_year", "year"
-            elif any(k in ctx for k in ["رسوم إضافية", "تكاليف إضافية", "extra cost", "surcharge", "fee", "zusätzliche gebühren", "zusatzkosten", "aufschlag"]):
+            elif extra(a, b):
                 subtype = "extra_cost"
 
-            currency = self._currency_from_text(raw) or self._currency_from_text(ctx)
+            currency = self._currency_from_text(raw) or next((cur for cur, near in currency_near if near(a, b)), None)
 
-            items.append(ExtractItem(
-                item_type="money",
-                subtype=subtype,
-                text_raw=raw,
-                value_norm=raw,
-                currency=currency,
-                unit=unit,
-                start=m.start(), end=m.end(),
-                extractor=self.__class__.__name__,
-                version=self.__version__
-            ))
+            add("money", raw, subtype, raw, currency, unit, m.start(), m.end())
 
         # Percent (VAT)
-        for m in self.rx_percent.finditer(t):
+        for m in self.finditer(self.rx_percent, t):
+            a, b = m.start() - w, m.end() + w
             raw = m.group(0)
-            ctx = self._ctx(t, m.start(), m.end())
             subtype = "percent"
-            if any(k in ctx for k in ["vat", "ضريبة القيمة المضافة", "القيمة المضافة", "ضريبة", "tax", "mwst", "ust", "umsatzsteuer", "mehrwertsteuer"]):
+            if vat(a, b):
                 subtype = "vat_percent"
-            items.append(ExtractItem(
-                item_type="money",
-                subtype=subtype,
-                text_raw=raw,
-                value_norm=raw.replace("٪", "%"),
-                start=m.start(), end=m.end(),
-                extractor=self.__class__.__name__,
-                version=self.__version__
-            ))
+            add("money", raw, subtype, raw.replace("٪", "%"), start=m.start(), end=m.end())
 
         # Durations
-        for m in self.rx_days.finditer(t):
+        for m in self.finditer(self.rx_days, t):
+            a, b = m.start() - w, m.end() + w
             n = m.group(1)
-            ctx = self._ctx(t, m.start(), m.end())
             subtype = "duration_days"
-            if any(k in ctx for k in ["إشعار", "اخطار", "إخطار", "notice", "بلاغ", "إبلاغ", "kündigungsfrist", "kuendigungsfrist", "frist"]):
+            if notice(a, b):
                 subtype = "notice_days"
-            items.append(ExtractItem(
-                item_type="money",
-                subtype=subtype,
-                text_raw=m.group(0),
-                value_norm=str(int(n)),
-                unit="days",
-                start=m.start(), end=m.end(),
-                extractor=self.__class__.__name__,
-                version=self.__version__
-            ))
-
-        for m in self.rx_months.finditer(t):
+            add("money", m.group(0), subtype, str(int(n)), unit="days", start=m.start(), end=m.end())
+
+        for m in self.finditer(self.rx_months, t):
+            a, b = m.start() - w, m.end() + w
             n = m.group(1)
-            ctx = self._ctx(t, m.start(), m.end())
             subtype = "duration_months"
-            if any(k in ctx for k in ["تجدد", "تلقائي", "auto renew", "renewal", "verlängert", "verlanger", "verlängerung", "automatische verlängerung"]):
+            if renew(a, b):
                 subtype = "auto_renew_months"
-            items.append(ExtractItem(
-                item_type="money",
-                subtype=subtype,
-                text_raw=m.group(0),
-                value_norm=str(int(n)),
-                unit="months",
-                start=m.start(), end=m.end(),
-                extractor=self.__class__.__name__,
-                version=self.__version__
-            ))
+            add("money", m.group(0), subtype, str(int(n)), unit="months", start=m.start(), end=m.end())
 
         # IBAN
-        for m in self.rx_iban.finditer(t):
-            items.append(ExtractItem(
-                item_type="money",
-                subtype="iban",
-                text_raw=m.group(0),
-                value_norm=m.group(0).replace(" ", ""),
-                start=m.start(), end=m.end(),
-                extractor=self.__class__.__name__,
-                version=self.__version__
-            ))
+        for m in self.finditer(self.rx_iban, t):
+            add("money", m.group(0), "iban", m.group(0).replace(" ", ""), start=m.start(), end=m.end())
 
-        return ExtractBatch(doc_id=doc_id, items=items)
+        return spans.validate()
 
 
 import re as _re
-from core.schemas import ExtractItem, ExtractBatch
+from core.schemas import ExtractBatch
 
 try:
     MoneyExtractor
@@ -162,33 +133,24 @@ _rx_mwst_pct = _re.compile(r'(?:MwSt|USt|Umsatzsteuer)[^%\n]{0,20}(\d{1,2}(?:[.,
 _old_extract = getattr(MoneyExtractor, 'extract', None)
 
 def _money_plus_extract(self, doc_id, text):
-    items = []
+    spans = self.spans(doc_id)
     t = text
 
-    for m in _rx_netto.finditer(t):
-        items.append(ExtractItem(item_type="money", subtype="net_amount_eur",
-                                 text_raw=m.group(0), value_norm=m.group(2),
-                                 start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
-    for m in _rx_brutto.finditer(t):
-        items.append(ExtractItem(item_type="money", subtype="gross_amount_eur",
-                                 text_raw=m.group(0), value_norm=m.group(2),
-                                 start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
-    for m in _rx_mwst_amt.finditer(t):
-        items.append(ExtractItem(item_type="money", subtype="vat_amount_eur",
-                                 text_raw=m.group(0), value_norm=m.group(1),
-                                 start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
-    for m in _rx_mwst_pct.finditer(t):
-        items.append(ExtractItem(item_type="money", subtype="vat_percent",
-                                 text_raw=m.group(0), value_norm=m.group(1),
-                                 start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
+    for m in self.finditer(_rx_netto, t):
+        spans.add("money", m.group(0), "net_amount_eur", m.group(2), start=m.start(), end=m.end())
+    for m in self.finditer(_rx_brutto, t):
+        spans.add("money", m.group(0), "gross_amount_eur", m.group(2), start=m.start(), end=m.end())
+    for m in self.finditer(_rx_mwst_amt, t):
+        spans.add("money", m.group(0), "vat_amount_eur", m.group(1), start=m.start(), end=m.end())
+    for m in self.finditer(_rx_mwst_pct, t):
+        spans.add("money", m.group(0), "vat_percent", m.group(1), start=m.start(), end=m.end())
 
     if callable(_old_extract):
         try:
-            prev = _old_extract(self, doc_id, text)
-            items.extend(prev.items or [])
+            spans.extend(_old_extract(self, doc_id, text))
         except Exception:
             pass
 
-    return ExtractBatch(doc_id=doc_id, items=items)
+    return spans.validate()
 
 MoneyExtractor.extract = _money_plus_extract
@@ -16,12 +16,12 @@ class ObligationsLiabilityExtractor(BaseExtractor):
 
     def extract(self, doc_id, text):
         items = []
-        for m in self.rx_obl.finditer(text):
+        for m in self.finditer(self.rx_obl, text):
             raw = self._grab(text, m)
             items.append(ExtractItem(item_type="clause", subtype="customer_obligations",
                                      text_raw=raw, value_norm="present", start=m.start(), end=m.end(),
                                      extractor=self.__class__.__name__, version=self.__version__))
-        for m in self.rx_liab.finditer(text):
+        for m in self.finditer(self.rx_liab, text):
             raw = self._grab(text, m)
             items.append(ExtractItem(item_type="clause", subtype="liability",
                                      text_raw=raw, value_norm="present", start=m.start(), end=m.end(),
@@ -25,7 +25,7 @@ class PartiesExtractor(BaseExtractor):
         t = text
 
         # Organizations by legal form
-        for m in self.rx_org.finditer(t):
+        for m in self.finditer(self.rx_org, t):
             # Expand capture to include preceding name if present
             left = t[max(0, m.start()-80):m.start()]
             right = t[m.end():m.end()+80]
@@ -37,14 +37,14 @@ class PartiesExtractor(BaseExtractor):
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
 
         # Quoted names → often company names
-        for m in self.rx_quoted.finditer(t):
+        for m in self.finditer(self.rx_quoted, t):
             val = self._clean(m.group(1))
             if len(val) >= 3:
                 items.append(ExtractItem(item_type="party", subtype="quoted", text_raw=m.group(0), value_norm=val,
                                          start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
 
         # Persons
-        for m in self.rx_person.finditer(t):
+        for m in self.finditer(self.rx_person, t):
             val = self._clean(m.group(2))
             items.append(ExtractItem(item_type="party", subtype="person", text_raw=m.group(0), value_norm=val,
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
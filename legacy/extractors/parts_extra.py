@@ -11,7 +11,7 @@ class PartsExtraExtractor(BaseExtractor):
 
     def extract(self, doc_id, text):
         items = []
-        for m in self.rx_cap_year.finditer(text):
+        for m in self.finditer(self.rx_cap_year, text):
             items.append(ExtractItem(item_type="parts", subtype="parts_cap_per_year_eur",
                                      text_raw=m.group(0), value_norm=m.group(2),
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
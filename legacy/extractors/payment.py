@@ -13,17 +13,17 @@ class PaymentExtractor(BaseExtractor):
     def extract(self, doc_id, text):
         items = []
 
-        for m in self.rx_interval.finditer(text):
+        for m in self.finditer(self.rx_interval, text):
             items.append(ExtractItem(item_type="other", subtype="payment_interval",
                                      text_raw=m.group(0), value_norm=m.group(0).lower(), start=m.start(), end=m.end(),
                                      extractor=self.__class__.__name__, version=self.__version__))
 
-        for m in self.rx_advance.finditer(text):
+        for m in self.finditer(self.rx_advance, text):
             items.append(ExtractItem(item_type="other", subtype="payment_advance",
                                      text_raw=m.group(0), value_norm="im Voraus", start=m.start(), end=m.end(),
                                      extractor=self.__class__.__name__, version=self.__version__))
 
-        for m in self.rx_method.finditer(text):
+        for m in self.finditer(self.rx_method, text):
             val = m.group(0)
             items.append(ExtractItem(item_type="other", subtype="payment_method",
                                      text_raw=val, value_norm=val, start=m.start(), end=m.end(),
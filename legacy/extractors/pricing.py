@@ -24,7 +24,7 @@ class PricingExtractor(BaseExtractor):
         items = []
 
         # Monatsbereiche 24.-36. Monat
-        for m in self.rx_month_range1.finditer(text):
+        for m in self.finditer(self.rx_month_range1, text):
             a, b = m.group(1), m.group(2)
             # حاول التقاط مبلغ بجوار النطاق
             ctx = text[max(0, m.start()-120):m.end()+120]
@@ -35,7 +35,7 @@ class PricingExtractor(BaseExtractor):
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
 
         # 24 bis 36 Monate
-        for m in self.rx_month_range2.finditer(text):
+        for m in self.finditer(self.rx_month_range2, text):
             a, b = m.group(1), m.group(2)
             ctx = text[max(0, m.start()-120):m.end()+120]
             am = self.rx_amount_eur.search(ctx)
@@ -45,7 +45,7 @@ class PricingExtractor(BaseExtractor):
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
 
         # ab dem 24. Monat
-        for m in self.rx_month_from.finditer(text):
+        for m in self.finditer(self.rx_month_from, text):
             a = m.group(1)
             ctx = text[max(0, m.start()-120):m.end()+120]
             am = self.rx_amount_eur.search(ctx)
@@ -55,7 +55,7 @@ class PricingExtractor(BaseExtractor):
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
 
         # Jahreskosten
-        for m in self.rx_cost_per_year.finditer(text):
+        for m in self.finditer(self.rx_cost_per_year, text):
             amt = m.group(1)
             payload = f"{amt} EUR per year"
             items.append(ExtractItem(item_type="money", subtype="price_per_year",
@@ -63,7 +63,7 @@ class PricingExtractor(BaseExtractor):
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
 
         # Per call / pro Einsatz
-        for m in self.rx_per_call.finditer(text):
+        for m in self.finditer(self.rx_per_call, text):
             amt = m.group(1)
             items.append(ExtractItem(item_type="money", subtype="fixed_per_call",
                                      text_raw=m.group(0), value_norm=amt, unit=None,
@@ -1,22 +1,23 @@
 from __future__ import annotations
-import re
 from typing import List
 from core.schemas import ExtractBatch, ExtractItem
+from core.sections import SectionIndex
 
-SEC_RE = re.compile(r"(?P<h>(?:§\s*|)^)(?P<num>1)\s*[.)]?\s+Vertragsgegenstand\b", re.I)
-NEXT_HEADER = re.compile(r"(?:\n|\r)(?:\s*§\s*\d+\s+\w+|\s*\d+[.)]\s+\w+)", re.I)
-
-def _extract_section(text: str, header_rx: re.Pattern, next_header_rx: re.Pattern):
-    m = header_rx.search(text)
+def _extract_section(text: str):
+    """Numbered "1 Vertragsgegenstand" line up to the next "§ N" or "N." / "N)" heading line."""
+    idx = SectionIndex.of(text)
+    m = next((h for h in idx.headings
+              if h.marker != "§" and h.num == "1" and h.title.lower() == "vertragsgegenstand"), None)
     if not m:
-        alt = re.compile(r"(^|\n)\s*1[.)]?\s+Vertragsgegenstand\b", re.I)
-        m = alt.search(text)
-        if not m:
-            return None
-    start = m.start()
-    n = next_header_rx.search(text, m.end())
-    end = n.start() if n else len(text)
-    return text[start:end].strip()
+        return None
+    end = len(text)
+    for n in idx.headings:
+        if n.start > m.start and n.marker in ("§", ".", ")"):
+            p = idx.line_break(n, "\n\r")
+            if p >= m.end:
+                end = p
+                break
+    return text[m.start:end].strip()
 
 class SectionExtractor:
     __name__ = "SectionExtractor"
@@ -24,7 +25,7 @@ class SectionExtractor:
 
     def extract(self, doc_id: str, text: str) -> ExtractBatch:
         items: List[ExtractItem] = []
-        sec1 = _extract_section(text, SEC_RE, NEXT_HEADER)
+        sec1 = _extract_section(text)
         if sec1:
             items.append(ExtractItem(
                 item_type="clause",
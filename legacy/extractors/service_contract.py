@@ -1,31 +1,16 @@
 
 from __future__ import annotations
 import re
-from typing import List, Optional
+from typing import List
+from core.regex_guard import guard
 from core.schemas import ExtractBatch, ExtractItem
+from core.sections import SectionIndex
+from core.values import iso_date
 
 # --- Intro block (parties) ---
-PARTY_BLOCK = re.compile(r'Zwischen(.*?)wird folgender Vertrag', re.S | re.I)
+PARTY_BLOCK = guard(re.compile(r'Zwischen(.*?)wird folgender Vertrag', re.S | re.I))
 FOLGEN = re.compile(r'im\s+Folgenden', re.I)
 
-# --- Section headers (tolerant) ---
-SEC1 = re.compile(r'(§\s*1\s+Vertragsgegenstand|^\s*1[.)]?\s+Vertragsgegenstand)', re.I | re.M)
-SEC2 = re.compile(r'(§\s*2\s+(Pflichten|Leistungsumfang)|^\s*2[.)]?\s+(Pflichten|Leistungsumfang))', re.I | re.M)
-SEC3 = re.compile(r'(§\s*3\s+(Vergütung|Verguetung|Zahlung)|^\s*3[.)]?\s+(Vergütung|Verguetung|Zahlung))', re.I | re.M)
-SEC4 = re.compile(r'(§\s*4\s+(Vertragsdauer|Laufzeit|Kündigung|Kuendigung)|^\s*4[.)]?\s+(Vertragsdauer|Laufzeit|Kündigung|Kuendigung))', re.I | re.M)
-
-def _find_section(text: str, rx_start, next_rxs) -> Optional[re.Match]:
-    m = rx_start.search(text)
-    if not m:
-        return None
-    start = m.start()
-    end = len(text)
-    for rx in next_rxs:
-        n = rx.search(text, m.end())
-        if n:
-            end = min(end, n.start())
-    return (start, end)
-
 def _slice(text: str, span) -> str:
     s, e = span
     return text[s:e].strip()
@@ -67,15 +52,6 @@ def _norm_money_de(s: str) -> float:
     except Exception:
         return None
 
-def _norm_date_de(s: str) -> str:
-    m = re.match(r'(\d{1,2})\.(\d{1,2})\.(\d{2,4})', s)
-    if not m:
-        return s
-    d, mo, y = int(m.group(1)), int(m.group(2)), int(m.group(3))
-    if y < 100:
-        y += 2000
-    return f"{y:04d}-{mo:02d}-{d:02d}"
-
 # --- Contract Type ---
 CONTRACT_TYPE = re.compile(r'\b(Dienstleistungsvertrag|Werkvertrag|Kaufvertrag|Mietvertrag|Lizenzvertrag|Servicevertrag)\b', re.I)
 
@@ -115,11 +91,9 @@ class ServiceContractExtractor:
                     version=self.__version__, confidence=0.97,
                 ))
 
-        # Sections spans
-        s1 = _find_section(text, SEC1, [SEC2, SEC3, SEC4])
-        s2 = _find_section(text, SEC2, [SEC3, SEC4])
-        s3 = _find_section(text, SEC3, [SEC4])
-        s4 = _find_section(text, SEC4, [])
+        # Sections spans (§ headings or numbered lines, see core.sections.SECTION_TITLES)
+        idx = SectionIndex.of(text)
+        s1, s2, s3, s4 = (idx.span(n) for n in (1, 2, 3, 4))
 
         # §1 subject (full text)
         if s1:
@@ -184,7 +158,7 @@ class ServiceContractExtractor:
             if ms:
                 items.append(ExtractItem(
                     item_type="date", subtype="start_date",
-                    text_raw=ms.group(0), value_norm=_norm_date_de(ms.group(1)),
+                    text_raw=ms.group(0), value_norm=iso_date(ms.group(1)),
                     page=None, para=None, start=s4[0], end=s4[1],
                     extractor=self.__class__.__name__, version=self.__version__, confidence=0.9,
                 ))
@@ -192,7 +166,7 @@ class ServiceContractExtractor:
             if me:
                 items.append(ExtractItem(
                     item_type="date", subtype="end_date",
-                    text_raw=me.group(0), value_norm=_norm_date_de(me.group(1)),
+                    text_raw=me.group(0), value_norm=iso_date(me.group(1)),
                     page=None, para=None, start=s4[0], end=s4[1],
                     extractor=self.__class__.__name__, version=self.__version__, confidence=0.9,
                 ))
@@ -13,13 +13,13 @@ class SLAExtractor(BaseExtractor):
 
     def extract(self, doc_id, text):
         items = []
-        m = self.rx_react.search(text)
+        m = self.search(self.rx_react, text)
         if m:
             items.append(ExtractItem(item_type="other", subtype="reaction_time_hours",
                                      text_raw=m.group(0).strip(), value_norm=m.group(1),
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
 
-        m = self.rx_hours.search(text)
+        m = self.search(self.rx_hours, text)
         if m:
             hh1, mm1, hh2, mm2 = m.group(2), m.group(3), m.group(4), m.group(5)
             val = f"Mo-Fr {int(hh1):02d}:{mm1}-{int(hh2):02d}:{mm2}"
@@ -27,13 +27,13 @@ class SLAExtractor(BaseExtractor):
                                      text_raw=m.group(0).strip(), value_norm=val,
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
 
-        m = self.rx_surcharge.search(text)
+        m = self.search(self.rx_surcharge, text)
         if m:
             items.append(ExtractItem(item_type="other", subtype="weekend_surcharge_percent",
                                      text_raw=m.group(0).strip(), value_norm=m.group(1),
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
 
-        if self.rx_loaner.search(text):
+        if self.search(self.rx_loaner, text):
             items.append(ExtractItem(item_type="other", subtype="loaner_device",
                                      text_raw="loaner_device", value_norm="yes",
                                      start=None, end=None, extractor=self.__class__.__name__, version=self.__version__))
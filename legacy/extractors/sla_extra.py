@@ -13,6 +13,9 @@ class SLAExtraExtractor(BaseExtractor):
     RX_PER_WORD = r'(monatlich|viertelj[aä]hrlich|quartalsweise|j[aä]hrlich|halbj[aä]hrlich)'
     rx_period_generic = re.compile(RX_PER_WORD, re.IGNORECASE)
     rx_period_xmon = re.compile(r'alle\s+(\d{1,2})\s*Monate', re.IGNORECASE)
+    # RX_PER_WORD spelled out for the shared keyword index; none is a prefix of another
+    period_words = ("monatlich", "vierteljährlich", "vierteljahrlich", "quartalsweise",
+                    "jährlich", "jahrlich", "halbjährlich", "halbjahrlich")
 
     # Anchors for activities
     rx_wartung = re.compile(r'\b(Wartung|Instandhaltung)\b', re.IGNORECASE)
@@ -26,8 +29,9 @@ class SLAExtraExtractor(BaseExtractor):
     def extract(self, doc_id, text):
         items = []
         t = text
+        kw = self.keyword_index(t, casefold=True)
 
-        for m in self.rx_uptime.finditer(t):
+        for m in self.finditer(self.rx_uptime, t):
             label = "Uptime/Verfügbarkeit"
             val = m.group(2)
             items.append(ExtractItem(item_type="other", subtype="uptime_percent",
@@ -43,24 +47,25 @@ class SLAExtraExtractor(BaseExtractor):
         for rx_anchor, subtype in [(self.rx_wartung, "wartung_period"),
                                    (self.rx_inspek, "inspektion_period"),
                                    (self.rx_kalib, "kalibrierung_period")]:
-            for ma in rx_anchor.finditer(t):
+            for ma in self.finditer(rx_anchor, t):
                 s = max(0, ma.start()-120); e = min(len(t), ma.end()+120)
-                ctx = t[s:e]
-                m1 = self.rx_period_generic.search(ctx)
-                if m1:
-                    _emit_period(subtype, (s+m1.start(), s+m1.end()), ctx[m1.start():m1.end()], m1.group(1).lower())
+                # leftmost period word in the window, as rx_period_generic.search(t[s:e]) finds it
+                p = kw.first(self.period_words, s, e)
+                if p:
+                    _emit_period(subtype, p, t[p[0]:p[1]], t[p[0]:p[1]].lower())
                     continue
+                ctx = t[s:e]
                 m2 = self.rx_period_xmon.search(ctx)
                 if m2:
                     _emit_period(subtype, (s+m2.start(), s+m2.end()), ctx[m2.start():m2.end()], f"{m2.group(1)} Monate")
                     continue
 
         # Parts inclusion/exclusion
-        for m in self.rx_parts_incl.finditer(t):
+        for m in self.finditer(self.rx_parts_incl, t):
             items.append(ExtractItem(item_type="other", subtype="parts_included",
                                      text_raw=m.group(0), value_norm="inklusive", unit=None,
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
-        for m in self.rx_parts_excl.finditer(t):
+        for m in self.finditer(self.rx_parts_excl, t):
             items.append(ExtractItem(item_type="other", subtype="parts_included",
                                      text_raw=m.group(0), value_norm="exklusive", unit=None,
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
@@ -82,9 +87,10 @@ def extract(self, doc_id, text):
     # re-run parent logic by duplicating due to decorator constraints (simple merge)
     items = []
     t = text
+    kw = self.keyword_index(t, casefold=True)
 
     # --- existing patterns (uptime/periods/parts) ---
-    for m in self.rx_uptime.finditer(t):
+    for m in self.finditer(self.rx_uptime, t):
         items.append(ExtractItem(item_type="other", subtype="uptime_percent",
                                  text_raw=m.group(0), value_norm=m.group(2), unit="percent",
                                  start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
@@ -97,27 +103,27 @@ def extract(self, doc_id, text):
     for rx_anchor, subtype in [(self.rx_wartung, "wartung_period"),
                                (self.rx_inspek, "inspektion_period"),
                                (self.rx_kalib, "kalibrierung_period")]:
-        for ma in rx_anchor.finditer(t):
+        for ma in self.finditer(rx_anchor, t):
             s = max(0, ma.start()-120); e = min(len(t), ma.end()+120)
+            p = kw.first(self.period_words, s, e)
+            if p:
+                _emit_period(subtype, p, t[p[0]:p[1]], t[p[0]:p[1]].lower()); continue
             ctx = t[s:e]
-            m1 = self.rx_period_generic.search(ctx)
-            if m1:
-                _emit_period(subtype, (s+m1.start(), s+m1.end()), ctx[m1.start():m1.end()], m1.group(1).lower()); continue
             m2 = self.rx_period_xmon.search(ctx)
             if m2:
                 _emit_period(subtype, (s+m2.start(), s+m2.end()), ctx[m2.start():m2.end()], f"{m2.group(1)} Monate"); continue
 
-    for m in self.rx_parts_incl.finditer(t):
+    for m in self.finditer(self.rx_parts_incl, t):
         items.append(ExtractItem(item_type="other", subtype="parts_included",
                                  text_raw=m.group(0), value_norm="inklusive", unit=None,
                                  start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
-    for m in self.rx_parts_excl.finditer(t):
+    for m in self.finditer(self.rx_parts_excl, t):
         items.append(ExtractItem(item_type="other", subtype="parts_included",
                                  text_raw=m.group(0), value_norm="exklusive", unit=None,
                                  start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
 
     # --- new: yearly service scope ---
-    for m in self.rx_scope.finditer(t):
+    for m in self.finditer(self.rx_scope, t):
         items.append(self._emit_scope(m))
 
     return ExtractBatch(doc_id=doc_id, items=items)
@@ -139,13 +145,13 @@ def extract(self, doc_id, text):
     batch = _orig_extract(self, doc_id, text)
     items = list(batch.items or [])
 
-    for m in self.rx_oncall_trig.finditer(text):
+    for m in self.finditer(self.rx_oncall_trig, text):
         items.append(ExtractItem(item_type="sla", subtype="oncall_trigger",
                                  text_raw=m.group(0), value_norm="present",
                                  start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
-    for m in self.rx_oncall_pct.finditer(text):
+    for m in self.finditer(self.rx_oncall_pct, text):
         items.append(self._emit_oncall("oncall_surcharge_percent", m))
-    for m in self.rx_oncall_eurh.finditer(text):
+    for m in self.finditer(self.rx_oncall_eurh, text):
         items.append(self._emit_oncall("oncall_surcharge_eur_per_hour", m))
 
     return ExtractBatch(doc_id=doc_id, items=items)
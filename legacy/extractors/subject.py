@@ -13,7 +13,7 @@ class SubjectExtractor(BaseExtractor):
 
     def extract(self, doc_id, text):
         items = []
-        m = self.rx_ar.search(text) or self.rx_en.search(text)
+        m = self.search(self.rx_ar, text) or self.search(self.rx_en, text)
         if m:
             subj = m.group(0).strip()
             items.append(ExtractItem(
@@ -3,7 +3,6 @@ import re
 from core.schemas import ExtractItem, ExtractBatch
 from core.registry import register_extractor
 from extractors.base import BaseExtractor
-from core.utils import normalize_digits
 
 @register_extractor(name="terms", version="0.1.0")
 class TermsExtractor(BaseExtractor):
@@ -22,37 +21,37 @@ class TermsExtractor(BaseExtractor):
     rx_auto_no = re.compile(r'\bwird\s+nicht\s+automatisch\s+verlängert\b', re.IGNORECASE)
 
     def extract(self, doc_id, text):
-        t = normalize_digits(text)
+        t = self.context(text).digits
         items = []
 
-        m = self.rx_notice_months.search(t)
+        m = self.search(self.rx_notice_months, t)
         if m:
             items.append(ExtractItem(item_type="other", subtype="notice_months",
                                      text_raw=m.group(0).strip(), value_norm=m.group(1),
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
 
-        m = self.rx_min_term.search(t)
+        m = self.search(self.rx_min_term, t)
         if m:
             items.append(ExtractItem(item_type="other", subtype="min_term_months",
                                      text_raw=m.group(0).strip(), value_norm=m.group(1),
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
 
-        m = self.rx_free_months.search(t)
+        m = self.search(self.rx_free_months, t)
         if m:
             items.append(ExtractItem(item_type="other", subtype="free_months",
                                      text_raw=m.group(0).strip(), value_norm=m.group(2),
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
 
-        m = self.rx_pay_start_event.search(t)
+        m = self.search(self.rx_pay_start_event, t)
         if m:
             items.append(ExtractItem(item_type="other", subtype="payment_start_event",
                                      text_raw=m.group(0).strip(), value_norm=m.group(1).strip(),
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
 
-        if self.rx_auto_yes.search(t):
+        if self.search(self.rx_auto_yes, t):
             items.append(ExtractItem(item_type="other", subtype="auto_renewal", text_raw="auto_renewal_yes", value_norm="yes",
                                      start=None, end=None, extractor=self.__class__.__name__, version=self.__version__))
-        if self.rx_auto_no.search(t):
+        if self.search(self.rx_auto_no, t):
             items.append(ExtractItem(item_type="other", subtype="auto_renewal", text_raw="auto_renewal_no", value_norm="no",
                                      start=None, end=None, extractor=self.__class__.__name__, version=self.__version__))
 
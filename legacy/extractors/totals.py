@@ -13,7 +13,7 @@ class TotalsExtractor(BaseExtractor):
 
     def extract(self, doc_id, text):
         items = []
-        for m in self.rx_total_line.finditer(text):
+        for m in self.finditer(self.rx_total_line, text):
             amt = m.group(2)
             items.append(ExtractItem(
                 item_type="money", subtype="total_amount", text_raw=m.group(0),
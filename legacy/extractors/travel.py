@@ -12,15 +12,15 @@ class TravelExtractor(BaseExtractor):
 
     def extract(self, doc_id, text):
         items = []
-        for m in self.rx_trig.finditer(text):
+        for m in self.finditer(self.rx_trig, text):
             items.append(ExtractItem(item_type="travel", subtype="travel_trigger",
                                      text_raw=m.group(0), value_norm="present",
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
-        for m in self.rx_per_km.finditer(text):
+        for m in self.finditer(self.rx_per_km, text):
             items.append(ExtractItem(item_type="travel", subtype="travel_per_km_eur",
                                      text_raw=m.group(0), value_norm=m.group(2),
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
-        for m in self.rx_flat.finditer(text):
+        for m in self.finditer(self.rx_flat, text):
             items.append(ExtractItem(item_type="travel", subtype="travel_flat_eur",
                                      text_raw=m.group(0), value_norm=m.group(2),
                                      start=m.start(), end=m.end(), extractor=self.__class__.__name__, version=self.__version__))
@@ -0,0 +1,155 @@
+"""Single-pass DOCX model read straight from ``word/document.xml``.
+
+The zip is opened once and the XML is streamed with ``lxml.etree.iterparse``;
+finished body elements are cleared as we go so memory stays flat on large files.
+Paragraph text follows python-docx ``Paragraph.text`` (``w:t``, tabs, line
+breaks, no-break hyphens), table cells follow ``_Row.cells`` (a ``gridSpan``
+cell is repeated per grid column, a ``vMerge`` continuation repeats the cell
+above). Unlike python-docx, text inside tracked insertions, fields, content
+controls and text boxes is kept; ``mc:Fallback`` duplicates are skipped.
+Like python-docx, the parser resolves no entities and loads nothing from the
+network, and keeps libxml2's depth and size limits: uploads are untrusted.
+"""
+from __future__ import annotations
+
+import zipfile
+from dataclasses import dataclass, field
+
+from lxml import etree
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+_MC_FALLBACK = "{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback"
+
+P, R, T, TBL, TR, TC = (_W + t for t in ("p", "r", "t", "tbl", "tr", "tc"))
+TAB, PTAB, BR, CR, NBH = (_W + t for t in ("tab", "ptab", "br", "cr", "noBreakHyphen"))
+GRIDSPAN, VMERGE = _W + "gridSpan", _W + "vMerge"
+
+_RUN_CHARS = {TAB: "\t", PTAB: "\t", CR: "\n", NBH: "-"}
+
+
+def join_with_offsets(parts: list[str], sep: str = "\n") -> tuple[str, list[int]]:
+    """``sep.join(parts)`` plus the start offset of each part in the result."""
+    starts, pos = [], 0
+    for p in parts:
+        starts.append(pos)
+        pos += len(p) + len(sep)
+    return sep.join(parts), starts
+
+
+@dataclass
+class DocxModel:
+    paragraphs: list[str] = field(default_factory=list)          # body paragraphs, in order (incl. empty)
+    tables: list[list[list[str]]] = field(default_factory=list)  # raw cell text per row, merges resolved
+    _stripped: list | None = field(default=None, repr=False)
+
+    @property
+    def tables_stripped(self) -> list[list[list[str]]]:
+        # computed once and shared by every reader that wants trimmed cells
+        if self._stripped is None:
+            self._stripped = [[[c.strip() for c in row] for row in t] for t in self.tables]
+        return self._stripped
+
+
+class _Table:
+    def __init__(self):
+        self.rows: list[list[str]] = []
+        self._row = None
+        self._cell = None
+
+    def start_row(self):
+        self._row = []
+
+    def start_cell(self):
+        self._cell = {"paras": [], "span": 1, "vmerge": None}
+
+    def end_cell(self):
+        c = self._cell
+        self._row.append(("\n".join(c["paras"]), c["span"], c["vmerge"]))
+        self._cell = None
+
+    def end_row(self):
+        prev = self.rows[-1] if self.rows else []
+        out = []
+        for text, span, vmerge in self._row:
+            col = len(out)
+            if vmerge == "continue" and col < len(prev):
+                text = prev[col]
+            out.extend([text] * span)
+        self.rows.append(out)
+        self._row = None
+
+
+def _drop(el):
+    el.clear(keep_tail=True)
+    parent = el.getparent()
+    if parent is not None:
+        while el.getprevious() is not None:
+            del parent[0]
+
+
+def parse_document_xml(fh) -> DocxModel:
+    model = DocxModel()
+    paras: list[list[str]] = []   # open paragraphs (text boxes nest them)
+    tables: list[_Table] = []     # open tables (cells may nest them)
+    skip = 0
+    for event, el in etree.iterparse(fh, events=("start", "end"), resolve_entities=False, no_network=True):
+        tag = el.tag
+        if tag == _MC_FALLBACK:
+            skip += 1 if event == "start" else -1
+            continue
+        if skip:
+            continue
+        if event == "start":
+            if tag == P:
+                paras.append([])
+            elif tag == TBL:
+                tables.append(_Table())
+            elif tag == TR:
+                tables[-1].start_row()
+            elif tag == TC:
+                tables[-1].start_cell()
+            continue
+
+        if tag == T:
+            if paras:
+                paras[-1].append(el.text or "")
+        elif tag in _RUN_CHARS:
+            # w:tab also appears in paragraph tab-stop definitions; only run content counts
+            if paras and el.getparent().tag == R:
+                paras[-1].append(_RUN_CHARS[tag])
+        elif tag == BR:
+            if paras and el.get(_W + "type", "textWrapping") == "textWrapping":
+                paras[-1].append("\n")
+        elif tag == GRIDSPAN:
+            if tables and tables[-1]._cell is not None:
+                tables[-1]._cell["span"] = max(int(el.get(_W + "val", "1")), 1)
+        elif tag == VMERGE:
+            if tables and tables[-1]._cell is not None:
+                tables[-1]._cell["vmerge"] = el.get(_W + "val", "continue")
+        elif tag == P:
+            text = "".join(paras.pop())
+            if tables and tables[-1]._cell is not None:
+                tables[-1]._cell["paras"].append(text)
+            else:
+                model.paragraphs.append(text)
+            if not paras and not tables:
+                _drop(el)
+        elif tag == TC:
+            tables[-1].end_cell()
+        elif tag == TR:
+            tables[-1].end_row()
+        elif tag == TBL:
+            rows = tables.pop().rows
+            # like python-docx ``Document.tables``: top-level tables only, in document order
+            if not tables:
+                model.tables.append(rows)
+                if not paras:
+                    _drop(el)
+    return model
+
+
+def load_docx(src) -> DocxModel:
+    """Parse a .docx given a path or a binary file-like object."""
+    with zipfile.ZipFile(src) as zf:
+        with zf.open("word/document.xml") as fh:
+            return parse_document_xml(fh)
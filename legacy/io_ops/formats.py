@@ -0,0 +1,118 @@
+"""Document readers registered in ``core.registry.REGISTRY["readers"]``.
+
+The reader is picked from the first bytes of the input (``detect_reader``), not
+from the file suffix, so a renamed ``.docx`` still reads as DOCX and a PDF
+upload is never decoded as text. Every reader imports its parsing library
+(PyMuPDF, lxml) on first ``read``; importing this module stays cheap.
+
+New formats: subclass ``BaseReader`` and decorate it with ``register_reader``;
+``read`` returns ``(DocumentText, tables)``.
+"""
+from __future__ import annotations
+
+import io
+import zipfile
+from pathlib import Path
+
+from typing import TYPE_CHECKING
+
+from core.registry import REGISTRY, register_reader
+
+if TYPE_CHECKING:
+    from core.document import DocumentText
+
+SNIFF_BYTES = 2048
+
+
+def _head(src, n: int = SNIFF_BYTES) -> bytes:
+    if isinstance(src, (bytes, bytearray)):
+        return bytes(src[:n])
+    with open(src, "rb") as f:
+        return f.read(n)
+
+
+def decode_text(data: bytes) -> str:
+    try:
+        return data.decode("utf-8")
+    except UnicodeDecodeError:
+        return data.decode("latin-1", errors="ignore")
+
+
+class BaseReader:
+    @classmethod
+    def sniff(cls, head: bytes, src) -> bool:
+        return False
+
+    def read(self, src, **opts) -> tuple[DocumentText, list]:
+        raise NotImplementedError
+
+
+@register_reader(name="pdf", version="1.0.0", suffixes=(".pdf",), priority=20)
+class PdfReader(BaseReader):
+    @classmethod
+    def sniff(cls, head, src):
+        # the spec tolerates junk before the header within the first 1 KiB
+        return b"%PDF-" in head[:1024]
+
+    def read(self, src, workers: int = 1, **opts):
+        from io_ops.readers import read_pdf_document
+        return read_pdf_document(src, workers=workers), []
+
+
+@register_reader(name="docx", version="1.0.0", suffixes=(".docx",), priority=10)
+class DocxReader(BaseReader):
+    @classmethod
+    def sniff(cls, head, src):
+        if not head.startswith(b"PK\x03\x04"):
+            return False
+        try:
+            with zipfile.ZipFile(io.BytesIO(src) if isinstance(src, (bytes, bytearray)) else src) as zf:
+                return "word/document.xml" in zf.namelist()
+        except zipfile.BadZipFile:
+            return False
+
+    def read(self, src, **opts):
+        from io_ops.readers import read_docx_document
+        return read_docx_document(io.BytesIO(src) if isinstance(src, (bytes, bytearray)) else src)
+
+
+@register_reader(name="txt", version="1.0.0", suffixes=(".txt",), priority=-100)
+class TxtReader(BaseReader):
+    @classmethod
+    def sniff(cls, head, src):
+        # fallback: anything without NUL bytes is treated as text
+        return b"\x00" not in head
+
+    def read(self, src, **opts):
+        from core.document import DocumentText
+        if isinstance(src, (bytes, bytearray)):
+            return DocumentText(decode_text(bytes(src))), []
+        try:
+            from io_ops.readers import read_txt_document
+            return read_txt_document(src), []
+        except UnicodeDecodeError:
+            with open(src, "r", encoding="latin-1", errors="ignore") as f:
+                return DocumentText(f.read()), []
+
+
+def readers() -> list:
+    return sorted(REGISTRY["readers"], key=lambda c: -c.priority)
+
+
+def supported_suffixes() -> tuple[str, ...]:
+    return tuple(dict.fromkeys(s for c in readers() for s in c.suffixes))
+
+
+def detect_reader(src):
+    """Reader class for a path or raw bytes; ``ValueError`` if no reader accepts it."""
+    head = _head(src)
+    for cls in readers():
+        if cls.sniff(head, src):
+            return cls
+    name = Path(src).name if isinstance(src, (str, Path)) else "<bytes>"
+    raise ValueError(f"Unsupported document type: {name}")
+
+
+def read_document(src, **opts) -> tuple[DocumentText, list]:
+    """Read a path or raw bytes with the detected reader; ``opts`` (e.g. ``workers``) go to ``read``."""
+    return detect_reader(src)().read(src, **opts)
@@ -1,43 +1,108 @@
 
-from docx import Document
-import fitz  # PyMuPDF
+import io
+from core.document import DocumentText
+
+# fitz (PyMuPDF) and lxml are imported inside the readers that need them, so
+# TXT-only runs and worker start-up do not pay for them
 
 def read_docx_text(path: str) -> str:
-    doc = Document(path)
-    parts = [p.text for p in doc.paragraphs]
-    for t in doc.tables:
-        for r in t.rows:
-            for c in r.cells:
-                parts.append(c.text)
+    from io_ops.docx_model import load_docx
+    m = load_docx(path)
+    parts = list(m.paragraphs)
+    for t in m.tables:
+        for r in t:
+            parts.extend(r)
     return "\n".join(parts)
 
-def read_pdf_text(path: str) -> str:
-    doc = fitz.open(path)
-    texts = []
-    for page in doc:
-        texts.append(page.get_text("text"))
-    return "\n".join(texts)
+# pages per worker task; small PDFs are not worth the process start-up
+PDF_PAGES_PER_TASK = 16
+
+def _open_pdf(src):
+    import fitz  # PyMuPDF
+    if isinstance(src, (bytes, bytearray)):
+        return fitz.open(stream=bytes(src), filetype="pdf")
+    return fitz.open(src)
+
+def _pdf_page_range(args) -> list[str]:
+    # runs in a worker process: every worker opens the document itself
+    path, start, stop = args
+    with _open_pdf(path) as doc:
+        return [doc.load_page(i).get_text("text") for i in range(start, stop)]
+
+def _iter_page_texts(path, workers: int):
+    with _open_pdf(path) as doc:
+        n = doc.page_count
+        # in-memory PDFs (uploads) are always decoded serially
+        if workers <= 1 or n < 2 * PDF_PAGES_PER_TASK or isinstance(path, (bytes, bytearray)):
+            for i in range(n):
+                yield doc.load_page(i).get_text("text")
+            return
+    from concurrent.futures import ProcessPoolExecutor
+    ranges = [(path, s, min(s + PDF_PAGES_PER_TASK, n)) for s in range(0, n, PDF_PAGES_PER_TASK)]
+    with ProcessPoolExecutor(max_workers=min(workers, len(ranges))) as ex:
+        # map() yields in submission order, so pages come back in page order
+        for texts in ex.map(_pdf_page_range, ranges):
+            yield from texts
+
+def iter_pdf_pages(path, workers: int = 1):
+    """Yield ``(page_no, text, char_offset)`` per page, decoding one page at a time.
+
+    ``page_no`` is 1-based; ``char_offset`` is where the page starts in the
+    "\n"-joined document text returned by ``read_pdf_text``. With ``workers > 1``
+    page ranges are decoded in parallel worker processes and merged in order.
+    ``path`` may also be the PDF bytes.
+    """
+    offset = 0
+    for i, text in enumerate(_iter_page_texts(path, workers)):
+        yield i + 1, text, offset
+        offset += len(text) + 1
+
+def read_pdf_pages(path, workers: int = 1) -> tuple[str, list[int]]:
+    """Return (text, page_starts) where page_starts[i] is the offset of page i+1."""
+    buf = io.StringIO()
+    starts = []
+    for page_no, text, offset in iter_pdf_pages(path, workers):
+        if page_no > 1:
+            buf.write("\n")
+        starts.append(offset)
+        buf.write(text)
+    return buf.getvalue(), starts
+
+def read_pdf_text(path, workers: int = 1) -> str:
+    return read_pdf_pages(path, workers)[0]
+
+def read_pdf_document(path, workers: int = 1) -> DocumentText:
+    text, starts = read_pdf_pages(path, workers)
+    return DocumentText(text, page_starts=starts)
 
 def read_txt(path: str) -> str:
     with open(path, "r", encoding="utf-8") as f:
         return f.read()
 
+def read_txt_document(path: str) -> DocumentText:
+    return DocumentText(read_txt(path))
 
-def read_docx_text_and_tables(path: str):
-    from docx import Document
-    doc = Document(path)
-    parts = []
-    tables = []
-    # paragraphs
-    for p in doc.paragraphs:
-        if p.text:
-            parts.append(p.text)
-    # tables
-    for t in doc.tables:
-        t_rows = []
-        for r in t.rows:
-            t_rows.append([c.text.strip() for c in r.cells])
+
+def docx_text_and_tables(m) -> tuple[str, list, list[int]]:
+    """Text/tables layout used by the pipeline: non-empty paragraphs, then one
+    " | "-joined line per table row. Returns (text, tables, para_starts)."""
+    parts = [p for p in m.paragraphs if p]
+    for raw, t in zip(m.tables, m.tables_stripped):
+        for raw_row, row in zip(raw, t):
             # also add to parts (for text search fallback)
-            parts.append(" | ".join([c.text.strip() for c in r.cells if c.text]))
-        tables.append(t_rows)
-    return "\n".join(parts), tables
+            parts.append(" | ".join(c for c, r in zip(row, raw_row) if r))
+    from io_ops.docx_model import join_with_offsets
+    text, starts = join_with_offsets(parts)
+    return text, m.tables_stripped, starts
+
+def read_docx(path) -> tuple[str, list, list[int]]:
+    from io_ops.docx_model import load_docx
+    return docx_text_and_tables(load_docx(path))
+
+def read_docx_document(path) -> tuple[DocumentText, list]:
+    text, tables, starts = read_docx(path)
+    return DocumentText(text, para_starts=starts), tables
+
+def read_docx_text_and_tables(path: str):
+    text, tables, _ = read_docx(path)
+    return text, tables
@@ -1,31 +1,43 @@
 
 import pandas as pd
 from core.schemas import ExtractBatch
+from core.spans import to_columns
+from core.document import DocumentText
+from core.spanframe import span_dtypes
 
-def batches_to_excel(batches: list[ExtractBatch], out_path: str):
-    rows = []
-    for b in batches:
-        for it in b.items:
-            rows.append({
-                "doc_id": b.doc_id,
-                "type": it.item_type,
-                "subtype": it.subtype,
-                "text_raw": it.text_raw,
-                "value_norm": it.value_norm,
-                "currency": it.currency,
-                "unit": it.unit,
-                "page": it.page, "para": it.para,
-                "start": it.start, "end": it.end,
-                "confidence": it.confidence,
-                "extractor": it.extractor,
-                "version": it.version
-            })
-    df = pd.DataFrame(rows)
+def locate_spans(df: pd.DataFrame, doc: DocumentText) -> pd.DataFrame:
+    """Fill missing ``page``/``para`` from ``start`` offsets in one vectorized pass."""
+    if df.empty:
+        return df
+    pages, paras = doc.locate(pd.to_numeric(df["start"], errors="coerce"))
+    for col, vals in (("page", pages), ("para", paras)):
+        if vals is None:
+            continue
+        located = pd.array(vals, dtype="Int64")
+        located[vals == 0] = pd.NA
+        cur = df[col].astype("Int64")
+        df[col] = cur.where(cur.notna(), located)
+    return df
+
+def batches_to_df(batches: list[ExtractBatch], doc: DocumentText | None = None) -> pd.DataFrame:
+    """Spans frame of ``ExtractBatch``es and ``core.spans.SpanBuffer``s, built from their columns in one step.
+
+    Columns follow the spans schema (``core.spanframe.span_dtypes``): categories, strings, ``Int64`` offsets.
+    """
+    cols = to_columns(batches)
+    df = pd.DataFrame(cols) if cols["doc_id"] else pd.DataFrame()
     if df.empty:
         df = pd.DataFrame(columns=["doc_id","type","subtype","text_raw","value_norm","currency","unit","page","para","start","end","confidence","extractor","version","span_id"])
     else:
         # assign a simple span_id per row: sp_000001, sp_000002, ...
         df = df.reset_index(drop=True)
         df["span_id"] = ["sp_" + str(i+1).zfill(6) for i in range(len(df))]
+        if doc is not None:
+            df = locate_spans(df, doc)
+        span_dtypes(df)
+    return df
+
+def batches_to_excel(batches: list[ExtractBatch], out_path: str, doc: DocumentText | None = None):
+    df = batches_to_df(batches, doc)
     df.to_excel(out_path, index=False, sheet_name="Spans")
     return df
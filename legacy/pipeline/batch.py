@@ -0,0 +1,179 @@
+"""Batch runner: process whole contract folders in a process pool.
+
+Each document goes through ``runner_api.process_document`` in a worker process;
+results are collected into one workbook with a ``doc_id`` column on every sheet
+and a ``Failures`` sheet for documents that could not be processed.
+
+    python -m pipeline.batch data/input --workers 8 --out results/batch.xlsx
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import traceback
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from io_ops.formats import supported_suffixes
+from pipeline.logger import get_logger
+from pipeline.runner_api import process_document
+
+# directory scans pick files by suffix; the reader itself is still chosen by content
+SUPPORTED_SUFFIXES = supported_suffixes()
+# openpyxl limit is 1_048_576 rows including the header
+EXCEL_MAX_ROWS = 1_048_575
+
+
+def collect_documents(paths_or_dir) -> list[tuple[str, str]]:
+    """Expand a directory, a single path or a list of both into ``(path, doc_id)`` pairs.
+
+    A file found in a directory is named by its path below that directory,
+    without the suffix (``a/vertrag``); a file given directly by its stem.
+    Names that still collide (``vertrag.pdf`` next to ``vertrag.docx``) keep
+    their suffix, and any left over get ``~2``, ``~3`` … in path order.
+    """
+    if isinstance(paths_or_dir, (str, os.PathLike)):
+        paths_or_dir = [paths_or_dir]
+    found = []  # (path, name without suffix, name with suffix)
+    for p in map(Path, paths_or_dir):
+        if p.is_dir():
+            for f in sorted(p.rglob("*")):
+                if f.is_file() and f.suffix.lower() in SUPPORTED_SUFFIXES:
+                    rel = f.relative_to(p)
+                    found.append((str(f), rel.with_suffix("").as_posix(), rel.as_posix()))
+        else:
+            found.append((str(p), p.stem, p.name))
+    stems = Counter(stem for _, stem, _ in found)
+    names = [stem if stems[stem] == 1 else name for _, stem, name in found]
+    seen = Counter()
+    out = []
+    for (path, _, _), name in zip(found, names):
+        seen[name] += 1
+        out.append((path, name if seen[name] == 1 else f"{name}~{seen[name]}"))
+    return out
+
+
+def collect_paths(paths_or_dir) -> list[str]:
+    """Expand a directory, a single path or a list of both into document paths."""
+    return [path for path, _ in collect_documents(paths_or_dir)]
+
+
+def _process_path(path: str, doc_id: str, pdf_workers: int | None = None) -> dict:
+    # top-level so it can be pickled into worker processes
+    try:
+        res = process_document(path, pdf_workers=pdf_workers, doc_id=doc_id)
+        res["path"] = path
+        res["ok"] = True
+        return res
+    except Exception as e:
+        return {"path": path, "doc_id": doc_id, "ok": False,
+                "error": f"{type(e).__name__}: {e}", "traceback": traceback.format_exc()}
+
+
+def _with_doc_id(df, doc_id):
+    if df is None or df.empty:
+        return None
+    df = df.copy()
+    if "doc_id" in df.columns:
+        df["doc_id"] = doc_id
+    else:
+        df.insert(0, "doc_id", doc_id)
+    return df
+
+
+def _concat(frames, columns=None, concat=None):
+    import pandas as pd
+    frames = [f for f in frames if f is not None]
+    if not frames:
+        return pd.DataFrame(columns=columns or ["doc_id"])
+    return concat(frames) if concat else pd.concat(frames, ignore_index=True)
+
+
+def _to_excel_chunked(df, xw, sheet_name: str):
+    # Spill into Sheet_2, Sheet_3 … when a sheet would exceed Excel's row limit
+    if len(df) <= EXCEL_MAX_ROWS:
+        df.to_excel(xw, index=False, sheet_name=sheet_name)
+        return
+    for i, start in enumerate(range(0, len(df), EXCEL_MAX_ROWS)):
+        name = sheet_name if i == 0 else f"{sheet_name}_{i+1}"
+        df.iloc[start:start + EXCEL_MAX_ROWS].to_excel(xw, index=False, sheet_name=name)
+
+
+def write_batch_excel(batch: dict, out_path: str):
+    import pandas as pd
+    with pd.ExcelWriter(out_path, engine="openpyxl") as xw:
+        _to_excel_chunked(batch["spans"], xw, "Spans")
+        _to_excel_chunked(batch["compliance"], xw, "Compliance")
+        _to_excel_chunked(batch["summary"], xw, "ContractSummary")
+        _to_excel_chunked(batch["summary_de"], xw, "ContractSummary_DE")
+        batch["failures"].to_excel(xw, index=False, sheet_name="Failures")
+    return out_path
+
+
+def run_batch(paths_or_dir, workers: int | None = None, output_excel: str | None = None) -> dict:
+    """Run the pipeline over many documents.
+
+    ``workers`` defaults to ``os.cpu_count()``; ``workers <= 1`` runs in-process.
+    Returns a dict of combined DataFrames (``spans``, ``compliance``, ``summary``,
+    ``summary_de``, ``failures``) and writes them to ``output_excel`` if given.
+    """
+    import pandas as pd
+    from core.spanframe import concat_spans
+    logger = get_logger()
+    docs = collect_documents(paths_or_dir)
+    paths = [path for path, _ in docs]
+    workers = workers or os.cpu_count() or 1
+    workers = max(1, min(workers, len(paths) or 1))
+
+    results: list[dict | None] = [None] * len(paths)
+    if workers == 1:
+        for i, (path, doc_id) in enumerate(docs):
+            results[i] = _process_path(path, doc_id)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            # documents already fill the cores; no nested page-parallel PDF pools
+            futs = {ex.submit(_process_path, path, doc_id, 1): i for i, (path, doc_id) in enumerate(docs)}
+            for fut in as_completed(futs):
+                i = futs[fut]
+                try:
+                    results[i] = fut.result()
+                except Exception as e:
+                    # worker died (e.g. BrokenProcessPool) — record and keep going
+                    results[i] = {"path": paths[i], "doc_id": docs[i][1], "ok": False,
+                                  "error": f"{type(e).__name__}: {e}", "traceback": ""}
+
+    ok = [r for r in results if r["ok"]]
+    failed = [r for r in results if not r["ok"]]
+    for r in failed:
+        logger.error("batch: %s failed: %s", r["path"], r["error"])
+
+    batch = {
+        # categories united across documents (core.spanframe.concat_spans)
+        "spans": _concat([_with_doc_id(r["spans"], r["doc_id"]) for r in ok], concat=concat_spans),
+        "compliance": _concat([_with_doc_id(r["compliance"], r["doc_id"]) for r in ok]),
+        "summary": _concat([_with_doc_id(r["summary"], r["doc_id"]) for r in ok]),
+        "summary_de": _concat([_with_doc_id(r["summary_de"], r["doc_id"]) for r in ok]),
+        "failures": pd.DataFrame([{k: r[k] for k in ("doc_id", "path", "error")} for r in failed],
+                                 columns=["doc_id", "path", "error"]),
+    }
+    logger.info("batch: %d documents, %d ok, %d failed (workers=%d)",
+                len(paths), len(ok), len(failed), workers)
+    if output_excel:
+        write_batch_excel(batch, output_excel)
+    return batch
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Run the contract pipeline over many documents.")
+    ap.add_argument("inputs", nargs="+", help="files and/or directories (.docx/.pdf/.txt)")
+    ap.add_argument("-w", "--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    ap.add_argument("-o", "--out", default="results/batch.xlsx", help="combined output workbook")
+    args = ap.parse_args(argv)
+    batch = run_batch(args.inputs, workers=args.workers, output_excel=args.out)
+    print(f"✅ Done → {args.out} ({len(batch['failures'])} failed)")
+    return 0 if batch["failures"].empty else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,246 @@
+"""Content-addressed result cache for the pipeline.
+
+Two tiers: an in-process LRU (``MemoryLRU``) in front of an on-disk pickle store
+(``DiskStore``) that evicts least-recently-used entries once it grows past a
+byte limit. Keys are built by ``pipeline_key`` from the SHA-256 of the input
+bytes, the registered extractors (``__extractor_name__``/``__version__`` plus a
+digest of their data files, e.g. the lexicon) and a hash of
+``rules/policies.yml`` — any of those changing yields a new key.
+"""
+from __future__ import annotations
+
+import copy
+import hashlib
+import os
+import pickle
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+
+import yaml
+
+from pipeline.logger import get_logger
+
+# Bump when the shape of cached values changes
+CACHE_FORMAT = "4"
+
+_DEFAULTS = {"enabled": True, "dir": "data/cache", "memory_items": 256, "max_disk_mb": 512}
+
+
+def content_digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_digest(path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def policies_digest(path="rules/policies.yml") -> str:
+    try:
+        return file_digest(path)
+    except OSError:
+        return "none"
+
+
+def extractor_version(cls) -> str:
+    """``__version__``, plus the digest of the extractor's data files when it has any."""
+    ver = getattr(cls, "__version__", "")
+    data = cls.data_digest() if hasattr(cls, "data_digest") else ""
+    return f"{ver}+{data[:16]}" if data else ver
+
+
+def extractors_signature(extractor_classes) -> list[str]:
+    return sorted(f"{getattr(c, '__extractor_name__', c.__name__)}@{extractor_version(c)}"
+                  for c in extractor_classes)
+
+
+def pipeline_key(data_digest: str, extractor_classes, policies_path="rules/policies.yml", extra=()) -> str:
+    parts = [CACHE_FORMAT, data_digest, *extractors_signature(extractor_classes),
+             "policies=" + policies_digest(policies_path), *map(str, extra)]
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+class MemoryLRU:
+    def __init__(self, max_items: int = 64):
+        self.max_items = max_items
+        self._data = OrderedDict()
+
+    def get(self, key):
+        if key not in self._data:
+            return None
+        self._data.move_to_end(key)
+        return copy.deepcopy(self._data[key])
+
+    def put(self, key, value):
+        self._data[key] = copy.deepcopy(value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_items:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        self._data.clear()
+
+    def __len__(self):
+        return len(self._data)
+
+
+class DiskStore:
+    """Pickle files under ``root``; mtime is bumped on read and used for LRU eviction.
+
+    The store's size is scanned once and then kept as a running total, so a put
+    only lists the directory when the total goes over ``max_bytes``. Eviction
+    rescans, which also picks up entries written by other processes.
+    """
+
+    def __init__(self, root, max_bytes: int = 512 * 1024 * 1024):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._total = None  # bytes on disk; None until the first scan
+
+    def _path(self, key):
+        return self.root / key[:2] / f"{key}.pkl"
+
+    def get(self, key):
+        p = self._path(key)
+        try:
+            with open(p, "rb") as f:
+                value = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # truncated/corrupt entry (e.g. interrupted write on another platform)
+            get_logger().warning("cache: dropping unreadable entry %s", p)
+            self._unlink(p)
+            return None
+        try:
+            os.utime(p)
+        except OSError:
+            pass
+        return value
+
+    def put(self, key, value):
+        p = self._path(key)
+        p.parent.mkdir(parents=True, exist_ok=True)
+        total = self.size() if self._total is None else self._total
+        fd, tmp = tempfile.mkstemp(dir=p.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            written = os.path.getsize(tmp)
+            replaced = _file_size(p)
+            os.replace(tmp, p)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+        self._total = total + written - replaced
+        if self._total > self.max_bytes:
+            self.evict()
+
+    def _unlink(self, p: Path):
+        size = _file_size(p)
+        p.unlink(missing_ok=True)
+        if self._total is not None:
+            self._total = max(0, self._total - size)
+
+    def entries(self):
+        out = []
+        if not self.root.exists():
+            return out
+        for p in self.root.glob("*/*.pkl"):
+            try:
+                st = p.stat()
+            except FileNotFoundError:
+                continue
+            out.append((st.st_mtime, st.st_size, p))
+        return out
+
+    def size(self) -> int:
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        if total > self.max_bytes:
+            for _, size, p in sorted(entries):
+                p.unlink(missing_ok=True)
+                total -= size
+                if total <= self.max_bytes:
+                    break
+        self._total = total
+
+    def clear(self):
+        for _, _, p in self.entries():
+            p.unlink(missing_ok=True)
+        self._total = 0
+
+
+def _file_size(p: Path) -> int:
+    try:
+        return p.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+class ResultCache:
+    """Memory LRU in front of an optional disk store; disk hits are promoted to memory."""
+
+    def __init__(self, memory: MemoryLRU | None = None, disk: DiskStore | None = None):
+        self.memory = memory if memory is not None else MemoryLRU()
+        self.disk = disk
+        self.hits = {"memory": 0, "disk": 0, "miss": 0}
+
+    def get(self, key):
+        value = self.memory.get(key)
+        if value is not None:
+            self.hits["memory"] += 1
+            return value
+        if self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.hits["disk"] += 1
+                self.memory.put(key, value)
+                return value
+        self.hits["miss"] += 1
+        return None
+
+    def put(self, key, value):
+        self.memory.put(key, value)
+        if self.disk is not None:
+            try:
+                self.disk.put(key, value)
+            except Exception:
+                get_logger().exception("cache: disk write failed for %s", key)
+
+    def clear(self):
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+
+_default_cache = None
+
+
+def load_cache_config(path="pipeline/config.yml") -> dict:
+    cfg = dict(_DEFAULTS)
+    try:
+        cfg.update((yaml.safe_load(open(path, "r", encoding="utf-8")) or {}).get("cache") or {})
+    except FileNotFoundError:
+        pass
+    return cfg
+
+
+def get_default_cache() -> ResultCache | None:
+    """Process-wide cache configured from the ``cache:`` section of config.yml (None if disabled)."""
+    global _default_cache
+    if _default_cache is None:
+        cfg = load_cache_config()
+        if not cfg.get("enabled", True):
+            _default_cache = False
+            return None
+        disk = DiskStore(cfg["dir"], int(float(cfg["max_disk_mb"]) * 1024 * 1024)) if cfg.get("dir") else None
+        _default_cache = ResultCache(MemoryLRU(int(cfg["memory_items"])), disk)
+    return _default_cache or None
@@ -0,0 +1,276 @@
+"""Long-lived set of extractor instances.
+
+``ExtractorSet.from_config`` resolves ``use_extractors`` from config.yml against
+``REGISTRY`` and constructs every enabled extractor once, with whatever it
+compiles in ``__init__``; ``extract(doc_id, text)`` runs them all over one
+document with a shared keyword scan (``core.scan``). Build one per process
+(batch worker, API, UI session) and reuse it for every document;
+``shared_extractor_set(cfg)`` keeps one per distinct configuration.
+
+``mode="parallel"`` (config.yml ``extraction.mode``) runs the extractors on a
+pool of ``workers`` processes and kills a worker once its extractor has run
+longer than its time budget: a runaway pattern costs its budget and shows up in
+``diagnostics`` instead of stalling the document. A regex cannot be interrupted
+inside a thread, hence processes. The pool lives as long as the set: each
+worker constructs its own instances of the set's classes once, receives each
+document once and shares one scan between the extractors it runs on it. Only
+a killed (or crashed) worker is replaced. Workers are started with
+``forkserver`` (``spawn`` where that is missing), never forked from this
+process, so they do not inherit locks held by its other threads; extractor
+classes must therefore be importable by name. Budgets are not enforced in
+serial mode. Parallel mode is meant for the batch runner and the API; keep the
+UI process serial, where a pool would outlive Streamlit's reruns.
+
+``incremental=True`` (``extraction.incremental``) lets the pipeline re-extract a
+revised document only around its changes, for extractors that declare a
+``context_margin`` (``pipeline.incremental``, ``pipeline.stages.extract_stage``).
+
+Instances hold the current document's scan while extracting: use one set per
+thread.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import time
+from multiprocessing.connection import wait
+
+from core.registry import load_extractors
+from core.scan import DocumentScan
+
+DEFAULT_BUDGET_S = 30.0
+# a worker that has not picked up its task after this long (startup included) is replaced
+STARTUP_S = 60.0
+
+
+def enabled_classes(cfg: dict) -> list:
+    """Registered extractor classes named in ``cfg["use_extractors"]``, in registry order."""
+    enabled = set(cfg.get("use_extractors", []))
+    return [c for c in load_extractors() if c.__extractor_name__ in enabled]
+
+
+def _name(ext) -> str:
+    cls = type(ext)
+    return getattr(cls, "__extractor_name__", cls.__name__)
+
+
+def _worker_main(classes, conn):
+    # runs in a pool process: ("doc", doc_id, text) loads a document, ("run", i)
+    # extracts with instance i and answers ("started", i, None), then (status, i, value)
+    instances = []
+    for cls in classes:
+        try:
+            instances.append(cls())
+        except Exception as e:
+            instances.append(e)
+    doc_id = text = scan = None
+    while True:
+        try:
+            msg = conn.recv()
+        except (EOFError, OSError):
+            return
+        if msg[0] == "doc":
+            _, doc_id, text = msg
+            scan = DocumentScan(text)
+            continue
+        i = msg[1]
+        conn.send(("started", i, None))
+        try:
+            ext = instances[i]
+            if isinstance(ext, Exception):
+                raise ext
+            result = ("ok", i, scan.attach(ext).extract(doc_id, text))
+        except Exception as e:
+            result = ("error", i, e)
+        try:
+            conn.send(result)
+        except Exception as e:  # unpicklable batch or exception
+            conn.send(("error", i, RuntimeError(f"{type(e).__name__}: {e}")))
+
+
+class _Worker:
+    """A pool process and its end of the pipe; ``doc`` is the run whose document it holds."""
+
+    def __init__(self, ctx, classes):
+        self.conn, child = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(classes, child), daemon=True)
+        self.process.start()
+        child.close()
+        self.doc = None
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+class ExtractorSet:
+    """Constructed extractors, reused across documents.
+
+    With a ``logger``, extractors that fail to construct or to extract are
+    logged and skipped (the UI's behaviour); without one the error propagates.
+    Extractors over budget (parallel mode) are always skipped, never raised.
+    After each run, ``diagnostics`` holds one dict per extractor: ``extractor``,
+    ``status`` ("ok", "error" or "timeout"), ``seconds`` and ``error``.
+    """
+
+    def __init__(self, classes, logger=None, mode: str = "serial", workers: int | None = None,
+                 budget_s: float | None = None, budgets_s: dict | None = None, incremental: bool = False):
+        if mode not in ("serial", "parallel"):
+            raise ValueError(f"Unknown extraction mode: {mode}")
+        self.logger = logger
+        self.mode = mode
+        self.workers = max(1, int(workers or multiprocessing.cpu_count() or 1))
+        self.budget_s = float(budget_s or DEFAULT_BUDGET_S)
+        self.budgets_s = {k: float(v) for k, v in (budgets_s or {}).items()}
+        self.incremental = bool(incremental)
+        self.diagnostics = []
+        self._pool: list[_Worker] = []
+        self.instances = []
+        for cls in classes:
+            try:
+                self.instances.append(cls())
+            except Exception:
+                if logger is None:
+                    raise
+                logger.exception("Extractor init failed: %s", getattr(cls, "__name__", cls))
+
+    @classmethod
+    def from_config(cls, cfg: dict, logger=None) -> ExtractorSet:
+        ex = cfg.get("extraction") or {}
+        return cls(enabled_classes(cfg), logger=logger, mode=ex.get("mode", "serial"),
+                   workers=ex.get("workers"), budget_s=ex.get("budget_s"), budgets_s=ex.get("budgets_s"),
+                   incremental=ex.get("incremental", False))
+
+    @property
+    def classes(self) -> list:
+        return [type(e) for e in self.instances]
+
+    def __iter__(self):
+        return iter(self.instances)
+
+    def __len__(self):
+        return len(self.instances)
+
+    def budget(self, ext) -> float:
+        return self.budgets_s.get(_name(ext), self.budget_s)
+
+    def extract(self, doc_id: str, text: str) -> list:
+        """One ``ExtractBatch`` per extractor; skipped extractors are left out."""
+        return [b for b in self.run(doc_id, text) if b is not None]
+
+    def run(self, doc_id: str, text: str, instances=None) -> list:
+        """Batches of ``instances`` (default: all) in order, ``None`` where an extractor was skipped."""
+        instances = self.instances if instances is None else list(instances)
+        self.diagnostics = []
+        if self.mode == "parallel" and instances:
+            return self._run_parallel(doc_id, text, instances)
+        scan = DocumentScan(text)
+        out = []
+        for ext in instances:
+            t0 = time.perf_counter()
+            try:
+                out.append(scan.attach(ext).extract(doc_id, text))
+                self._report(ext, "ok", time.perf_counter() - t0)
+            except Exception as e:
+                self._report(ext, "error", time.perf_counter() - t0, e)
+                if self.logger is None:
+                    raise
+                self.logger.exception("Extractor run failed: %s", type(ext).__name__)
+                out.append(None)
+        return out
+
+    def _report(self, ext, status, seconds, error=None):
+        self.diagnostics.append({"extractor": _name(ext), "status": status, "seconds": round(seconds, 3),
+                                 "error": "" if error is None else f"{type(error).__name__}: {error}"})
+
+    def _pool_context(self):
+        methods = multiprocessing.get_all_start_methods()
+        return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+    def close(self):
+        """Stop the worker pool of parallel mode (it is restarted on the next run)."""
+        for w in self._pool:
+            w.kill()
+        self._pool = []
+
+    def _run_parallel(self, doc_id, text, instances):
+        index = {id(e): k for k, e in enumerate(self.instances)}
+        run = object()  # the document of this run, sent once to each worker that gets a task
+        out, diag = [None] * len(instances), [None] * len(instances)
+        pending = list(enumerate(instances))
+        busy = {}  # worker -> [position in instances, assigned at, started at or None]
+
+        def retire(w):
+            w.kill()
+            self._pool.remove(w)
+            busy.pop(w, None)
+
+        try:
+            while pending or busy:
+                while len(self._pool) < self.workers:
+                    self._pool.append(_Worker(self._pool_context(), self.classes))
+                for w in self._pool:
+                    if pending and w not in busy:
+                        i, ext = pending.pop(0)
+                        if w.doc is not run:
+                            w.conn.send(("doc", doc_id, text))
+                            w.doc = run
+                        w.conn.send(("run", index[id(ext)]))
+                        busy[w] = [i, time.perf_counter(), None]
+                deadline = min(t0 + self.budget(instances[i]) if t0 is not None else sent + STARTUP_S
+                               for i, sent, t0 in busy.values())
+                by_conn = {w.conn: w for w in busy}
+                for conn in wait(list(by_conn), timeout=max(0.0, deadline - time.perf_counter())):
+                    w = by_conn[conn]
+                    i = busy[w][0]
+                    try:
+                        status, _, value = conn.recv()
+                    except (EOFError, OSError):  # worker died without answering
+                        w.process.join()
+                        diag[i] = ("error", 0.0, RuntimeError(f"worker exited with code {w.process.exitcode}"))
+                        retire(w)
+                        continue
+                    if status == "started":
+                        busy[w][2] = time.perf_counter()
+                        continue
+                    diag[i] = (status, time.perf_counter() - busy.pop(w)[2], None if status == "ok" else value)
+                    if status == "ok":
+                        out[i] = value
+                now = time.perf_counter()
+                for w, (i, sent, t0) in list(busy.items()):
+                    if t0 is not None and now - t0 >= self.budget(instances[i]):
+                        diag[i] = ("timeout", now - t0, TimeoutError(f"exceeded {self.budget(instances[i]):g}s budget"))
+                        retire(w)
+                    elif t0 is None and now - sent >= STARTUP_S:
+                        diag[i] = ("error", now - sent, RuntimeError(f"worker did not start within {STARTUP_S:g}s"))
+                        retire(w)
+        finally:
+            # workers interrupted mid-task are in an unknown state
+            for w in list(busy):
+                retire(w)
+        first_error = None
+        for ext, (status, seconds, err) in zip(instances, diag):
+            self._report(ext, status, seconds, err)
+            if status == "error":
+                if self.logger is None:
+                    first_error = first_error or err
+                else:
+                    self.logger.error("Extractor run failed: %s: %s", type(ext).__name__, err)
+            elif status == "timeout" and self.logger is not None:
+                self.logger.warning("Extractor cancelled: %s: %s", type(ext).__name__, err)
+        if first_error is not None:
+            raise first_error
+        return out
+
+
+# (use_extractors, extraction settings) -> ExtractorSet, per process
+_SHARED = {}
+
+
+def shared_extractor_set(cfg: dict) -> ExtractorSet:
+    """The process-wide ``ExtractorSet`` for ``cfg``'s ``use_extractors`` and ``extraction``, built on first use."""
+    key = (tuple(cfg.get("use_extractors", [])), repr(sorted((cfg.get("extraction") or {}).items())))
+    es = _SHARED.get(key)
+    if es is None:
+        es = _SHARED[key] = ExtractorSet.from_config(cfg)
+    return es
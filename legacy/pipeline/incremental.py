@@ -0,0 +1,147 @@
+"""Incremental re-extraction for revised documents.
+
+When an amended version of a document arrives, ``revise_spans`` re-runs an
+extractor only around what changed: the new text is diffed against the previous
+version line by line (``difflib``), every changed region is widened by the
+extractor's ``context_margin`` on both sides, and the extractor runs on those
+zones (plus one more margin of context each side). Spans of the previous
+version that start outside the zones are carried over with shifted offsets, so
+a revision costs in proportion to the size of the change, not of the document.
+
+Only extractors that declare ``context_margin`` take part: every span they
+produce must depend on the text within that many characters of it (longest
+match plus keyword window), and not on e.g. "first match in the document".
+Their spans come out in text order (``in_text_order``); incremental mode puts
+full runs of the same extractors in that order too, so a document gets the same
+spans whether it was extracted fresh or as a revision.
+
+``extraction.incremental`` in config.yml switches the mode on for the pipeline;
+the previous version of a document (by ``doc_id``) and its batches are kept in
+the result cache (``save_revision``/``load_revision``).
+"""
+from __future__ import annotations
+
+import difflib
+import hashlib
+from bisect import bisect_right
+
+from core.context import DocumentContext
+from core.scan import DocumentScan
+from core.spans import FIELDS, SpanBuffer
+
+REVISION_FORMAT = "1"
+
+
+def context_margin(ext) -> int | None:
+    """The extractor's ``context_margin``, or None when it must see the whole text."""
+    m = getattr(ext, "context_margin", None)
+    return None if m is None else int(m)
+
+
+def as_buffer(batch) -> SpanBuffer:
+    """``batch`` (``SpanBuffer`` or ``ExtractBatch``) as a ``SpanBuffer``."""
+    if isinstance(batch, SpanBuffer):
+        return batch
+    buf = SpanBuffer(batch.doc_id)
+    buf.extend(batch)
+    return buf
+
+
+def in_text_order(batch) -> SpanBuffer:
+    """Spans of ``batch`` sorted by ``(start, end)``; ties keep the extractor's order."""
+    buf = as_buffer(batch)
+    order = sorted(range(len(buf)), key=lambda i: (buf.start[i], buf.end[i]))
+    out = SpanBuffer(buf.doc_id)
+    for f in FIELDS:
+        col = getattr(buf, f)
+        getattr(out, f).extend([col[i] for i in order])
+    return out
+
+
+def text_changes(old: str, new: str) -> list[tuple[str, int, int, int, int]]:
+    """``difflib`` opcodes ``(tag, o1, o2, n1, n2)`` between the lines of ``old`` and ``new``, in characters.
+
+    No autojunk: blank and boilerplate lines repeat throughout a contract, and
+    treating them as junk would turn a one-line edit into one large change.
+    """
+    a, b = DocumentContext.of(old), DocumentContext.of(new)
+    oa, ob = a.line_starts, b.line_starts
+    return [(tag, oa[i1], oa[i2], ob[j1], ob[j2])
+            for tag, i1, i2, j1, j2 in difflib.SequenceMatcher(None, a.lines, b.lines, autojunk=False).get_opcodes()]
+
+
+def _zones(changes, margin: int, size: int) -> list[tuple[int, int]]:
+    zones = []
+    for tag, _, _, n1, n2 in changes:
+        if tag == "equal":
+            continue
+        zs, ze = max(0, n1 - margin), min(size, n2 + margin)
+        if zones and zs <= zones[-1][1]:
+            zones[-1] = (zones[-1][0], max(zones[-1][1], ze))
+        else:
+            zones.append((zs, ze))
+    return zones
+
+
+def revise_spans(ext, doc_id: str, old_text: str, old_batch, new_text: str, changes=None) -> SpanBuffer | None:
+    """``ext``'s spans of ``new_text`` from those of ``old_text`` and the changed zones only.
+
+    None when ``ext`` has no ``context_margin`` or the old spans lack offsets:
+    run the extractor on the whole text instead.
+    """
+    margin = context_margin(ext)
+    if margin is None:
+        return None
+    old = as_buffer(old_batch)
+    if any(s is None for s in old.start):
+        return None
+    if changes is None:
+        changes = text_changes(old_text, new_text)
+    zones = _zones(changes, margin, len(new_text))
+    zone_starts = [zs for zs, _ in zones]
+
+    def in_zone(pos):
+        i = bisect_right(zone_starts, pos) - 1
+        return i >= 0 and pos < zones[i][1]
+
+    out = SpanBuffer(doc_id)
+    cols = [(getattr(out, f), f) for f in FIELDS]
+
+    def keep(buf, i, shift):
+        for col, f in cols:
+            v = getattr(buf, f)[i]
+            col.append(v + shift if f in ("start", "end") and v is not None else v)
+
+    # unchanged regions: spans clear of every zone, moved by their block's shift
+    blocks = [(o1, o2, n1 - o1) for tag, o1, o2, n1, _ in changes if tag == "equal"]
+    block_starts = [o1 for o1, _, _ in blocks]
+    for i, s in enumerate(old.start):
+        j = bisect_right(block_starts, s) - 1
+        if j < 0 or s >= blocks[j][1]:
+            continue  # in a replaced or deleted region
+        if not in_zone(s + blocks[j][2]):
+            keep(old, i, blocks[j][2])
+
+    # changed zones: re-extract with one margin of context on each side
+    for zs, ze in zones:
+        ws, we = max(0, zs - margin), min(len(new_text), ze + margin)
+        piece = new_text[ws:we]
+        fresh = as_buffer(DocumentScan(piece).attach(ext).extract(doc_id, piece))
+        for i, s in enumerate(fresh.start):
+            if s is not None and zs <= s + ws < ze:
+                keep(fresh, i, ws)
+    return in_text_order(out.validate())
+
+
+def _revision_key(doc_id: str) -> str:
+    return hashlib.sha256(f"revision\n{REVISION_FORMAT}\n{doc_id}".encode("utf-8")).hexdigest()
+
+
+def load_revision(store, doc_id: str) -> dict | None:
+    """``{"text": str, "batches": {extractor name: (version, batch)}}`` last saved for ``doc_id``."""
+    return store.get(_revision_key(doc_id)) if store is not None else None
+
+
+def save_revision(store, doc_id: str, text: str, batches: dict) -> None:
+    if store is not None:
+        store.put(_revision_key(doc_id), {"text": text, "batches": batches})
@@ -2,6 +2,9 @@
 from __future__ import annotations
 import re
 import pandas as pd
+from core.sections import SectionIndex
+from core.spanframe import add_categories, span_dtypes
+from core.values import iso_date, typed_values
 
 # -------- Regexes --------
 RE_MONEY_ANY = re.compile(r'(\d{1,3}(?:\.\d{3})*(?:,\d{2})?)\s*(EUR|€)?', re.I)
@@ -33,23 +36,9 @@ def _looks_like_title(s: str) -> bool:
     s = s or ""
     return any(tok in s for tok in bad)
 
-def _fmt_date(s: str | None) -> str | None:
-    if not s:
-        return None
-    if re.match(r"^\d{4}-\d{2}-\d{2}$", s):
-        return s
-    m = re.match(r"^(\d{1,2})\.(\d{1,2})\.(\d{2,4})$", s)
-    if m:
-        d, mth, y = int(m.group(1)), int(m.group(2)), int(m.group(3))
-        if y < 100:
-            y += 2000
-        return f"{y:04d}-{mth:02d}-{d:02d}"
-    return s
-
 def _section(text: str, num: int) -> str | None:
-    rx = re.compile(rf"(§\s*{num}\s+\w+.*?)(?=\n\s*§\s*\d+\s+\w+|$)", re.S|re.I)
-    m = rx.search(text or "")
-    return m.group(1) if m else None
+    """"§ num" up to the next line-leading "§" heading, from the document's shared section index."""
+    return SectionIndex.of(text or "").section(num)
 
 def _first(dfq: pd.DataFrame, col: str):
     return None if dfq.empty else dfq.iloc[0].get(col)
@@ -69,57 +58,69 @@ def normalize_spans(df: pd.DataFrame, full_text: str) -> tuple[pd.DataFrame, pd.
         if col not in df.columns:
             df[col] = None
 
+    # labels assigned below must be categories of the schema's categorical columns
+    add_categories(df, "subtype", ("subject", "total_fee", "unspecified"))
+    add_categories(df, "currency", ("EUR",))
+
     # PARTY FILTER: drop titles masquerading as parties
     if "type" in df.columns:
         mask = df["type"].eq("party")
-        drop_idx = []
-        for i in df[mask].index:
-            nm = str(df.at[i, "value_norm"] or df.at[i, "text_raw"] or "")
-            if _looks_like_title(nm):
-                drop_idx.append(i)
-        if drop_idx:
-            df = df.drop(index=drop_idx).reset_index(drop=True)
+        if mask.any():
+            names = [str(v or t or "") for v, t in zip(df.loc[mask, "value_norm"].tolist(), df.loc[mask, "text_raw"].tolist())]
+            drop_idx = df.index[mask][[_looks_like_title(nm) for nm in names]]
+            if len(drop_idx):
+                df = df.drop(index=drop_idx).reset_index(drop=True)
 
     # SUBJECT (clause: subject)
     mask_subject = df["type"].eq("clause") & df["text_raw"].fillna("").str.contains(r"§\s*1\s+Vertragsgegenstand", case=False, regex=True)
     df.loc[mask_subject & df["subtype"].isna(), "subtype"] = "subject"
 
-    ## CURRENCY FILL: if money has EUR symbol in text, set currency
-    if 'type' in df.columns:
-        for i in df.index[df['type'].eq('money')]:
-            txt = str(df.at[i, 'text_raw'] or '')
-            if (df.at[i, 'currency'] is None or df.at[i, 'currency']=="") and ('EUR' in txt or '€' in txt):
-                df.at[i, 'currency'] = 'EUR'
-
-    # MONEY: mark total_fee + currency
-    for i in df.index[df["type"].eq("money")]:
-        txt = str(df.at[i, "text_raw"] or "")
-        if pd.isna(df.at[i, "currency"]) and RE_EUR.search(txt):
-            df.at[i, "currency"] = "EUR"
-        if pd.isna(df.at[i, "subtype"]) and (RE_TOTAL_FEE_SENT.search(txt) or RE_VERG.search(txt)):
-            df.at[i, "subtype"] = "total_fee"
-
-    
+    # MONEY: currency from the amount text (a literal EUR/€ where currency is None/"", else the word EUR),
+    # total_fee for "Vergütung" amounts; one pass over the money rows' values
+    money_idx = df.index[df["type"].eq("money")]
+    if len(money_idx):
+        texts = [str(t or "") for t in df.loc[money_idx, "text_raw"].tolist()]
+        currency = df.loc[money_idx, "currency"].tolist()
+        subtype = df.loc[money_idx, "subtype"].tolist()
+        set_eur, set_fee = [], []
+        for i, txt, cur, sub in zip(money_idx, texts, currency, subtype):
+            if ((cur is None or cur == "") and ("EUR" in txt or "€" in txt)) or (pd.isna(cur) and RE_EUR.search(txt)):
+                set_eur.append(i)
+            if pd.isna(sub) and (RE_TOTAL_FEE_SENT.search(txt) or RE_VERG.search(txt)):
+                set_fee.append(i)
+        if set_eur:
+            df.loc[set_eur, "currency"] = "EUR"
+        if set_fee:
+            df.loc[set_fee, "subtype"] = "total_fee"
+
+    # Facts derived from the text, for (type, subtype) pairs no span covers; gathered as
+    # plain rows and appended as one frame in one concat
+    present = set(zip(df["type"].tolist(), df["subtype"].tolist()))
+    doc_id = df["doc_id"].iloc[0] if "doc_id" in df.columns else ""
+    new_rows = []
+
+    def _derive(item_type, subtype, text_raw, value_norm, confidence=0.85, unit=None):
+        new_rows.append({
+            "doc_id": doc_id,
+            "type": item_type,
+            "subtype": subtype,
+            "text_raw": text_raw,
+            "value_norm": value_norm,
+            "unit": unit, "currency": None,
+            "page": None, "para": None, "start": None, "end": None,
+            "confidence": confidence, "extractor": "Normalizer", "version": "1.0",
+            "span_id": f"sp_{str(len(df) + len(new_rows) + 1).zfill(6)}"
+        })
+
     # Contract type
-    if not ((df["type"]=="clause") & (df["subtype"]=="contract_type")).any():
+    if ("clause", "contract_type") not in present:
         mt = RE_CONTRACT_TYPE.search(full_text or "")
         if mt:
-            ctype = mt.group(1).strip()
-            new_row = {
-                "doc_id": df["doc_id"].iloc[0] if "doc_id" in df.columns else "",
-                "type": "clause",
-                "subtype": "contract_type",
-                "text_raw": mt.group(0),
-                "value_norm": ctype,
-                "unit": None, "currency": None,
-                "page": None, "para": None, "start": None, "end": None,
-                "confidence": 0.9, "extractor": "Normalizer", "version": "1.0",
-                "span_id": f"sp_{str(len(df)+1).zfill(6)}"
-            }
-            df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-# VAT from §3
+            _derive("clause", "contract_type", mt.group(0), mt.group(1).strip(), 0.9)
+
+    # VAT from §3
     sec3 = _section(full_text, 3) or (full_text or "")
-    if not ((df["type"]=="other") & (df["subtype"]=="vat_rate_percent")).any():
+    if ("other", "vat_rate_percent") not in present:
         m = RE_VAT.search(sec3)
         if not m:
             m = RE_VAT.search(full_text or '')
@@ -128,113 +129,49 @@ def normalize_spans(df: pd.DataFrame, full_text: str) -> tuple[pd.DataFrame, pd.
                 pct = float(m.group(1))
             except Exception:
                 pct = None
-            new_row = {
-                "doc_id": df["doc_id"].iloc[0] if "doc_id" in df.columns else "",
-                "type": "other",
-                "subtype": "vat_rate_percent",
-                "text_raw": m.group(0),
-                "value_norm": pct,
-                "unit": "percent",
-                "currency": None,
-                "page": None, "para": None, "start": None, "end": None,
-                "confidence": 0.86, "extractor": "Normalizer", "version": "1.0",
-                "span_id": f"sp_{str(len(df)+1).zfill(6)}"
-            }
-            df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
+            _derive("other", "vat_rate_percent", m.group(0), pct, 0.86, unit="percent")
 
     # Payment terms
-    if not ((df["type"]=="other") & (df["subtype"]=="payment_terms_days_after_invoice")).any():
+    if ("other", "payment_terms_days_after_invoice") not in present:
         pm = RE_PAY_DAYS.search(full_text or "")
         if pm:
-            days = int(pm.group(1))
-            new_row = {
-                "doc_id": df["doc_id"].iloc[0] if "doc_id" in df.columns else "",
-                "type": "other",
-                "subtype": "payment_terms_days_after_invoice",
-                "text_raw": pm.group(0),
-                "value_norm": days,
-                "unit": "days",
-                "currency": None,
-                "page": None, "para": None, "start": None, "end": None,
-                "confidence": 0.85, "extractor": "Normalizer", "version": "1.0",
-                "span_id": f"sp_{str(len(df)+1).zfill(6)}"
-            }
-            df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
+            _derive("other", "payment_terms_days_after_invoice", pm.group(0), int(pm.group(1)), unit="days")
 
     # Dates in §4
     sec4 = _section(full_text, 4) or (full_text or "")
-    if not ((df["type"]=="date") & (df["subtype"]=="start_date")).any():
+    if ("date", "start_date") not in present:
         ms = RE_START.search(sec4)
         if ms:
-            iso = _fmt_date(ms.group(1))
-            new_row = {
-                "doc_id": df["doc_id"].iloc[0] if "doc_id" in df.columns else "",
-                "type": "date",
-                "subtype": "start_date",
-                "text_raw": ms.group(0),
-                "value_norm": iso,
-                "unit": None, "currency": None,
-                "page": None, "para": None, "start": None, "end": None,
-                "confidence": 0.85, "extractor": "Normalizer", "version": "1.0",
-                "span_id": f"sp_{str(len(df)+1).zfill(6)}"
-            }
-            df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-
-    if not ((df["type"]=="date") & (df["subtype"]=="end_date")).any():
+            _derive("date", "start_date", ms.group(0), iso_date(ms.group(1)))
+
+    if ("date", "end_date") not in present:
         me = RE_END.search(sec4)
         if me:
-            iso = _fmt_date(me.group(1))
-            new_row = {
-                "doc_id": df["doc_id"].iloc[0] if "doc_id" in df.columns else "",
-                "type": "date",
-                "subtype": "end_date",
-                "text_raw": me.group(0),
-                "value_norm": iso,
-                "unit": None, "currency": None,
-                "page": None, "para": None, "start": None, "end": None,
-                "confidence": 0.85, "extractor": "Normalizer", "version": "1.0",
-                "span_id": f"sp_{str(len(df)+1).zfill(6)}"
-            }
-            df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
+            _derive("date", "end_date", me.group(0), iso_date(me.group(1)))
 
     # Jurisdiction & Law
     sec6 = _section(full_text, 6) or (full_text or "")
-    if not ((df["type"]=="clause") & (df["subtype"]=="jurisdiction")).any():
+    if ("clause", "jurisdiction") not in present:
         mj = RE_JUR.search(sec6)
         if mj:
             city = mj.group(1)
             if city and city.lower() not in _STOPWORDS:
-                new_row = {
-                    "doc_id": df["doc_id"].iloc[0] if "doc_id" in df.columns else "",
-                    "type": "clause",
-                    "subtype": "jurisdiction",
-                    "text_raw": mj.group(0),
-                    "value_norm": city,
-                    "unit": None, "currency": None,
-                    "page": None, "para": None, "start": None, "end": None,
-                    "confidence": 0.85, "extractor": "Normalizer", "version": "1.0",
-                    "span_id": f"sp_{str(len(df)+1).zfill(6)}"
-                }
-                df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
-
-    if not ((df["type"]=="clause") & (df["subtype"]=="governing_law_germany")).any():
-        if RE_LAW.search(full_text or ""):
-            m = RE_LAW.search(full_text or "")
-            new_row = {
-                "doc_id": df["doc_id"].iloc[0] if "doc_id" in df.columns else "",
-                "type": "clause",
-                "subtype": "governing_law_germany",
-                "text_raw": m.group(0),
-                "value_norm": "DE",
-                "unit": None, "currency": None,
-                "page": None, "para": None, "start": None, "end": None,
-                "confidence": 0.85, "extractor": "Normalizer", "version": "1.0",
-                "span_id": f"sp_{str(len(df)+1).zfill(6)}"
-            }
-            df = pd.concat([df, pd.DataFrame([new_row])], ignore_index=True)
+                _derive("clause", "jurisdiction", mj.group(0), city)
+
+    if ("clause", "governing_law_germany") not in present:
+        m = RE_LAW.search(full_text or "")
+        if m:
+            _derive("clause", "governing_law_germany", m.group(0), "DE")
+
+    if new_rows:
+        df = pd.concat([df, pd.DataFrame(new_rows)], ignore_index=True)
 
     # DEFAULTS
     df["subtype"] = df["subtype"].fillna("unspecified")
+    # the concat leaves object columns where the derived rows were appended
+    span_dtypes(df)
+    # value_num / value_date for the rules and summaries
+    typed_values(df)
 
     # KeyFacts
     key = {}
@@ -256,35 +193,34 @@ def normalize_spans(df: pd.DataFrame, full_text: str) -> tuple[pd.DataFrame, pd.
         if len(selected) > 1:
             key["party_2"] = selected[1].get("value_norm") or selected[1].get("text_raw")
 
-    ctype_df = df[(df["type"]=="clause") & (df["subtype"]=="contract_type")]
-    key["contract_type"] = _first(ctype_df, "value_norm")
+    # first row of each (type, subtype), found in one pass
+    first_pos = {}
+    for pos, pair in enumerate(zip(df["type"].tolist(), df["subtype"].tolist())):
+        first_pos.setdefault(pair, pos)
+
+    def rows(item_type, subtype):
+        pos = first_pos.get((item_type, subtype))
+        return df.iloc[0:0] if pos is None else df.iloc[pos:pos + 1]
 
-    subj = df[(df["type"]=="clause") & (df["subtype"]=="subject")]
+    key["contract_type"] = _first(rows("clause", "contract_type"), "value_norm")
+
+    subj = rows("clause", "subject")
     key["subject_present"] = not subj.empty
     key["subject_snippet"] = None if subj.empty else str(subj.iloc[0]["text_raw"]).splitlines()[0][:180]
 
-    fee = df[(df["type"]=="money") & (df["subtype"]=="total_fee")]
+    fee = rows("money", "total_fee")
     key["total_fee"] = _first(fee, "value_norm")
     key["currency"] = _first(fee, "currency")
 
-    vat = df[(df["type"]=="other") & (df["subtype"]=="vat_rate_percent")]
-    key["vat_rate_percent"] = _first(vat, "value_norm")
-
-    pay = df[(df["type"]=="other") & (df["subtype"]=="payment_terms_days_after_invoice")]
-    key["payment_terms_days"] = _first(pay, "value_norm")
-
-    termn = df[(df['type']=='other') & (df['subtype']=='termination_notice_weeks_to_month_end')]
-    key['termination_notice_weeks_to_month_end'] = _first(termn, 'value_norm')
+    key["vat_rate_percent"] = _first(rows("other", "vat_rate_percent"), "value_norm")
+    key["payment_terms_days"] = _first(rows("other", "payment_terms_days_after_invoice"), "value_norm")
+    key['termination_notice_weeks_to_month_end'] = _first(rows('other', 'termination_notice_weeks_to_month_end'), 'value_norm')
 
-    s = df[(df["type"]=="date") & (df["subtype"]=="start_date")]
-    e = df[(df["type"]=="date") & (df["subtype"]=="end_date")]
-    key["start_date"] = _first(s, "value_norm")
-    key["end_date"] = _first(e, "value_norm")
+    key["start_date"] = _first(rows("date", "start_date"), "value_norm")
+    key["end_date"] = _first(rows("date", "end_date"), "value_norm")
 
-    law = df[(df["type"]=="clause") & (df["subtype"]=="governing_law_germany")]
-    jur = df[(df["type"]=="clause") & (df["subtype"]=="jurisdiction")]
-    key["governing_law"] = _first(law, "value_norm")
-    key["jurisdiction_city"] = _first(jur, "value_norm")
+    key["governing_law"] = _first(rows("clause", "governing_law_germany"), "value_norm")
+    key["jurisdiction_city"] = _first(rows("clause", "jurisdiction"), "value_norm")
 
     keyfacts_df = pd.DataFrame([key])
     return df, keyfacts_df
@@ -377,15 +313,15 @@ def summarize_de(df_spans: pd.DataFrame, df_keyfacts: pd.DataFrame | None = None
         if pay:
             lines.append(f"**Zahlungsziel:** {int(pay)} Tage nach Rechnungserhalt")
 
-        s = _fmt_date(row.get("start_date"))
-        e = _fmt_date(row.get("end_date"))
+        s = iso_date(row.get("start_date"))
+        e = iso_date(row.get("end_date"))
         ## DATES FALLBACK via §4
         if (not s or s=='') and sec4_txt:
             ms = re.search(r'tritt\s+am\s+(\d{1,2}\.\d{1,2}\.\d{2,4})\s+in\s+Kraft', sec4_txt, re.I)
-            if ms: s = _fmt_date(ms.group(1))
+            if ms: s = iso_date(ms.group(1))
         if (not e or e=='') and sec4_txt:
             me = re.search(r'endet\s+am\s+(\d{1,2}\.\d{1,2}\.\d{2,4})', sec4_txt, re.I)
-            if me: e = _fmt_date(me.group(1))
+            if me: e = iso_date(me.group(1))
         if s or e:
             lines.append(f"**Laufzeit:** {s or '—'} bis {e or '—'}")
 
@@ -2,6 +2,8 @@
 import pandas as pd
 import re
 
+from core.context import DocumentContext
+
 def _canon(s: str) -> str:
     s = (s or "").strip().strip('"“”„»«')
     s = re.sub(r'\s+', ' ', s)
@@ -71,12 +73,12 @@ def detect_roles(df_parties: pd.DataFrame, full_text: str) -> dict:
     roles = {}
     if df_parties is None or df_parties.empty:
         return roles
+    ctx = DocumentContext.of(full_text).lower
     for _, r in df_parties.iterrows():
         name = _canon(r.get("value_norm") or r.get("text_raw") or "")
         if not name:
             continue
         key = name.lower()
-        ctx = full_text.lower()
         # heuristic based on name presence + nearby role keywords
         # simple: if "nachfolgend 'Kunde' genannt" exists near name, or keyword co-occurs in doc
         if key in ctx:
@@ -1,15 +1,45 @@
 
 from __future__ import annotations
+import importlib
 from typing import Tuple, Dict
-import docx2txt
-from docx import Document
 
-def read_docx_with_fallback(path: str, prefer: str = "python-docx", logger=None) -> Tuple[str, Dict]:
+# python-docx and docx2txt are only needed on the fallback paths; import on first use
+_LAZY = {"Document": ("docx", "Document"), "docx2txt": ("docx2txt", None)}
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    mod, attr = _LAZY[name]
+    value = importlib.import_module(mod)
+    if attr:
+        value = getattr(value, attr)
+    globals()[name] = value
+    return value
+
+def _dep(name):
+    # module global if already bound (or monkeypatched), else import it now
+    return globals()[name] if name in globals() else __getattr__(name)
+
+def read_docx_with_fallback(path: str, prefer: str = "xml", logger=None) -> Tuple[str, Dict]:
+    """prefer="xml" parses word/document.xml once (io_ops.docx_model); "python-docx"
+    keeps the old object-tree reader. Either falls back to docx2txt on failure."""
     meta = {"engine": None, "had_fallback": False, "tables_extracted": False}
     text = ""
     try:
-        if prefer == "python-docx":
-            doc = Document(path)
+        if prefer == "xml":
+            from io_ops.docx_model import load_docx
+            m = load_docx(path)
+            parts = list(m.paragraphs)
+            for tbl in m.tables:
+                for row in tbl:
+                    parts.append(" | ".join(row))
+            text = "\n".join(parts)
+            meta["engine"] = "docx-xml"
+            meta["tables_extracted"] = True
+            if not text.strip():
+                raise ValueError("empty text via docx-xml")
+        elif prefer == "python-docx":
+            doc = _dep("Document")(path)
             parts = []
             # paragraphs
             parts.extend(p.text for p in doc.paragraphs)
@@ -26,13 +56,14 @@ def read_docx_with_fallback(path: str, prefer: str = "python-docx", logger=None)
             raise Exception("force fallback")
     except Exception:
     # fallback to docx2txt
-        text = docx2txt.process(path) or ""
+        text = _dep("docx2txt").process(path) or ""
         meta["engine"] = "docx2txt"
         meta["had_fallback"] = True
     # hardening: if python-docx returned too little, try docx2txt and prefer the longer one
+    # (docx-xml already includes text boxes/fields python-docx misses, so no second parse)
     if logger: logger.info(f"DOCX reader used: {meta['engine']} | fallback={meta['had_fallback']}")
     if meta["engine"] == "python-docx" and len(text) < 1000:
-        alt = docx2txt.process(path) or ""
+        alt = _dep("docx2txt").process(path) or ""
         if len(alt) > len(text):
             text = alt
             meta["engine"] = "docx2txt"
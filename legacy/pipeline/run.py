@@ -1,43 +1,25 @@
 
-import importlib, yaml, pandas as pd
+import yaml, pandas as pd
 from pathlib import Path
-from core.registry import REGISTRY
-from io_ops.readers import read_docx_text, read_pdf_text, read_txt
+from io_ops.formats import read_document
 from io_ops.writers import batches_to_excel
+from pipeline.extractor_set import ExtractorSet
 from rules.engine import evaluate_compliance
-import pkgutil, extractors
-
-# auto-import all extractors to register them via decorators
-for _, modname, _ in pkgutil.iter_modules(extractors.__path__):
-    if modname not in ("__init__", "base"):
-        importlib.import_module(f"extractors.{modname}")
 
 cfg = yaml.safe_load(open("pipeline/config.yml", "r", encoding="utf-8"))
 in_path = Path(cfg["input_path"])
 doc_id = in_path.stem
 
-# read text
-suffix = in_path.suffix.lower()
-if suffix == ".docx":
-    text = read_docx_text(str(in_path))
-elif suffix == ".pdf":
-    text = read_pdf_text(str(in_path))
-elif suffix == ".txt":
-    text = read_txt(str(in_path))
-else:
-    raise ValueError(f"Unsupported file type: {suffix}")
+# read text (reader picked by content, not suffix)
+doc, _tables = read_document(str(in_path))
+text = doc.text
 
-# run enabled extractors
-enabled = set(cfg.get("use_extractors", []))
-batches = []
-for ext_cls in REGISTRY["extractors"]:
-    if ext_cls.__extractor_name__ in enabled:
-        ext = ext_cls()
-        batches.append(ext.extract(doc_id, text))
+# run enabled extractors (one shared keyword pre-pass, see core.scan)
+batches = ExtractorSet.from_config(cfg).extract(doc_id, text)
 
 # export spans
 out_excel = cfg["output_excel"]
-df_spans = batches_to_excel(batches, out_excel)
+df_spans = batches_to_excel(batches, out_excel, doc)
 
 # compliance
 policies = yaml.safe_load(open("rules/policies.yml", "r", encoding="utf-8"))
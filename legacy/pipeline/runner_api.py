@@ -1,46 +1,100 @@
 
-import importlib, pkgutil, pandas as pd, yaml
+from __future__ import annotations
+import yaml
 from pathlib import Path
-from core.registry import REGISTRY
-from io_ops.readers import read_docx_text, read_pdf_text, read_txt, read_docx_text_and_tables
-from io_ops.writers import batches_to_excel
-from rules.engine import evaluate_compliance
-import extractors
-
-# auto-import extractors
-for _, modname, _ in pkgutil.iter_modules(extractors.__path__):
-    if modname not in ("__init__", "base"):
-        importlib.import_module(f"extractors.{modname}")
-
-def run_once(input_path: str, output_excel: str):
+from io_ops.formats import read_document
+from pipeline.cache import get_default_cache, pipeline_key, file_digest
+from pipeline.extractor_set import ExtractorSet, enabled_classes, shared_extractor_set
+from pipeline.logger import get_logger
+from typing import TYPE_CHECKING
+if TYPE_CHECKING:
+    from core.document import DocumentText
+
+# pandas, the pipeline stages and the extractor modules are imported on first
+# use (see bench/importtime.py): importing this module must stay cheap for
+# spawned batch workers and CLI start-up
+
+def _read_input(p, pdf_workers: int = 1) -> tuple[DocumentText, list]:
+    """Return (DocumentText, tables); the reader is chosen by content (see io_ops.formats)."""
+    return read_document(str(p), workers=pdf_workers)
+
+
+CONFIG_PATH = Path('pipeline/config.yml')
+# parsed config.yml and the (st_mtime_ns, st_size) it was parsed at
+_config = (None, {})
+
+
+def _load_config() -> dict:
+    """config.yml, parsed again only when the file changes."""
+    global _config
+    st = CONFIG_PATH.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    if _config[0] != stamp:
+        _config = (stamp, yaml.safe_load(open(CONFIG_PATH,'r',encoding='utf-8')) or {})
+    return _config[1]
+
+
+def _enabled_extractor_classes(cfg=None):
+    return enabled_classes(_load_config() if cfg is None else cfg)
+
+
+def process_document(input_path: str, use_cache: bool = True, pdf_workers: int | None = None,
+                     extractors: ExtractorSet | None = None, doc_id: str | None = None) -> dict:
+    """Read, extract and evaluate one document without writing anything.
+
+    Returns a dict with ``doc_id``, ``spans``, ``keyfacts``, ``compliance``,
+    ``entities``, ``links``, ``price``, ``summary``, ``summary_de`` and ``diagnostics``
+    (per extractor that ran: status and seconds, see ``ExtractorSet``); used by ``run_once`` and by the batch runner workers.
+    Results are served from the content-addressed cache (see ``pipeline.cache``)
+    when the input bytes, extractor versions and policies are unchanged; on a
+    miss only the stages whose inputs changed are recomputed. ``pdf_workers``
+    (default: ``pdf_workers`` in config.yml) decodes PDF pages in parallel.
+    ``extractors`` defaults to the process-wide set for ``use_extractors``
+    (``pipeline.extractor_set.shared_extractor_set``), constructed once.
+    ``doc_id`` defaults to the file's stem; the batch runner passes one unique
+    within its input folders, since revisions are also kept by ``doc_id``.
+    """
+    import pandas as pd
+    from pipeline.stages import run_stages
     p = Path(input_path)
-    doc_id = p.stem
-    # read
-    sfx = p.suffix.lower()
-    if sfx == ".docx":
-        text, tables = read_docx_text_and_tables(str(p))
-    elif sfx == ".pdf":
-        text = read_pdf_text(str(p))
-    elif sfx == ".txt":
-        text = read_txt(str(p))
-    else:
-        raise ValueError(f"Unsupported type: {sfx}")
-
-    # extract
-    batches = []
-    enabled = set(yaml.safe_load(open('pipeline/config.yml','r',encoding='utf-8')).get('use_extractors', []))
-    for ext_cls in REGISTRY["extractors"]:
-        if ext_cls.__extractor_name__ in enabled:
-            ext = ext_cls()
-            batches.append(ext.extract(doc_id, text))
-
-    # export spans
-    df_spans = batches_to_excel(batches, output_excel)
-
-    # compliance
-    policies = yaml.safe_load(open("rules/policies.yml","r",encoding="utf-8"))
-    comp = evaluate_compliance(df_spans, policies)
-    with pd.ExcelWriter(output_excel, engine="openpyxl", mode="a", if_sheet_exists="replace") as xw:
+    doc_id = doc_id or p.stem
+    cfg = _load_config()
+    if extractors is None:
+        extractors = shared_extractor_set(cfg)
+    if pdf_workers is None:
+        pdf_workers = int(cfg.get("pdf_workers", 1) or 1)
+
+    cache = get_default_cache() if use_cache else None
+    key = None
+    if cache is not None:
+        key = pipeline_key(file_digest(p), extractors.classes)
+        hit = cache.get(key)
+        if hit is not None:
+            # same bytes under another file name: only doc_id differs
+            hit["doc_id"] = doc_id
+            for df in hit.values():
+                if isinstance(df, pd.DataFrame) and "doc_id" in df.columns and not df.empty:
+                    df["doc_id"] = doc_id
+            return hit
+
+    # read → extract → normalize → entities/price → compliance → summaries,
+    # each stage memoized separately (see pipeline.stages)
+    reader = lambda path: _read_input(path, pdf_workers)
+    result, ran = run_stages(p, doc_id, reader, extractors, store=cache)
+    skipped = [d for d in result["diagnostics"] if d["status"] != "ok"]
+    for d in skipped:
+        get_logger().warning("%s: extractor %s %s: %s", doc_id, d["extractor"], d["status"], d["error"])
+    # a result missing an extractor is not cached; the next run retries it
+    if key is not None and not skipped:
+        cache.put(key, result)
+    return result
+
+
+def write_result_excel(result: dict, output_excel: str):
+    import pandas as pd
+    df_spans, comp = result["spans"], result["compliance"]
+    with pd.ExcelWriter(output_excel, engine="openpyxl") as xw:
+        df_spans.to_excel(xw, index=False, sheet_name="Spans")
         # Extra sheets: Indexation & ServiceCredits
         try:
             idx_df = df_spans[df_spans['subtype'].isin(['indexation_present','index_raise_percent_pa','index_cap_percent'])].copy()
@@ -55,36 +109,49 @@ def run_once(input_path: str, output_excel: str):
         # Compliance sheet
         if comp is not None:
             comp.to_excel(xw, index=False, sheet_name="Compliance")
-        # Summaries (s_en/s_de written if computed above)
-        try: s_en.to_excel(xw, index=False, sheet_name="ContractSummary")
-        except Exception: pass
-        try: s_de.to_excel(xw, index=False, sheet_name="ContractSummary_DE")
-        except Exception: pass
-
+        for key, sheet in (("entities", "Entities"), ("links", "Links"), ("price", "PriceSchedule")):
+            df = result.get(key)
+            if df is not None and not df.empty:
+                df.to_excel(xw, index=False, sheet_name=sheet)
+        # Summaries
+        if result.get("summary") is not None:
+            result["summary"].to_excel(xw, index=False, sheet_name="ContractSummary")
+        if result.get("summary_de") is not None:
+            result["summary_de"].to_excel(xw, index=False, sheet_name="ContractSummary_DE")
     return output_excel
 
 
-def _enrich_summary_with_lexicon(sum_de: pd.DataFrame, df_spans: pd.DataFrame) -> pd.DataFrame:
-    if sum_de is None or sum_de.empty or df_spans is None or df_spans.empty:
+def run_once(input_path: str, output_excel: str):
+    result = process_document(input_path)
+    return write_result_excel(result, output_excel)
+
+
+def _first_text(sf, subtype, col="value_norm", type=None) -> str:
+    """``col`` of the first span of ``subtype`` as stripped text; "" when there is none."""
+    try:
+        if sf.exists(type, subtype):
+            return str(sf.first(subtype, col, type)).strip()
+    except Exception:
+        pass
+    return ""
+
+
+def _enrich_summary_with_lexicon(sum_de: pd.DataFrame, df_spans) -> pd.DataFrame:
+    import pandas as pd
+    from core.spanframe import SpanFrame
+    sf = SpanFrame.of(df_spans)
+    if sum_de is None or sum_de.empty or sf.empty:
         return sum_de
     row = sum_de.iloc[0].to_dict()
 
     def has_concept(key):
         try:
-            d = df_spans[(df_spans["type"]=="concept") & (df_spans["subtype"]==key)]
-            return not d.empty
+            return sf.exists("concept", key)
         except Exception:
             return False
 
     def first_val(subtype):
-        try:
-            d = df_spans[df_spans["subtype"]==subtype]
-            if not d.empty:
-                v = str(d.iloc[0]["value_norm"]).strip()
-                return v
-        except Exception:
-            pass
-        return ""
+        return _first_text(sf, subtype)
 
     # Flags
     row["GWL_vorhanden"] = "Ja" if has_concept("gwl") else "Nein"
@@ -111,19 +178,16 @@ def _enrich_summary_with_lexicon(sum_de: pd.DataFrame, df_spans: pd.DataFrame) -
     return pd.DataFrame([row])
 
 
-def _enrich_summary_with_requested_fields(sum_de: pd.DataFrame, df_spans: pd.DataFrame, ents_df: pd.DataFrame) -> pd.DataFrame:
+def _enrich_summary_with_requested_fields(sum_de: pd.DataFrame, df_spans, ents_df: pd.DataFrame) -> pd.DataFrame:
+    import pandas as pd
+    from core.spanframe import SpanFrame
     if sum_de is None or sum_de.empty:
         return sum_de
+    sf = SpanFrame.of(df_spans)
     row = sum_de.iloc[0].to_dict()
 
     def get_first(subtype):
-        try:
-            d = df_spans[df_spans["subtype"]==subtype]
-            if d is not None and not d.empty:
-                return str(d.iloc[0]["value_norm"]).strip()
-        except Exception:
-            pass
-        return ""
+        return _first_text(sf, subtype)
 
     # Aliases
     row["Vertragsnummer"] = row.get("Vertragsnummer") or get_first("contract_number") or row.get("ContractNo","")
@@ -144,9 +208,8 @@ def _enrich_summary_with_requested_fields(sum_de: pd.DataFrame, df_spans: pd.Dat
     else:
         # check yes/no spans
         try:
-            auto = df_spans[df_spans["subtype"]=="auto_renewal"]
-            if not auto.empty:
-                v = str(auto.iloc[0]["value_norm"]).lower()
+            if sf.exists(subtype="auto_renewal"):
+                v = str(sf.first("auto_renewal")).lower()
                 row["Verlängerung"] = "Ja" if "yes" in v or "ja" in v else "Nein"
         except Exception:
             pass
@@ -173,8 +236,8 @@ def _enrich_summary_with_requested_fields(sum_de: pd.DataFrame, df_spans: pd.Dat
     # Leistungsumfang (jährlich): aggregate 'service_scope_yearly' OR compose from periodicities
     sc = ""
     try:
-        d = df_spans[df_spans["subtype"]=="service_scope_yearly"]
-        if d is not None and not d.empty:
+        d = sf.rows(subtype="service_scope_yearly")
+        if not d.empty:
             vals = d["value_norm"].astype(str).tolist()
             sc = "; ".join(vals[:5])
     except Exception:
@@ -193,9 +256,8 @@ def _enrich_summary_with_requested_fields(sum_de: pd.DataFrame, df_spans: pd.Dat
     # Pflichten des Kunden / Haftung (presence or short excerpt)
     def _excerpt(sub):
         try:
-            d = df_spans[df_spans["subtype"]==sub]
-            if d is not None and not d.empty:
-                txt = str(d.iloc[0]["text_raw"])
+            if sf.exists(subtype=sub):
+                txt = str(sf.first(sub, "text_raw"))
                 return (txt[:220] + "…") if len(txt) > 220 else txt
         except Exception:
             pass
@@ -211,13 +273,7 @@ def _enrich_summary_with_requested_fields(sum_de: pd.DataFrame, df_spans: pd.Dat
 
     # Kontakt (email/phone)
     def _first_contact(st):
-        try:
-            d = df_spans[(df_spans["type"]=="contact") & (df_spans["subtype"]==st)]
-            if d is not None and not d.empty:
-                return str(d.iloc[0]["value_norm"]).strip()
-        except Exception:
-            pass
-        return ""
+        return _first_text(sf, st, type="contact")
 
     email = _first_contact("email")
     phone = _first_contact("phone")
@@ -229,6 +285,7 @@ def _enrich_summary_with_requested_fields(sum_de: pd.DataFrame, df_spans: pd.Dat
 
 # Roles_Aggregation
 def _enrich_summary_with_roles(sum_de: pd.DataFrame, ents_df: pd.DataFrame) -> pd.DataFrame:
+    import pandas as pd
     if sum_de is None or sum_de.empty or ents_df is None or ents_df.empty:
         return sum_de
     row = sum_de.iloc[0].to_dict()
@@ -248,19 +305,16 @@ def _enrich_summary_with_roles(sum_de: pd.DataFrame, ents_df: pd.DataFrame) -> p
     return pd.DataFrame([row])
 
 
-def _enrich_summary_with_legal_pricing(sum_de: pd.DataFrame, df_spans: pd.DataFrame) -> pd.DataFrame:
+def _enrich_summary_with_legal_pricing(sum_de: pd.DataFrame, df_spans) -> pd.DataFrame:
+    import pandas as pd
+    from core.spanframe import SpanFrame
     if sum_de is None or sum_de.empty:
         return sum_de
+    sf = SpanFrame.of(df_spans)
     row = sum_de.iloc[0].to_dict()
 
     def first_val(st):
-        try:
-            d = df_spans[df_spans["subtype"]==st]
-            if d is not None and not d.empty:
-                return str(d.iloc[0]["value_norm"]).strip()
-        except Exception:
-            pass
-        return ""
+        return _first_text(sf, st)
 
     # Zahlungsziel/Skonto/Verzug
     row["Zahlungsziel_Tage"] = first_val("payment_due_days")
@@ -289,19 +343,16 @@ def _enrich_summary_with_legal_pricing(sum_de: pd.DataFrame, df_spans: pd.DataFr
 
     return pd.DataFrame([row])
 
-def _enrich_summary_with_finance_sla_travel(sum_de: pd.DataFrame, df_spans: pd.DataFrame) -> pd.DataFrame:
+def _enrich_summary_with_finance_sla_travel(sum_de: pd.DataFrame, df_spans) -> pd.DataFrame:
+    import pandas as pd
+    from core.spanframe import SpanFrame
     if sum_de is None or sum_de.empty:
         return sum_de
+    sf = SpanFrame.of(df_spans)
     row = sum_de.iloc[0].to_dict()
 
     def first(st):
-        try:
-            d = df_spans[df_spans["subtype"]==st]
-            if d is not None and not d.empty:
-                return str(d.iloc[0]["value_norm"]).strip()
-        except Exception:
-            pass
-        return ""
+        return _first_text(sf, st)
 
     # Netto/MwSt/Brutto
     row["Netto_EUR"] = first("net_amount_eur")
@@ -309,8 +360,8 @@ def _enrich_summary_with_finance_sla_travel(sum_de: pd.DataFrame, df_spans: pd.D
     row["Brutto_EUR"] = first("gross_amount_eur")
 
     # Zuschläge vorhanden?
-    has_pct = df_spans is not None and not df_spans.empty and not df_spans[df_spans["subtype"]=="oncall_surcharge_percent"].empty
-    has_eurh = df_spans is not None and not df_spans.empty and not df_spans[df_spans["subtype"]=="oncall_surcharge_eur_per_hour"].empty
+    has_pct = sf.exists(subtype="oncall_surcharge_percent")
+    has_eurh = sf.exists(subtype="oncall_surcharge_eur_per_hour")
     row["Zuschläge_vorhanden"] = "Ja" if (has_pct or has_eurh) else "Nein"
 
     # Anfahrt
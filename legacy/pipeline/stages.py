@@ -0,0 +1,188 @@
+"""Per-stage artifact memoization for the document pipeline.
+
+read → extract (one artifact per extractor) → normalize_spans → entities/price
+→ evaluate_compliance → summaries. Each stage's output is stored in a
+``ResultCache`` under a key derived from the keys of its inputs plus the stage's
+code version, so e.g. editing ``rules/policies.yml`` re-runs only compliance and
+bumping one extractor's ``__version__`` re-runs only that extractor and the
+stages after it. Bump ``STAGE_VERSIONS`` when a stage's code changes output.
+"""
+from __future__ import annotations
+
+import hashlib
+import time
+
+import pandas as pd
+import yaml
+
+from core.scan import DocumentScan
+from core.spanframe import SpanFrame
+from io_ops.writers import batches_to_df
+from pipeline.cache import extractor_version, file_digest, policies_digest
+from pipeline.extractor_set import ExtractorSet
+from pipeline.incremental import context_margin, in_text_order, load_revision, revise_spans, save_revision, text_changes
+from pipeline.normalize import normalize_spans
+from pipeline.postprocess import build_entities_links, build_price_schedule, build_price_schedule_from_tables
+from pipeline.summarize import summaries
+from rules.engine import evaluate_compliance
+
+STAGE_VERSIONS = {
+    "read": "4",
+    "spans": "4",
+    "normalize": "3",
+    "post": "1",
+    "compliance": "1",
+    "summary": "1",
+}
+
+
+def stage_key(stage: str, *inputs) -> str:
+    parts = [stage, STAGE_VERSIONS.get(stage, "0"), *map(str, inputs)]
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+
+class StageRunner:
+    """Runs stages through ``store`` (any object with get/put, or None for no memoization).
+
+    ``ran`` records, per stage, whether it was computed ("run"), loaded ("hit") or,
+    for an extractor, derived from the previous version of the document ("revised").
+    """
+
+    def __init__(self, store=None):
+        self.store = store
+        self.ran = {}
+
+    def _lookup(self, name, key):
+        value = self.store.get(key) if self.store is not None else None
+        if value is not None:
+            self.ran[name] = "hit"
+        return value
+
+    def _record(self, name, key, value, status="run"):
+        self.ran[name] = status
+        if self.store is not None and status in ("run", "revised"):
+            self.store.put(key, value)
+        return value
+
+    def _memo(self, name, key, fn):
+        value = self._lookup(name, key)
+        return value if value is not None else self._record(name, key, fn())
+
+
+def read_stage(runner: StageRunner, path, reader) -> tuple[str, tuple]:
+    """``reader(path) -> (DocumentText, tables)``; returns (key, that tuple)."""
+    key = stage_key("read", file_digest(path))
+    return key, runner._memo("read", key, lambda: reader(path))
+
+
+def extract_stage(runner: StageRunner, read_key, doc_id, text, extractors) -> tuple[list[str], list]:
+    """``extractors``: an ``ExtractorSet`` (instances reused) or extractor classes (constructed on a miss).
+
+    With an ``ExtractorSet`` the cache misses run together through ``ExtractorSet.run``
+    (concurrently in parallel mode); an extractor it skips (error or over budget) is
+    recorded in ``runner.ran`` as "skipped", contributes no batch and is not cached.
+    In incremental mode (``ExtractorSet.incremental``, with a store) a document seen
+    before under the same ``doc_id`` is re-extracted only around its changes by the
+    extractors that allow it (``pipeline.incremental``); those are "revised".
+    """
+    if not isinstance(extractors, ExtractorSet):
+        # extractors that miss the cache share one keyword pre-pass over the text (core.scan)
+        scan = DocumentScan(text)
+        keys, batches = [], []
+        for cls in extractors:
+            # doc_id is baked into the batch, so it is part of the key
+            key = stage_key("extract", cls.__extractor_name__, extractor_version(cls), read_key, doc_id)
+            keys.append(key)
+            batches.append(runner._memo(f"extract:{cls.__extractor_name__}", key,
+                                        lambda cls=cls: scan.attach(cls()).extract(doc_id, text)))
+        return keys, batches
+
+    # incremental mode: spans of extractors with a context margin come in text order
+    ordered = [extractors.incremental and runner.store is not None and context_margin(e) is not None
+               for e in extractors]
+    names = [f"extract:{type(e).__extractor_name__}" for e in extractors]
+    keys = [stage_key("extract", type(e).__extractor_name__, extractor_version(type(e)), read_key, doc_id,
+                      *(["text-order"] if o else []))
+            for e, o in zip(extractors, ordered)]
+    extractors.diagnostics = []
+    batches = [runner._lookup(n, k) for n, k in zip(names, keys)]
+    missing = [i for i, b in enumerate(batches) if b is None]
+    prev = load_revision(runner.store, doc_id) if any(ordered) else None
+    if missing and prev is not None and prev["text"] != text:
+        changes = None
+        for i in list(missing):
+            ext = extractors.instances[i]
+            version, old = prev["batches"].get(type(ext).__extractor_name__, (None, None))
+            if not ordered[i] or old is None or version != extractor_version(type(ext)):
+                continue
+            t0 = time.perf_counter()
+            changes = changes if changes is not None else text_changes(prev["text"], text)
+            b = revise_spans(ext, doc_id, prev["text"], old, text, changes)
+            if b is not None:
+                batches[i] = runner._record(names[i], keys[i], b, "revised")
+                extractors._report(ext, "ok", time.perf_counter() - t0)
+                missing.remove(i)
+    if missing:
+        revised = extractors.diagnostics
+        fresh = extractors.run(doc_id, text, [extractors.instances[i] for i in missing])
+        extractors.diagnostics = revised + extractors.diagnostics
+        for i, b in zip(missing, fresh):
+            if b is not None and ordered[i]:
+                b = in_text_order(b)
+            batches[i] = runner._record(names[i], keys[i], b, "run" if b is not None else "skipped")
+            if b is None:
+                # later stages must not pass off the partial spans as complete ones
+                keys[i] = "skipped:" + keys[i]
+    if any(ordered) and (prev is None or prev["text"] != text or missing):
+        save_revision(runner.store, doc_id, text,
+                      {type(e).__extractor_name__: (extractor_version(type(e)), b)
+                       for e, o, b in zip(extractors, ordered, batches) if o and b is not None})
+    return keys, [b for b in batches if b is not None]
+
+
+def run_stages(path, doc_id: str, reader, extractors, store=None,
+               policies_path: str = "rules/policies.yml") -> tuple[dict, dict]:
+    """Run the full pipeline for one document; returns (result, ran).
+
+    ``extractors`` is an ``ExtractorSet`` or a list of extractor classes (see ``extract_stage``).
+    """
+    runner = StageRunner(store)
+    read_key, (doc, tables) = read_stage(runner, path, reader)
+    text = doc.text
+    ext_keys, batches = extract_stage(runner, read_key, doc_id, text, extractors)
+
+    spans_key = stage_key("spans", read_key, *ext_keys)
+    df_raw = runner._memo("spans", spans_key, lambda: batches_to_df(batches, doc))
+
+    norm_key = stage_key("normalize", spans_key, read_key)
+    df_spans, keyfacts = runner._memo("normalize", norm_key, lambda: normalize_spans(df_raw, text))
+    # (type, subtype) index shared by the compliance rules and the summaries, built on first lookup
+    spans = SpanFrame(df_spans)
+
+    def _post():
+        ents, links = build_entities_links(df_spans, doc_id, text)
+        try:
+            ps = pd.concat([build_price_schedule(df_spans), build_price_schedule_from_tables(tables)],
+                           ignore_index=True).drop_duplicates()
+        except Exception:
+            ps = pd.DataFrame()
+        return ents, links, ps
+    post_key = stage_key("post", norm_key)
+    ents, links, ps = runner._memo("post", post_key, _post)
+
+    def _compliance():
+        policies = yaml.safe_load(open(policies_path, "r", encoding="utf-8"))
+        return evaluate_compliance({"spans": spans, "entities": ents, "price": ps}, policies)
+    comp = runner._memo("compliance", stage_key("compliance", post_key, policies_digest(policies_path)), _compliance)
+
+    def _summaries():
+        # English and German summary from one pass of pipeline.summarize.PLAN
+        try: return summaries(spans, keyfacts=False)[:2]
+        except Exception: return None, None
+    s_en, s_de = runner._memo("summary", stage_key("summary", norm_key), _summaries)
+
+    result = {"doc_id": doc_id, "spans": df_spans, "keyfacts": keyfacts, "compliance": comp,
+              "entities": ents, "links": links, "price": ps, "summary": s_en, "summary_de": s_de,
+              # extractors that ran for this call (cache hits excluded), see ExtractorSet.diagnostics
+              "diagnostics": list(getattr(extractors, "diagnostics", []))}
+    return result, runner.ran
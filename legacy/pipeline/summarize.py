@@ -7,39 +7,13 @@ def _get_first(df, cond, col):
         return None
 
 
-from typing import Optional
+from typing import Any, Callable, NamedTuple, Optional
 import pandas as pd
-import re
 from datetime import datetime
 
-def _parse_amount(s: str) -> Optional[float]:
-    s = s or ""
-    x = re.sub(r"[^0-9\.,]", "", s)
-    if not x:
-        return None
-    if "." in x and "," in x:
-        x = x.replace(".", "").replace(",", ".")
-    elif "," in x and "." not in x:
-        x = x.replace(",", ".")
-    try:
-        return float(x)
-    except ValueError:
-        return None
-
-def _iso(d: str) -> Optional[str]:
-    if re.match(r"^\d{4}-\d{2}-\d{2}$", d or ""):
-        return d
-    m = re.match(r"^(\d{1,2})/(\d{1,2})/(\d{2,4})$", d or "")
-    if m:
-        dd, mm, yy = m.groups()
-        if len(yy)==2: yy = "20"+yy
-        return f"{yy}-{int(mm):02d}-{int(dd):02d}"
-    m = re.match(r"^(\d{1,2})\.(\d{1,2})\.(\d{2,4})$", d or "")
-    if m:
-        dd, mm, yy = m.groups()
-        if len(yy)==2: yy = "20"+yy
-        return f"{yy}-{int(mm):02d}-{int(dd):02d}"
-    return None
+from core.contract_schema import CONTRACT_SCHEMA
+from core.spanframe import SpanFrame
+from core.values import value_dates, value_nums
 
 def months_between(start_iso: str, end_iso: str) -> Optional[int]:
     try:
@@ -49,254 +23,289 @@ def months_between(start_iso: str, end_iso: str) -> Optional[int]:
     except Exception:
         return None
 
-def summarize(df: pd.DataFrame) -> pd.DataFrame:
-    row = {
-        "Parties": "",
-        "Subject": "",
-        "StartDate": "",
-        "EndDate": "",
-        "TermMonths": "",
-        "NoticeDays": "",
-        "AutoRenewMonths": "",
-        "TotalAmount": "",
-        "Currency": "",
-        "VAT_Percent": "",
-        "Cost_pM_EUR": "",
-        "Cost_pA_EUR": "",
-        "ExtraCosts_EUR": "",
-        "IBAN": "",
-        "Deadline": "",
-        # New (DE-focused)
-        "ReactionTime_Hours": "",
-        "BusinessHours": "",
-        "MinTermMonths": "",
-        "NoticeMonths": "",
-        "FreeMonths": "",
-        "WeekendSurcharge_Percent": "",
-        "Jurisdiction": "",
-        "GoverningLaw": "",
-        "CISG_Excluded": "",
-        "PaymentStartEvent": "",
-        "AutoRenewal": "",
-        "ContractNumber": "",
-        "CustomerNumber": "",
-    }
-
-    if df is None or df.empty:
-        return pd.DataFrame([row])
-
-    # Dates
-    dates = df[df["type"]=="date"].copy()
-    if not dates.empty:
-        start = dates[dates["subtype"]=="start_date"]["value_norm"].dropna().tolist()
-        end = dates[dates["subtype"]=="end_date"]["value_norm"].dropna().tolist()
-        deadline = dates[dates["subtype"]=="deadline"]["value_norm"].dropna().tolist()
-        if start: row["StartDate"] = _iso(start[0]) or start[0]
-        if end: row["EndDate"] = _iso(end[0]) or end[0]
-        if deadline: row["Deadline"] = _iso(deadline[0]) or deadline[0]
-
-    # TermMonths explicit or computed
-    dur_months = (df[(df["type"]=="money") & (df["subtype"]=="duration_months")]["value_norm"].tolist()
-            if "value_norm" in df.columns else [])
-    if dur_months:
-        row["TermMonths"] = dur_months[0]
-    if not row["TermMonths"] and row["StartDate"] and row["EndDate"]:
-        m = months_between(row["StartDate"], row["EndDate"])
+# Summary plan: every output value is a Field naming the spans it reads (type,
+# subtype; None matches any), how they are reduced (agg) and where the result goes:
+# a column of the English / German summary (en, de) and/or a key fact (key).
+# Several names take the parts of a tuple. SummaryPlan selects the spans of each
+# distinct (type, subtype) once from a SpanFrame and fills all three outputs in
+# one pass; (type, subtype) comes from CONTRACT_SCHEMA where it defines the fact.
+
+UNSET = object()  # agg result: leave the summary default ("") / omit the key fact
+SECTION = "§"  # Field type of a section lookup: agg gets the text of section ``subtype``
+
+_SCHEMA_FIELDS = {name: spec for group in CONTRACT_SCHEMA.values() for name, spec in group.items()}
+
+
+def _schema(name: str, **override) -> tuple:
+    """``(type, subtype)`` of a ``CONTRACT_SCHEMA`` field; ``type=`` replaces its type (None: any type)."""
+    spec = _SCHEMA_FIELDS[name]
+    return override.get("type", spec["type"]), spec["subtype"]
+
+
+class Field(NamedTuple):
+    type: str | None
+    subtype: str | None
+    agg: Callable[[Any], Any] | None  # matching rows (a section text for SECTION) -> value; None: always unset
+    en: str | tuple | None = None
+    de: str | tuple | None = None
+    key: str | tuple | None = None
+    when_missing: Callable[[dict], Any] | None = None  # English row so far -> value when agg gives a falsy one
+
+
+# reducers of the matching rows
+def _first(col="value_norm", fmt=None):
+    def agg(rows):
+        if rows.empty:
+            return UNSET
+        v = rows[col].iloc[0]
+        return fmt(v) if fmt else v
+    return agg
+
+
+def _first_present(fmt=None):
+    """First non-missing ``value_norm``."""
+    def agg(rows):
+        vals = rows["value_norm"].dropna().tolist() if not rows.empty else []
+        if not vals:
+            return UNSET
+        return fmt(vals[0]) if fmt else vals[0]
+    return agg
+
+
+def _guarded(agg):
+    """``agg``, unset where it fails (the summary's best-effort fields)."""
+    def run(rows):
+        try:
+            return agg(rows)
+        except Exception:
+            return UNSET
+    return run
+
+
+def _first_if_value_column(rows):
+    return UNSET if "value_norm" not in rows.columns else _first()(rows)
+
+
+def _first_date(rows):
+    """First non-missing ``value_norm`` as ``YYYY-MM-DD`` if it is a date (``value_date``), else as is."""
+    rows = rows[rows["value_norm"].notna()] if not rows.empty else rows
+    if rows.empty:
+        return UNSET
+    d = value_dates(rows.iloc[:1]).iloc[0]
+    return rows["value_norm"].iloc[0] if pd.isna(d) else d.strftime("%Y-%m-%d")
+
+
+def _amount_text(rows):
+    """First row's ``value_num``, as text."""
+    if rows.empty:
+        return UNSET
+    amt = value_nums(rows.iloc[:1]).iloc[0]
+    return UNSET if pd.isna(amt) else str(float(amt))
+
+
+_NOT_TOTAL = ["percent","vat_percent","notice_days","duration_days","duration_months","auto_renew_months","iban","fixed_per_call","price_schedule_monthly","price_schedule_yearly","price_per_year"]
+
+
+def _total_amount(rows):
+    """(amount, currency) of the largest amount among the money rows that can be a total."""
+    if rows.empty:
+        return UNSET
+    monies = rows.copy()
+    monies["amount_num"] = value_nums(monies)
+    cand = monies[~monies["subtype"].isin(_NOT_TOTAL)].copy()
+    if cand.empty or not cand["amount_num"].notna().any():
+        return UNSET
+    mx = cand.loc[cand["amount_num"].idxmax()]
+    amt = mx["amount_num"]
+    total = str(int(amt)) if isinstance(amt, float) and amt.is_integer() else (f"{amt:.2f}").rstrip('0').rstrip('.')
+    # currency heuristic
+    cur = mx.get("currency")
+    tx = str(mx.get("text_raw","")).lower()
+    if not cur or pd.isna(cur) or cur=="":
+        cur = "EUR" if ("€" in tx or "eur" in tx or "euro" in tx) else ""
+    return total, cur
+
+
+def _party_names(rows):
+    if rows.empty:
+        return UNSET
+    col = lambda c: rows[c].tolist() if c in rows.columns else [None] * len(rows)
+    names = []
+    for v, t in zip(col("value_norm"), col("text_raw")):
+        nm = (v or t or "").strip().strip('"“”„»«')
+        if nm and nm not in names:
+            names.append(nm)
+    return " | ".join(names)
+
+
+def _term_from_dates(en: dict):
+    if en["StartDate"] and en["EndDate"]:
+        m = months_between(en["StartDate"], en["EndDate"])
         if m is not None:
-            row["TermMonths"] = str(m)
-
-    # NoticeDays
-    notice = df[(df["type"]=="money") & (df["subtype"]=="notice_days")]["value_norm"].tolist()
-    if notice:
-        row["NoticeDays"] = notice[0]
-
-    # AutoRenewMonths
-    ar = df[(df["type"]=="money") & (df["subtype"]=="auto_renew_months")]["value_norm"].tolist()
-    if ar:
-        row["AutoRenewMonths"] = ar[0]
-
-    # Money aggregates
-    monies = df[df["type"]=="money"].copy()
-    if not monies.empty:
-        monies["amount_num"] = monies["text_raw"].apply(_parse_amount)
-        cand = monies[~monies["subtype"].isin(["percent","vat_percent","notice_days","duration_days","duration_months","auto_renew_months","iban","fixed_per_call","price_schedule_monthly","price_schedule_yearly","price_per_year"])].copy()
-        if not cand.empty and cand["amount_num"].notna().any():
-            mx = cand.loc[cand["amount_num"].idxmax()]
-            amt = mx["amount_num"]
-            row["TotalAmount"] = str(int(amt)) if isinstance(amt, float) and amt.is_integer() else (f"{amt:.2f}").rstrip('0').rstrip('.')
-            # currency heuristic
-            cur = mx.get("currency")
-            tx = str(mx.get("text_raw","")).lower()
-            if not cur or pd.isna(cur) or cur=="":
-                cur = "EUR" if ("€" in tx or "eur" in tx or "euro" in tx) else ""
-            row["Currency"] = cur
-
-    # VAT
-    vat = df[(df["type"]=="money") & (df["subtype"]=="vat_percent")]["text_raw"].tolist()
-    if vat:
-        row["VAT_Percent"] = vat[0].replace("٪","%")
-
-    # Costs
-    pm = df[(df["type"]=="money") & (df["subtype"]=="cost_per_month")]
-    if not pm.empty:
-        v = pm.iloc[0]
-        amt = _parse_amount(v.get("text_raw",""))
-        if amt is not None:
-            row["Cost_pM_EUR"] = str(amt)
-    pa = df[(df["type"]=="money") & (df["subtype"]=="cost_per_year")]
-    if not pa.empty:
-        v = pa.iloc[0]
-        amt = _parse_amount(v.get("text_raw",""))
-        if amt is not None:
-            row["Cost_pA_EUR"] = str(amt)
-    ex = df[(df["type"]=="money") & (df["subtype"]=="extra_cost")]
-    if not ex.empty:
-        v = ex.iloc[0]
-        amt = _parse_amount(v.get("text_raw",""))
-        if amt is not None:
-            row["ExtraCosts_EUR"] = str(amt)
-
-    # IDs
-    cid = df[(df["type"]=="id") & (df["subtype"]=="contract_number")]["value_norm"].tolist()
-    if cid: row["ContractNumber"] = cid[0]
-    cust = df[(df["type"]=="id") & (df["subtype"]=="customer_number")]["value_norm"].tolist()
-    if cust: row["CustomerNumber"] = cust[0]
-
-    # Other (DE-focused)
-    rt = df[(df["subtype"]=="reaction_time_hours")]["value_norm"].tolist()
-    if rt: row["ReactionTime_Hours"] = rt[0]
-    bh = df[(df["subtype"]=="business_hours")]["value_norm"].tolist()
-    if bh: row["BusinessHours"] = bh[0]
-    mt = df[(df["subtype"]=="min_term_months")]["value_norm"].tolist()
-    if mt: row["MinTermMonths"] = mt[0]
-    nm = df[(df["subtype"]=="notice_months")]["value_norm"].tolist()
-    if nm: row["NoticeMonths"] = nm[0]
-    fm = df[(df["subtype"]=="free_months")]["value_norm"].tolist()
-    if fm: row["FreeMonths"] = fm[0]
-    we = df[(df["subtype"]=="weekend_surcharge_percent")]["value_norm"].tolist()
-    if we: row["WeekendSurcharge_Percent"] = we[0]
-    juri = df[(df["subtype"]=="jurisdiction")]["value_norm"].tolist()
-    if juri: row["Jurisdiction"] = juri[0]
-    law = df[(df["subtype"]=="governing_law")]["value_norm"].tolist()
-    if law: row["GoverningLaw"] = law[0]
-    cisg = df[(df["subtype"]=="cisg_excluded")]["value_norm"].tolist()
-    if cisg: row["CISG_Excluded"] = cisg[0]
-    payevt = df[(df["subtype"]=="payment_start_event")]["value_norm"].tolist()
-    if payevt: row["PaymentStartEvent"] = payevt[0]
-    auto = df[(df["subtype"]=="auto_renewal")]["value_norm"].tolist()
-    if auto: row["AutoRenewal"] = auto[0]
-
-    # Parties
-    try:
-        parties = df[(df["type"]=="party")]
-        if not parties.empty:
-            names = []
-            for _, r in parties.iterrows():
-                nm = (r.get("value_norm") or r.get("text_raw") or "").strip().strip('"“”„»«')
-                if nm and nm not in names:
-                    names.append(nm)
-            row["Parties"] = " | ".join(names)
-    except Exception:
-        pass
+            return str(m)
+    return UNSET
 
-    # Subject
-    try:
-        subj = df[(df["type"]=="clause") & (df["subtype"]=="subject")]["value_norm"].dropna().tolist()
-        if subj:
-            row["Subject"] = subj[0]
-    except Exception:
-        pass
-
-    return pd.DataFrame([row])
-
-def summarize_de(df: pd.DataFrame) -> pd.DataFrame:
-    base = summarize(df)
-    if base is None or base.empty:
-        cols = ["Parteien","Betreff","Beginn","Ende","Laufzeit_Monate","Kündigungsfrist_Tage","Automatische_Verlängerung_Monate",
-                "Gesamtbetrag","Währung","MwSt_Prozent","Kosten_pro_Monat_EUR","Kosten_pro_Jahr_EUR","Zusätzliche_Kosten_EUR","IBAN","Frist",
-                "Reaktionszeit_Stunden","Arbeitszeiten","Mindestlaufzeit_Monate","Kündigungsfrist_Monate","Freimonate","Wochenend-Zuschlag_%","Gerichtsstand","Rechtswahl","CISG_Ausgeschlossen","Zahlungsbeginn_Ereignis","Automatische_Verlaengerung","Vertragsnummer","Kundennummer"]
-        return pd.DataFrame([{c:"" for c in cols}])
-    row = base.iloc[0].to_dict()
-    de = {
-        "Parteien": row.get("Parties",""),
-        "Betreff": row.get("Subject",""),
-        "Beginn": row.get("StartDate",""),
-        "Ende": row.get("EndDate",""),
-        "Laufzeit_Monate": row.get("TermMonths",""),
-        "Kündigungsfrist_Tage": row.get("NoticeDays",""),
-        "Automatische_Verlängerung_Monate": row.get("AutoRenewMonths",""),
-        "Gesamtbetrag": row.get("TotalAmount",""),
-        "Währung": row.get("Currency",""),
-        "MwSt_Prozent": row.get("VAT_Percent",""),
-        "Kosten_pro_Monat_EUR": row.get("Cost_pM_EUR",""),
-        "Kosten_pro_Jahr_EUR": row.get("Cost_pA_EUR",""),
-        "Zusätzliche_Kosten_EUR": row.get("ExtraCosts_EUR",""),
-        "IBAN": row.get("IBAN",""),
-        "Frist": row.get("Deadline",""),
-        "Reaktionszeit_Stunden": row.get("ReactionTime_Hours",""),
-        "Arbeitszeiten": row.get("BusinessHours",""),
-        "Mindestlaufzeit_Monate": row.get("MinTermMonths",""),
-        "Kündigungsfrist_Monate": row.get("NoticeMonths",""),
-        "Freimonate": row.get("FreeMonths",""),
-        "Wochenend-Zuschlag_%": row.get("WeekendSurcharge_Percent",""),
-        "Gerichtsstand": row.get("Jurisdiction",""),
-        "Rechtswahl": row.get("GoverningLaw",""),
-        "CISG_Ausgeschlossen": row.get("CISG_Excluded",""),
-        "Zahlungsbeginn_Ereignis": row.get("PaymentStartEvent",""),
-        "Automatische_Verlaengerung": row.get("AutoRenewal",""),
-        "Vertragsnummer": row.get("ContractNumber",""),
-        "Kundennummer": row.get("CustomerNumber",""),
-    }
-    return pd.DataFrame([de])
-
-def _first_val(df, expr):
-    try:
-        s = df.query(expr)
-        if not s.empty:
-            return s.iloc[0]
-    except Exception:
-        pass
-    return None
-
-def summarize_keyfacts(text: str, sections: dict, spans_df):
-    # sections: {"1": "...", "2":"...", "3":"...", "4":"..."}
-    kf = {}
-    # Parties (best-effort): look for type=='party'
-    p = spans_df[spans_df["type"]=="party"] if "type" in spans_df.columns else None
-    if p is not None and not p.empty:
-        kf["party_1"] = p[p["subtype"]=="A"]["text_raw"].iloc[0] if "subtype" in p.columns and (p["subtype"]=="A").any() else p.iloc[0]["text_raw"]
-        if len(p) > 1:
-            kf["party_2"] = p.iloc[1]["text_raw"]
+
+# reducers of the key facts: None where no span matches
+def _fact(conv=None):
+    def agg(rows):
+        if rows.empty:
+            return None
+        row = rows.iloc[0]
+        if "value_norm" not in row:
+            return None
+        return conv(row["value_norm"]) if conv else row["value_norm"]
+    return agg
+
+
+def _fact_parties(rows):
+    """party_1 (the first of subtype "A", else the first party) and party_2 (the second; omitted with one party)."""
+    if rows.empty:
+        return None, None
+    if "subtype" in rows.columns and (rows["subtype"]=="A").any():
+        first = rows[rows["subtype"]=="A"]["text_raw"].iloc[0]
     else:
-        kf["party_1"] = None
-        kf["party_2"] = None
-    # Contract type
-    ct = _first_val(spans_df, 'type=="clause" and subtype=="contract_type"') if hasattr(spans_df,"query") else None
-    kf["contract_type"] = (ct["value_norm"] if isinstance(ct, pd.Series) and "value_norm" in ct else None)
-    # Subject snippet from §1
-    s1 = sections.get("1") or ""
-    kf["subject_snippet"] = (s1[:200] + "...") if s1 else None
-    # Fee / currency from money:total_fee within §3
-    fee = _first_val(spans_df, 'type=="money" and subtype=="total_fee"') if hasattr(spans_df,"query") else None
-    kf["total_fee"] = (float(fee["value_norm"]) if isinstance(fee, pd.Series) and "value_norm" in fee else None)
-    kf["currency"] = (fee["currency"] if isinstance(fee, pd.Series) and "currency" in fee else None)
-    # VAT percent
-    vat = _first_val(spans_df, 'subtype=="vat_rate_percent"') if hasattr(spans_df,"query") else None
-    kf["vat_rate_percent"] = (int(vat["value_norm"]) if isinstance(vat, pd.Series) and "value_norm" in vat else None)
-    # Payment terms
-    pay = _first_val(spans_df, 'subtype=="payment_terms_days_after_invoice"') if hasattr(spans_df,"query") else None
-    kf["payment_terms_days"] = (int(pay["value_norm"]) if isinstance(pay, pd.Series) and "value_norm" in pay else None)
-    # Dates
-    sd = _first_val(spans_df, 'type=="date" and subtype=="start_date"') if hasattr(spans_df,"query") else None
-    ed = _first_val(spans_df, 'type=="date" and subtype=="end_date"') if hasattr(spans_df,"query") else None
-    kf["start_date"] = (sd["value_norm"] if isinstance(sd, pd.Series) and "value_norm" in sd else None)
-    kf["end_date"] = (ed["value_norm"] if isinstance(ed, pd.Series) and "value_norm" in ed else None)
-    # Termination
-    tn = _first_val(spans_df, 'subtype=="termination_notice_weeks_to_month_end"') if hasattr(spans_df,"query") else None
-    kf["termination_notice_weeks_to_month_end"] = (int(tn["value_norm"]) if isinstance(tn, pd.Series) and "value_norm" in tn else None)
-    # Law/Jurisdiction (best-effort)
-    law = _first_val(spans_df, 'subtype=="governing_law"') if hasattr(spans_df,"query") else None
-    jur = _first_val(spans_df, 'subtype=="jurisdiction_city"') if hasattr(spans_df,"query") else None
-    kf["governing_law"] = (law["value_norm"] if isinstance(law, pd.Series) and "value_norm" in law else None)
-    kf["jurisdiction_city"] = (jur["value_norm"] if isinstance(jur, pd.Series) and "value_norm" in jur else None)
-    return kf
+        first = rows.iloc[0]["text_raw"]
+    return first, rows.iloc[1]["text_raw"] if len(rows) > 1 else UNSET
+
+
+def _fact_fee(rows):
+    if rows.empty:
+        return None, None
+    row = rows.iloc[0]
+    return (float(row["value_norm"]) if "value_norm" in row else None,
+            row["currency"] if "currency" in row else None)
+
+
+def _snippet(s1):
+    return (s1[:200] + "...") if s1 else None
+
+
+SUMMARY_FIELDS = (
+    Field("party", None, _guarded(_party_names), "Parties", "Parteien"),
+    Field(*_schema("subject"), _guarded(_first_present()), "Subject", "Betreff"),
+    Field(*_schema("start_date"), _first_date, "StartDate", "Beginn"),
+    Field(*_schema("end_date"), _first_date, "EndDate", "Ende"),
+    Field(*_schema("duration_months", type="money"), _first_if_value_column, "TermMonths", "Laufzeit_Monate",
+          when_missing=_term_from_dates),
+    Field("money", "notice_days", _first(), "NoticeDays", "Kündigungsfrist_Tage"),
+    Field("money", "auto_renew_months", _first(), "AutoRenewMonths", "Automatische_Verlängerung_Monate"),
+    Field("money", None, _total_amount, ("TotalAmount", "Currency"), ("Gesamtbetrag", "Währung")),
+    Field("money", "vat_percent", _first("text_raw", lambda v: v.replace("٪","%")), "VAT_Percent", "MwSt_Prozent"),
+    Field("money", "cost_per_month", _amount_text, "Cost_pM_EUR", "Kosten_pro_Monat_EUR"),
+    Field("money", "cost_per_year", _amount_text, "Cost_pA_EUR", "Kosten_pro_Jahr_EUR"),
+    Field("money", "extra_cost", _amount_text, "ExtraCosts_EUR", "Zusätzliche_Kosten_EUR"),
+    Field(None, None, None, "IBAN", "IBAN"),
+    Field("date", "deadline", _first_date, "Deadline", "Frist"),
+    # DE-focused
+    Field(None, "reaction_time_hours", _first(), "ReactionTime_Hours", "Reaktionszeit_Stunden"),
+    Field(None, "business_hours", _first(), "BusinessHours", "Arbeitszeiten"),
+    Field(None, "min_term_months", _first(), "MinTermMonths", "Mindestlaufzeit_Monate"),
+    Field(None, "notice_months", _first(), "NoticeMonths", "Kündigungsfrist_Monate"),
+    Field(None, "free_months", _first(), "FreeMonths", "Freimonate"),
+    Field(None, "weekend_surcharge_percent", _first(), "WeekendSurcharge_Percent", "Wochenend-Zuschlag_%"),
+    Field(None, "jurisdiction", _first(), "Jurisdiction", "Gerichtsstand"),
+    Field(*_schema("governing_law", type=None), _first(), "GoverningLaw", "Rechtswahl"),
+    Field(None, "cisg_excluded", _first(), "CISG_Excluded", "CISG_Ausgeschlossen"),
+    Field(None, "payment_start_event", _first(), "PaymentStartEvent", "Zahlungsbeginn_Ereignis"),
+    Field(*_schema("auto_renewal", type=None), _first(), "AutoRenewal", "Automatische_Verlaengerung"),
+    Field("id", "contract_number", _first(), "ContractNumber", "Vertragsnummer"),
+    Field("id", "customer_number", _first(), "CustomerNumber", "Kundennummer"),
+    # key facts
+    Field("party", None, _fact_parties, key=("party_1", "party_2")),
+    Field(*_schema("contract_type"), _fact(), key="contract_type"),
+    Field(SECTION, "1", _snippet, key="subject_snippet"),
+    Field(*_schema("total_value"), _fact_fee, key=("total_fee", "currency")),
+    Field(*_schema("vat_rate_percent", type=None), _fact(int), key="vat_rate_percent"),
+    Field(*_schema("payment_terms", type=None), _fact(int), key="payment_terms_days"),
+    Field(*_schema("start_date"), _fact(), key="start_date"),
+    Field(*_schema("end_date"), _fact(), key="end_date"),
+    Field(*_schema("termination_notice", type=None), _fact(int), key="termination_notice_weeks_to_month_end"),
+    Field(*_schema("governing_law", type=None), _fact(), key="governing_law"),
+    Field(*_schema("jurisdiction_city", type=None), _fact(), key="jurisdiction_city"),
+)
+
+
+def _names(names) -> tuple:
+    return () if names is None else names if isinstance(names, tuple) else (names,)
+
+
+def _parts(value, n: int) -> tuple:
+    if n == 1:
+        return (value,)
+    return (UNSET,) * n if value is UNSET else value
+
+
+class SummaryPlan:
+    """Fields grouped by the spans they read; ``run`` selects each group's rows once."""
+
+    def __init__(self, fields=SUMMARY_FIELDS):
+        self.fields = tuple(fields)
+        self.groups: dict[tuple, list[int]] = {}
+        for i, f in enumerate(self.fields):
+            self.groups.setdefault((f.type, f.subtype), []).append(i)
+
+    def run(self, spans, sections=None, summary: bool = True, keyfacts: bool = True) -> tuple:
+        """``(en, de, key)`` dicts for ``spans`` (a frame or ``SpanFrame``); None for outputs not asked for.
+
+        ``sections`` ({"1": text, …} or a ``core.sections.SectionIndex``) serves the ``SECTION`` fields.
+        """
+        sf = SpanFrame.of(spans)
+        wanted = [(summary and (f.en or f.de)) or (keyfacts and f.key) for f in self.fields]
+        values = [UNSET] * len(self.fields)
+        for (t, st), idx in self.groups.items():
+            idx = [i for i in idx if wanted[i] and self.fields[i].agg is not None]
+            if not idx:
+                continue
+            src = (sections.get(st) or "") if t == SECTION else sf.rows(t, st)
+            for i in idx:
+                values[i] = self.fields[i].agg(src)
+        en, de = ({}, {}) if summary else (None, None)
+        key = {} if keyfacts else None
+        for f, v, w in zip(self.fields, values, wanted):
+            if not w:
+                continue
+            if summary and (f.en or f.de):
+                en_names, de_names = _names(f.en), _names(f.de)
+                parts = [("" if p is UNSET else p) for p in _parts(v, len(en_names))]
+                if f.when_missing and not parts[0]:
+                    got = f.when_missing(en)
+                    parts[0] = "" if got is UNSET else got
+                en.update(zip(en_names, parts))
+                de.update(zip(de_names, parts))
+            if keyfacts and f.key:
+                names = _names(f.key)
+                key.update((k, p) for k, p in zip(names, _parts(v, len(names))) if p is not UNSET)
+        return en, de, key
+
+
+PLAN = SummaryPlan()
+
+
+def summaries(df, text: str | None = None, sections=None, keyfacts: bool = True) -> tuple:
+    """(English summary, German summary, key facts) of a spans frame (or ``SpanFrame``) in one pass.
+
+    The section texts for the key facts default to the index of ``text``;
+    ``keyfacts=False`` skips those (None in their place).
+    """
+    if keyfacts and sections is None:
+        from core.sections import SectionIndex
+        sections = SectionIndex.of(text or "")
+    en, de, key = PLAN.run(df, sections, keyfacts=keyfacts)
+    return pd.DataFrame([en]), pd.DataFrame([de]), key
+
+
+def summarize(df) -> pd.DataFrame:
+    """One-row English summary of a spans frame (or ``core.spanframe.SpanFrame``)."""
+    return pd.DataFrame([PLAN.run(df, keyfacts=False)[0]])
+
+def summarize_de(df) -> pd.DataFrame:
+    return pd.DataFrame([PLAN.run(df, keyfacts=False)[1]])
+
+def summarize_keyfacts(text: str, sections: dict | None, spans_df):
+    # sections: {"1": "...", "2":"...", "3":"...", "4":"..."} or a core.sections.SectionIndex;
+    # None: the shared index of ``text``
+    if sections is None:
+        from core.sections import SectionIndex
+        sections = SectionIndex.of(text)
+    return PLAN.run(spans_df, sections, summary=False)[2]
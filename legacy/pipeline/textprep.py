@@ -1,34 +1,112 @@
-
 from __future__ import annotations
 import re
+from array import array
+
+import numpy as np
+
+# Normalize various whitespace/dashes and make section headers easier for regex.
+# A 1:1 character table (offsets unchanged), then one scanner pass that only
+# stops at whitespace clusters and "§"; everything between matches is copied
+# verbatim, which is what keeps the offset map small (two anchors per change).
+# The table is applied with str.replace: str.translate has no fast path for
+# non-ASCII tables and is ~50x slower here.
+_CHAR_TABLE = {"\xa0": " ", "–": "-", "—": "-", "‚": "'", "“": '"', "”": '"'}
+
+# Every branch starts with a literal or a char class, so the scanner skips
+# ordinary text (and single spaces between words) without entering Python.
+# (no named groups: they halve scan speed; a match starting with "§" is the section fix)
+_RE_SCAN = re.compile(
+    r"§\s*(?=\d)"                            # §1 / §\n1 -> "§ 1"
+    r"| (?=\s)\s*|\n(?=\s)\s*|[^\S \n]\s*"   # whitespace runs except a lone " " or "\n"
+)
+_RE_MULTISPACE = re.compile(r"[ \t\f\v]+")
+_SIMPLE_WS = frozenset(" \t\f\v")
+
+
+class OffsetMap:
+    """Piecewise map from normalized offsets back to the source text.
+
+    ``out_starts[k]``/``src_starts[k]`` anchor a run copied 1:1 (or a
+    replacement) — offsets inside a run map by adding the distance to its anchor.
+    """
+
+    __slots__ = ("out_starts", "src_starts")
+
+    def __init__(self, out_starts, src_starts):
+        self.out_starts = np.asarray(out_starts, dtype=np.int64)
+        self.src_starts = np.asarray(src_starts, dtype=np.int64)
+
+    def to_source(self, offsets):
+        """Source offset for each normalized offset (scalar or array-like)."""
+        off = np.asarray(offsets, dtype=np.int64)
+        k = np.searchsorted(self.out_starts, off, side="right") - 1
+        k = np.maximum(k, 0)
+        res = self.src_starts[k] + (off - self.out_starts[k])
+        return int(res) if res.ndim == 0 else res
+
+    def span_to_source(self, start: int, end: int) -> tuple[int, int]:
+        """Map a half-open normalized span [start, end) to the source."""
+        if end <= start:
+            s = self.to_source(start)
+            return s, s
+        return self.to_source(start), self.to_source(end - 1) + 1
+
+
+def normalize_text_with_map(s: str) -> tuple[str, OffsetMap]:
+    """Return (normalized text, OffsetMap back into ``s``)."""
+    if not s:
+        return s, OffsetMap([0], [0])
+    t = s
+    for a, b in _CHAR_TABLE.items():
+        if a in t:
+            t = t.replace(a, b)
+    # leading/trailing whitespace (incl. blank lines) is dropped outright
+    lo = len(t) - len(t.lstrip())
+    hi = len(t.rstrip())
+    parts = []
+    out_starts, src_starts = array("q", [0]), array("q", [lo])
+    pos, out = lo, 0
+    for m in _RE_SCAN.finditer(t, lo, hi):
+        g = m.group()
+        if g[0] == "§":
+            rep = "§ "
+        elif "\n" in g or "\r" in g:
+            # the line ends here: trailing/leading blanks go; more than one line
+            # break means blank lines in between, which collapse into one
+            rep = "\n\n" if g.count("\n") + g.count("\r") - g.count("\r\n") > 1 else "\n"
+        elif _SIMPLE_WS.issuperset(g):
+            rep = " "
+        else:
+            # unicode spaces other than NBSP survive inside a line, as before;
+            # only the [ \t\f\v] runs between them collapse
+            a = m.start()
+            for mm in _RE_MULTISPACE.finditer(g):
+                if mm.group() == " ":
+                    continue
+                x, y = a + mm.start(), a + mm.end()
+                parts.append(t[pos:x]); out += x - pos
+                out_starts.append(out); src_starts.append(x)
+                parts.append(" "); out += 1
+                out_starts.append(out); src_starts.append(y)
+                pos = y
+            continue
+        if rep == g:
+            continue
+        a, b = m.span()
+        if a > pos:
+            parts.append(t[pos:a])
+            out += a - pos
+        out_starts.append(out); src_starts.append(a)
+        parts.append(rep)
+        out += len(rep)
+        out_starts.append(out); src_starts.append(b)
+        pos = b
+    parts.append(t[pos:hi])
+    return "".join(parts), OffsetMap(np.frombuffer(out_starts, dtype=np.int64),
+                                     np.frombuffer(src_starts, dtype=np.int64))
 
-# Normalize various whitespace/dashes and make section headers easier for regex
-_RE_MULTISPACE = re.compile(r"[ \t\r\f\v]+")
-_RE_FIX_SECTION_NO_SPACE = re.compile(r"§\s*(\d+)")
-_RE_NBSP = re.compile(u"\xa0")
 
 def normalize_text(s: str) -> str:
     if not s:
         return s
-    # Unify newlines
-    s = s.replace("\r\n", "\n").replace("\r", "\n")
-    # Replace NBSP with normal space
-    s = _RE_NBSP.sub(" ", s)
-    # Unify dashes/quotes
-    s = s.replace("–", "-").replace("—", "-").replace("‚", "'").replace("“", '"').replace("”", '"')
-    # Ensure a space after § numbers: §1 -> § 1
-    s = _RE_FIX_SECTION_NO_SPACE.sub(r"§ \1", s)
-    # Collapse multiple spaces (not newlines)
-    s = "\n".join(_RE_MULTISPACE.sub(" ", line).strip() for line in s.split("\n"))
-    # Deduplicate consecutive blank lines
-    lines = [ln for ln in s.split("\n")]
-    out = []
-    prev_blank = False
-    for ln in lines:
-        blank = (ln.strip() == "")
-        if blank and prev_blank:
-            continue
-        out.append(ln)
-        prev_blank = blank
-    s = "\n".join(out).strip()
-    return s
+    return normalize_text_with_map(s)[0]
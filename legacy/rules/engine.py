@@ -2,70 +2,37 @@
 import pandas as pd
 from typing import Dict, Any
 
-def _to_float_de(s: str):
-    import re as _re
-    s = _re.sub(r'[^0-9\.,]', '', str(s) or '')
-    if '.' in s and ',' in s: s = s.replace('.', '').replace(',', '.')
-    elif ',' in s and '.' not in s: s = s.replace(',', '.')
-    try: return float(s)
-    except: return None
-
-def _parse_date_any(s: str):
-    import re as _re
-    from datetime import datetime
-    s = str(s or "").strip()
-    try:
-        if _re.match(r'^\d{4}-\d{2}-\d{2}$', s):
-            return datetime.strptime(s, "%Y-%m-%d")
-    except: pass
-    m = _re.match(r'^(\d{1,2})\.(\d{1,2})\.(\d{2,4})$', s)
-    if m:
-        dd, mm, yy = m.groups()
-        if len(yy)==2: yy = "20"+yy
-        try:
-            return datetime(int(yy), int(mm), int(dd))
-        except: pass
-    return None
-
-def _span_ids(df: pd.DataFrame):
-    if df is None or len(df)==0: return []
-    col = "span_id" if "span_id" in df.columns else None
-    if col:
-        return [str(x) for x in df[col].head(5).tolist()]
-    return [str(i) for i in df.index.astype(str).tolist()[:5]]
-
-def _exists(df: pd.DataFrame, t: str = None, st: str = None) -> bool:
-    if df is None or df.empty: return False
-    ok = df
-    if t is not None: ok = ok[ok["type"] == t]
-    if st is not None: ok = ok[ok["subtype"] == st]
-    return not ok.empty
-
-def _nums_from(spans: pd.DataFrame, subtype: str):
-    if spans is None or spans.empty: return []
-    df = spans[spans["subtype"]==subtype]
-    if df is None or df.empty: return []
-    vals = df["value_norm"].dropna().astype(str).tolist()
-    nums = [_to_float_de(v) for v in vals]
-    return [x for x in nums if x is not None]
-
-def _any_present(spans: pd.DataFrame, options):
-    if spans is None or spans.empty: return False
-    for opt in options or []:
-        df = spans
-        if "type" in opt: df = df[df["type"]==opt["type"]]
-        if "subtype" in opt: df = df[df["subtype"]==opt["subtype"]]
-        if df is not None and not df.empty: return True
-    return False
-
-def _all_present(spans: pd.DataFrame, reqs):
-    if spans is None or spans.empty: return False
-    for opt in reqs or []:
-        df = spans
-        if "type" in opt: df = df[df["type"]==opt["type"]]
-        if "subtype" in opt: df = df[df["subtype"]==opt["subtype"]]
-        if df is None or df.empty: return False
-    return True
+from core.spanframe import SpanFrame, span_ids as _span_ids
+from core.values import parse_numbers, value_dates, value_nums
+
+def _exists(spans, t: str = None, st: str = None) -> bool:
+    return SpanFrame.of(spans).exists(t, st)
+
+def _nums_from(spans, subtype: str):
+    sf = SpanFrame.of(spans)
+    return [] if sf.empty else value_nums(sf.rows(subtype=subtype)).dropna().tolist()
+
+def _first_date(sf: SpanFrame, subtype: str):
+    """``value_date`` of the first ``subtype`` span with a value, None when it is not a date."""
+    rows = sf.rows(subtype=subtype)
+    d = value_dates(rows[rows["value_norm"].notna()]).iloc[0]
+    return None if pd.isna(d) else d
+
+def _where(spans: SpanFrame, opt) -> pd.DataFrame:
+    """Spans matching the "type"/"subtype" keys of a rule option; a key given as null matches nothing."""
+    if any(k in opt and opt[k] is None for k in ("type", "subtype")):
+        return spans.rows().iloc[0:0]
+    return spans.rows(opt.get("type"), opt.get("subtype"))
+
+def _any_present(spans, options):
+    sf = SpanFrame.of(spans)
+    if sf.empty: return False
+    return any(not _where(sf, opt).empty for opt in options or [])
+
+def _all_present(spans, reqs):
+    sf = SpanFrame.of(spans)
+    if sf.empty: return False
+    return all(not _where(sf, opt).empty for opt in reqs or [])
 
 # Helpers for price coverage
 def _covered_months(price: pd.DataFrame):
@@ -95,19 +62,19 @@ def _covered_months(price: pd.DataFrame):
             except Exception: pass
     return months
 
-def _term_months(spans: pd.DataFrame):
-    if spans is None or spans.empty: return None
+def _term_months(spans):
+    sf = SpanFrame.of(spans)
+    if sf.empty: return None
     for st in ["min_term_months", "term_months", "Laufzeit_Monate"]:
-        df = spans[spans["subtype"]==st]
-        if df is not None and not df.empty:
+        if sf.exists(subtype=st):
             try:
-                val = df["value_norm"].astype(str).iloc[0]
+                val = str(sf.first(st))
                 val = val.replace(',', '.')
                 return int(float(val))
             except Exception: pass
     return None
 
-def price_covers_term(spans: pd.DataFrame, price: pd.DataFrame, tolerance: int = 0):
+def price_covers_term(spans, price: pd.DataFrame, tolerance: int = 0):
     tm = _term_months(spans)
     if not tm or tm<=0:
         return True, "", []  # not applicable
@@ -118,7 +85,7 @@ def price_covers_term(spans: pd.DataFrame, price: pd.DataFrame, tolerance: int =
     msg = f"Fehlende Monate im Preisplan: {missing[:20]}{'...' if len(missing)>20 else ''}"
     return False, msg, ["PriceSchedule"]
 
-def evaluate_net_vat_brutto(spans: pd.DataFrame, tol_eur: float = 1.0):
+def evaluate_net_vat_brutto(spans, tol_eur: float = 1.0):
     net = _nums_from(spans, "net_amount_eur")
     vat_amt = _nums_from(spans, "vat_amount_eur")
     gross = _nums_from(spans, "gross_amount_eur")
@@ -146,8 +113,10 @@ def evaluate_net_vat_brutto(spans: pd.DataFrame, tol_eur: float = 1.0):
     return True  # not applicable
 
 def evaluate_compliance(frames_or_spans, policies: Dict[str, Any]) -> pd.DataFrame:
+    """One row per rule of ``policies``; the spans (a frame or a ``core.spanframe.SpanFrame``)
+    are looked up through their ``(type, subtype)`` index."""
     # Backward compatibility: allow df_spans directly
-    if isinstance(frames_or_spans, pd.DataFrame):
+    if isinstance(frames_or_spans, (pd.DataFrame, SpanFrame)):
         spans = frames_or_spans
         entities = None
         price = None
@@ -156,6 +125,7 @@ def evaluate_compliance(frames_or_spans, policies: Dict[str, Any]) -> pd.DataFra
         spans = frames.get("spans")
         entities = frames.get("entities")
         price = frames.get("price")
+    sf = SpanFrame.of(spans)
 
     out = []
     for rule in policies.get("rules", []):
@@ -169,27 +139,18 @@ def evaluate_compliance(frames_or_spans, policies: Dict[str, Any]) -> pd.DataFra
         try:
             if rtype == "presence":
                 t = rule.get("target"); st = rule.get("subtype")
-                df = spans
-                if df is not None and not df.empty:
-                    if t is not None: df = df[df["type"]==t]
-                    if st is not None: df = df[df["subtype"]==st]
-                passed = (df is not None and not df.empty)
-                if passed: ev_ids = _span_ids(df)
+                passed = sf.exists(t, st)
+                if passed: ev_ids = sf.span_ids(st, type=t)
 
             elif rtype == "min_value":
                 where = rule.get("where", {})
                 field = rule.get("field","value_norm")
                 thr = float(rule.get("threshold", 0))
-                df = spans
-                if df is not None and not df.empty:
-                    if "type" in where: df = df[df["type"] == where["type"]]
-                    if "subtype" in where: df = df[df["subtype"] == where["subtype"]]
-                if df is None or df.empty:
+                df = _where(sf, where)
+                if df.empty:
                     passed = False
                 else:
-                    vals = df[field].dropna().astype(str).tolist()
-                    nums = [ _to_float_de(v) for v in vals ]
-                    nums = [x for x in nums if x is not None]
+                    nums = (value_nums(df) if field == "value_norm" else parse_numbers(df[field])).dropna().tolist()
                     if nums:
                         mx = max(nums)
                         passed = (mx >= thr)
@@ -199,72 +160,58 @@ def evaluate_compliance(frames_or_spans, policies: Dict[str, Any]) -> pd.DataFra
 
             elif rtype == "reaction_time_max_hours":
                 thr = float(rule.get("threshold", 48))
-                df = spans
-                if df is not None and not df.empty:
-                    df = df[(df["subtype"]=="reaction_time_hours")]
-                vals = df["value_norm"].dropna().astype(str).tolist() if df is not None and not df.empty else []
-                nums = [ _to_float_de(v) for v in vals ]
-                nums = [x for x in nums if x is not None]
+                df = sf.rows(subtype="reaction_time_hours")
+                nums = value_nums(df).dropna().tolist() if not df.empty else []
                 passed = (nums and min(nums) <= thr)
-                if nums and df is not None and not df.empty:
+                if nums:
                     mi = min(nums)
                     ev = df[df["value_norm"].astype(str).str.contains(str(int(mi)) if isinstance(mi,float) and mi.is_integer() else str(mi), na=False, regex=False)]
                     if ev is None or ev.empty: ev = df.head(1)
                     ev_ids = _span_ids(ev)
 
             elif rtype == "start_before_end":
-                s = spans[spans["subtype"]=="start_date"] if spans is not None and not spans.empty else None
-                e = spans[spans["subtype"]=="end_date"] if spans is not None and not spans.empty else None
-                if s is not None and not s.empty and e is not None and not e.empty:
-                    ds = _parse_date_any(s["value_norm"].dropna().astype(str).iloc[0])
-                    de = _parse_date_any(e["value_norm"].dropna().astype(str).iloc[0])
+                if sf.exists(subtype="start_date") and sf.exists(subtype="end_date"):
+                    ds = _first_date(sf, "start_date")
+                    de = _first_date(sf, "end_date")
                     if ds and de:
                         passed = (ds <= de)
-                    ev_ids = _span_ids(s.head(1)) + _span_ids(e.head(1))
+                    ev_ids = sf.span_ids("start_date", 1) + sf.span_ids("end_date", 1)
                 else:
                     passed = True  # not applicable
 
             elif rtype == "govlaw_requires_jurisdiction":
-                gl = spans[spans["subtype"]=="governing_law"] if spans is not None and not spans.empty else None
-                if gl is not None and not gl.empty:
-                    j = spans[(spans["type"]=="clause") & (spans["subtype"]=="jurisdiction")]
-                    passed = (j is not None and not j.empty)
-                    ev_ids = _span_ids(gl.head(1)) + (_span_ids(j.head(1)) if j is not None else [])
+                if sf.exists(subtype="governing_law"):
+                    passed = sf.exists("clause", "jurisdiction")
+                    ev_ids = sf.span_ids("governing_law", 1) + sf.span_ids("jurisdiction", 1, type="clause")
                 else:
                     passed = True
 
             elif rtype == "cisg_excluded_if_de_govlaw":
-                gl = spans[spans["subtype"]=="governing_law"] if spans is not None and not spans.empty else None
-                if gl is not None and not gl.empty:
-                    txt = " ".join(gl["text_raw"].dropna().astype(str).tolist()).lower()
+                if sf.exists(subtype="governing_law"):
+                    txt = " ".join(str(v) for v in sf.values("governing_law", "text_raw")).lower()
                     is_de = any(w in txt for w in ["deutsch", "bundesrepublik", "deutsches recht", "german law"])
                     if is_de:
-                        cisg = spans[(spans["type"]=="clause") & (spans["subtype"]=="cisg_excluded")]
-                        passed = (cisg is not None and not cisg.empty)
-                        ev_ids = _span_ids(gl.head(1)) + (_span_ids(cisg.head(1)) if cisg is not None else [])
+                        passed = sf.exists("clause", "cisg_excluded")
+                        ev_ids = sf.span_ids("governing_law", 1) + sf.span_ids("cisg_excluded", 1, type="clause")
                     else:
                         passed = True
                 else:
                     passed = True
 
             elif rtype == "vat_present_if_eur":
-                has_eur = False; df = spans
-                if df is not None and not df.empty:
-                    mny = df[df["type"]=="money"]
-                    if mny is not None and not mny.empty:
-                        txt = " ".join(mny["text_raw"].dropna().astype(str).tolist()).lower()
-                        has_eur = ("€" in txt) or ("eur" in txt) or ("euro" in txt)
-                        if has_eur: ev_ids = _span_ids(mny.head(2))
+                has_eur = False
+                if sf.exists("money"):
+                    txt = " ".join(str(v) for v in sf.values(col="text_raw", type="money")).lower()
+                    has_eur = ("€" in txt) or ("eur" in txt) or ("euro" in txt)
+                    if has_eur: ev_ids = sf.span_ids(n=2, type="money")
                 if has_eur:
-                    vat = spans[(spans["type"]=="money") & (spans["subtype"]=="vat_percent")] if spans is not None else None
-                    passed = (vat is not None and not vat.empty)
-                    if vat is not None and not vat.empty:
-                        ev_ids += _span_ids(vat.head(1))
+                    passed = sf.exists("money", "vat_percent")
+                    ev_ids += sf.span_ids("vat_percent", 1, type="money")
                 else:
                     passed = True
 
             elif rtype == "price_schedule_exists_if_costs":
-                has_cost = _exists(spans, "money", "cost_per_month") or _exists(spans, "money", "cost_per_year")
+                has_cost = sf.exists("money", "cost_per_month") or sf.exists("money", "cost_per_year")
                 if has_cost:
                     passed = (price is not None and not price.empty)
                     if passed: ev_ids = ["PriceSchedule"]
@@ -279,7 +226,7 @@ def evaluate_compliance(frames_or_spans, policies: Dict[str, Any]) -> pd.DataFra
                         py["y"] = pd.to_numeric(py.get("year_index"), errors="coerce").fillna(_np.nan)
                         py = py.dropna(subset=["y"])
                         py["y"] = py["y"].astype(int)
-                        py["amt"] = py.get("amount_eur").apply(_to_float_de)
+                        py["amt"] = parse_numbers(py.get("amount_eur"))
                         y1 = py[py["y"]==1]
                         if not y1.empty and y1["amt"].fillna(0).min() == 0:
                             passed = True; ev_ids = ["PriceSchedule:Y1=0"]
@@ -302,35 +249,26 @@ def evaluate_compliance(frames_or_spans, policies: Dict[str, Any]) -> pd.DataFra
                 options = rule.get("options", [])
                 ev_ids = []; ok = False
                 for opt in options:
-                    df = spans
-                    if df is not None and not df.empty:
-                        if "type" in opt: df = df[df["type"]==opt["type"]]
-                        if "subtype" in opt: df = df[df["subtype"]==opt["subtype"]]
-                    if df is not None and not df.empty:
-                        ok = True; ev_ids += _span_ids(df.head(1))
+                    df = _where(sf, opt)
+                    if not df.empty:
+                        ok = True; ev_ids += _span_ids(df, 1)
                 passed = ok
 
             elif rtype == "presence_implies":
                 cond = rule.get("if", []); need = rule.get("then", [])
                 cond_hit = False; cids = []
                 for opt in cond:
-                    df = spans
-                    if df is not None and not df.empty:
-                        if "type" in opt: df = df[df["type"]==opt["type"]]
-                        if "subtype" in opt: df = df[df["subtype"]==opt["subtype"]]
-                    if df is not None and not df.empty:
-                        cond_hit = True; cids += _span_ids(df.head(1))
+                    df = _where(sf, opt)
+                    if not df.empty:
+                        cond_hit = True; cids += _span_ids(df, 1)
                 if cond_hit:
                     all_ok = True; nids = []
                     for opt in need:
-                        df2 = spans
-                        if df2 is not None and not df2.empty:
-                            if "type" in opt: df2 = df2[df2["type"]==opt["type"]]
-                            if "subtype" in opt: df2 = df2[df2["subtype"]==opt["subtype"]]
-                        if df2 is None or df2.empty:
+                        df2 = _where(sf, opt)
+                        if df2.empty:
                             all_ok = False
                         else:
-                            nids += _span_ids(df2.head(1))
+                            nids += _span_ids(df2, 1)
                     passed = all_ok; ev_ids = cids + nids
                 else:
                     passed = True
@@ -339,32 +277,26 @@ def evaluate_compliance(frames_or_spans, policies: Dict[str, Any]) -> pd.DataFra
                 cond = rule.get("if", []); opts = rule.get("any", [])
                 cond_hit = False; cids = []
                 for opt in cond:
-                    df = spans
-                    if df is not None and not df.empty:
-                        if "type" in opt: df = df[df["type"]==opt["type"]]
-                        if "subtype" in opt: df = df[df["subtype"]==opt["subtype"]]
-                    if df is not None and not df.empty:
-                        cond_hit = True; cids += _span_ids(df.head(1))
+                    df = _where(sf, opt)
+                    if not df.empty:
+                        cond_hit = True; cids += _span_ids(df, 1)
                 if cond_hit:
                     any_ok = False; nids = []
                     for opt in opts:
-                        df2 = spans
-                        if df2 is not None and not df2.empty:
-                            if "type" in opt: df2 = df2[df2["type"]==opt["type"]]
-                            if "subtype" in opt: df2 = df2[df2["subtype"]==opt["subtype"]]
-                        if df2 is not None and not df2.empty:
-                            any_ok = True; nids += _span_ids(df2.head(1))
+                        df2 = _where(sf, opt)
+                        if not df2.empty:
+                            any_ok = True; nids += _span_ids(df2, 1)
                     passed = any_ok; ev_ids = cids + nids
                 else:
                     passed = True
 
             elif rtype == "monthly_yearly_consistency":
                 tol = float(rule.get("tolerance_pct", 5.0)) / 100.0
-                m = spans[spans["subtype"]=="cost_per_month"] if spans is not None and not spans.empty else None
-                y = spans[spans["subtype"]=="cost_per_year"] if spans is not None and not spans.empty else None
-                if m is not None and not m.empty and y is not None and not y.empty:
-                    mv = [ _to_float_de(v) for v in m["value_norm"].astype(str).tolist() ]
-                    yv = [ _to_float_de(v) for v in y["value_norm"].astype(str).tolist() ]
+                m = sf.rows(subtype="cost_per_month")
+                y = sf.rows(subtype="cost_per_year")
+                if not m.empty and not y.empty:
+                    mv = value_nums(m).fillna(0).tolist()
+                    yv = value_nums(y).fillna(0).tolist()
                     ok = False
                     for i, mm in enumerate(mv):
                         for j, yy in enumerate(yv):
@@ -379,25 +311,24 @@ def evaluate_compliance(frames_or_spans, policies: Dict[str, Any]) -> pd.DataFra
                     passed = True
 
             elif rtype == "payment_annual_requires_advance":
-                df_int = spans[spans["subtype"]=="payment_interval"] if spans is not None and not spans.empty else None
-                has_y = df_int is not None and not df_int.empty and any("jähr" in str(x).lower() for x in df_int["value_norm"].astype(str).tolist())
-                has_cost_y = _exists(spans, "money", "cost_per_year")
+                df_int = sf.rows(subtype="payment_interval")
+                has_y = not df_int.empty and any("jähr" in str(x).lower() for x in df_int["value_norm"].astype(str).tolist())
+                has_cost_y = sf.exists("money", "cost_per_year")
                 if has_y and has_cost_y:
-                    adv = spans[(spans["subtype"]=="payment_advance")]
-                    passed = (adv is not None and not adv.empty)
-                    ev_ids = (_span_ids(df_int.head(1)) if df_int is not None else []) + (_span_ids(adv.head(1)) if adv is not None else [])
+                    passed = sf.exists(subtype="payment_advance")
+                    ev_ids = _span_ids(df_int, 1) + sf.span_ids("payment_advance", 1)
                 else:
                     passed = True
 
             elif rtype == "price_covers_term":
-                ok, msg2, ev = price_covers_term(spans, price, tolerance=int(rule.get("tolerance", 0)))
+                ok, msg2, ev = price_covers_term(sf, price, tolerance=int(rule.get("tolerance", 0)))
                 passed = ok
                 if msg2: msg = msg + " | " + msg2 if msg else msg2
                 ev_ids = ev
 
             elif rtype == "net_vat_brutto_consistency":
                 tol = float(rule.get("tolerance_eur", 1.0))
-                passed = evaluate_net_vat_brutto(spans, tol_eur=tol)
+                passed = evaluate_net_vat_brutto(sf, tol_eur=tol)
 
             else:
                 passed = False
@@ -0,0 +1,67 @@
+import importlib
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _write_docs(tmp_path):
+    (tmp_path / "a.txt").write_text(
+        "Servicevertrag Nr. SV-2024-0815\nDer Vertrag beginnt am 01.01.2024 und endet am 31.12.2026.\n"
+        "Die Vergütung beträgt 12.500,00 EUR jährlich. Gerichtsstand ist Berlin.\n", encoding="utf-8")
+    (tmp_path / "b.txt").write_text("Kontakt: service@example.com\n", encoding="utf-8")
+    # binary content: no reader accepts it (readers are picked by content, not suffix)
+    (tmp_path / "ignored.xyz").write_bytes(b"\x00\x01\x02 not a contract")
+
+
+def _no_cache(monkeypatch):
+    cache = importlib.import_module("pipeline.cache")
+    monkeypatch.setattr(cache, "_default_cache", False)
+
+
+def test_run_batch_combines_documents(tmp_path, monkeypatch):
+    monkeypatch.chdir(ROOT)
+    _no_cache(monkeypatch)
+    batch_mod = importlib.import_module("pipeline.batch")
+    _write_docs(tmp_path)
+    out = tmp_path / "batch.xlsx"
+
+    res = batch_mod.run_batch(tmp_path, workers=2, output_excel=str(out))
+
+    assert set(res["spans"]["doc_id"]) == {"a", "b"}
+    assert set(res["compliance"]["doc_id"]) == {"a", "b"}
+    assert list(res["summary"]["doc_id"]) == ["a", "b"]
+    assert res["failures"].empty
+    sheets = pd.read_excel(out, sheet_name=None)
+    assert {"Spans", "Compliance", "ContractSummary", "ContractSummary_DE", "Failures"} <= set(sheets)
+    assert "doc_id" in sheets["Compliance"].columns
+
+
+def test_run_batch_records_failures(tmp_path, monkeypatch):
+    monkeypatch.chdir(ROOT)
+    _no_cache(monkeypatch)
+    batch_mod = importlib.import_module("pipeline.batch")
+    _write_docs(tmp_path)
+
+    res = batch_mod.run_batch([tmp_path / "a.txt", tmp_path / "ignored.xyz"], workers=1)
+
+    assert list(res["failures"]["doc_id"]) == ["ignored"]
+    assert "Unsupported" in res["failures"]["error"].iloc[0]
+    assert set(res["spans"]["doc_id"]) == {"a"}
+
+
+def test_doc_ids_unique_across_subfolders(tmp_path, monkeypatch):
+    monkeypatch.chdir(ROOT)
+    _no_cache(monkeypatch)
+    batch_mod = importlib.import_module("pipeline.batch")
+    for sub, city in (("a", "Berlin"), ("b", "Hamburg")):
+        (tmp_path / sub).mkdir()
+        (tmp_path / sub / "vertrag.txt").write_text(f"Gerichtsstand ist {city}.\n", encoding="utf-8")
+    (tmp_path / "b" / "vertrag.docx").write_bytes(b"not read here")
+
+    assert [d for _, d in batch_mod.collect_documents(tmp_path)] == ["a/vertrag", "b/vertrag.docx", "b/vertrag.txt"]
+    assert [d for _, d in batch_mod.collect_documents([tmp_path / "a" / "vertrag.txt", tmp_path / "b" / "vertrag.txt"])] == [
+        "vertrag.txt", "vertrag.txt~2"]
+    res = batch_mod.run_batch(tmp_path / "a", workers=1)
+    assert set(res["spans"]["doc_id"]) == {"vertrag"}
@@ -0,0 +1,42 @@
+import importlib
+
+TEXT = "Vertragsbeginn: ٠١.٠٢.٢٠٢٤\r\nDie Vergütung beträgt ١٬٢٠٠ EUR monatlich.\nİstanbul ŞUBE\n\nKündigungsfrist 30 Tage"
+
+
+def test_views_match_direct_computation():
+    DocumentContext = importlib.import_module("core.context").DocumentContext
+    from core.scan import fold
+    from core.utils import normalize_digits
+    ctx = DocumentContext.of(TEXT)
+    assert DocumentContext.of(TEXT) is ctx
+    assert ctx.digits == normalize_digits(TEXT) and ctx.digits is ctx.digits
+    assert ctx.lower == TEXT.lower() and ctx.folded == fold(TEXT)
+    assert ctx.lines == TEXT.splitlines(keepends=True)
+    for pos in range(len(TEXT)):
+        i = ctx.line_of(pos)
+        assert ctx.line_starts[i] <= pos < ctx.line_starts[i + 1]
+    plain = "ohne arabische Ziffern"
+    assert DocumentContext.of(plain).digits is plain
+
+
+def test_extractors_share_the_digit_normalized_text():
+    from core.scan import DocumentScan
+    from extractors.dates import DateExtractor
+    from extractors.money import MoneyExtractor
+    scan = DocumentScan(TEXT)
+    money, dates = scan.attach(MoneyExtractor()), scan.attach(DateExtractor())
+    assert money.context(TEXT) is dates.context(TEXT) is scan.context
+    assert money.extract("d", TEXT).model_dump() == MoneyExtractor().extract("d", TEXT).model_dump()
+    assert [it.value_norm for it in dates.extract("d", TEXT).items] == ["01.02.2024"]
+
+
+def test_recent_contexts_are_shared_between_threads():
+    from concurrent.futures import ThreadPoolExecutor
+    from core.utils import RecentByIdentity
+    recent = RecentByIdentity(list, maxsize=4)
+    texts = [f"Vertrag {i}" for i in range(64)]
+    with ThreadPoolExecutor(8) as ex:
+        built = list(ex.map(recent, texts * 20))
+    assert all(b == list(t) for b, t in zip(built, texts * 20))
+    assert len(recent._items) == 4
+    assert recent(texts[-1]) is recent(texts[-1])
@@ -0,0 +1,37 @@
+import importlib
+
+import numpy as np
+
+
+def test_locate_maps_offsets_to_page_and_para():
+    document = importlib.import_module("core.document")
+    text = "§ 1 Gegenstand\nA\n\n§ 2 Pflichten\nB\n\n\n§ 3 Vergütung\nC"
+    doc = document.DocumentText(text, page_starts=[0, text.index("§ 2")])
+
+    offsets = [0, text.index("A"), text.index("§ 2"), text.index("B"), text.index("C"), None]
+    pages, paras = doc.locate(offsets)
+
+    assert pages.tolist() == [1, 1, 2, 2, 2, 0]
+    assert paras.tolist() == [1, 1, 2, 2, 3, 0]
+
+
+def test_locate_without_pages_and_explicit_paragraphs():
+    document = importlib.import_module("core.document")
+    doc = document.DocumentText("ab\ncd\nef", para_starts=[0, 3, 6])
+    pages, paras = doc.locate(np.array([0, 4, 8]))
+    assert pages is None
+    assert paras.tolist() == [1, 2, 3]
+
+
+def test_batches_to_df_fills_para_for_docx_offsets(tmp_path):
+    writers = importlib.import_module("io_ops.writers")
+    document = importlib.import_module("core.document")
+    from core.schemas import ExtractBatch, ExtractItem
+    doc = document.DocumentText("Kopf\nGerichtsstand Berlin\nEnde", para_starts=[0, 5, 26])
+    items = [ExtractItem(item_type="clause", text_raw="Berlin", start=19, end=25, extractor="t", version="1"),
+             ExtractItem(item_type="clause", text_raw="Ende", start=26, end=30, para=7, extractor="t", version="1")]
+
+    df = writers.batches_to_df([ExtractBatch(doc_id="d", items=items)], doc)
+
+    assert df["para"].tolist() == [2, 7]      # explicit para from the extractor wins
+    assert df["page"].isna().all()
@@ -0,0 +1,95 @@
+import importlib
+
+import pytest
+
+docx = pytest.importorskip("docx")
+
+
+def _make_docx(path):
+    from docx.enum.text import WD_BREAK
+    d = docx.Document()
+    d.add_paragraph("§ 1 Vertragsgegenstand")
+    p = d.add_paragraph("Zeile A")
+    p.add_run().add_break()
+    p.add_run("nach Umbruch\tTab")
+    p.add_run().add_break(WD_BREAK.PAGE)
+    d.add_paragraph("")
+    t = d.add_table(rows=3, cols=3)
+    for i in range(3):
+        for j in range(3):
+            t.cell(i, j).text = f" c{i}{j} "
+    t.cell(0, 0).merge(t.cell(0, 1))   # gridSpan
+    t.cell(1, 2).merge(t.cell(2, 2))   # vMerge
+    d.add_paragraph("§ 2 Vergütung 1.200,00 EUR")
+    d.save(str(path))
+
+
+def test_docx_model_matches_python_docx(tmp_path):
+    dm = importlib.import_module("io_ops.docx_model")
+    path = tmp_path / "v.docx"
+    _make_docx(path)
+
+    m = dm.load_docx(str(path))
+    ref = docx.Document(str(path))
+
+    assert m.paragraphs == [p.text for p in ref.paragraphs]
+    assert m.tables == [[[c.text for c in r.cells] for r in t.rows] for t in ref.tables]
+    assert m.tables_stripped[0][0] == ["c00 \n c01", "c00 \n c01", "c02"]
+
+
+def test_read_docx_offsets_point_at_parts(tmp_path):
+    readers = importlib.import_module("io_ops.readers")
+    path = tmp_path / "v.docx"
+    _make_docx(path)
+
+    text, tables, starts = readers.read_docx(str(path))
+
+    assert (text, tables) == readers.read_docx_text_and_tables(str(path))
+    assert text[starts[0]:].startswith("§ 1 Vertragsgegenstand")
+    assert text[starts[2]:].startswith("§ 2 Vergütung")
+    assert text[starts[3]:].startswith("c00 \n c01 | c00 \n c01 | c02")
+
+
+def test_reader_fallback_uses_docx_model(tmp_path):
+    rdr = importlib.import_module("pipeline.reader")
+    path = tmp_path / "v.docx"
+    _make_docx(path)
+
+    text, meta = rdr.read_docx_with_fallback(str(path))
+
+    assert meta["engine"] == "docx-xml" and meta["had_fallback"] is False
+    assert "§ 2 Vergütung" in text and "c02" in text
+
+
+def test_nested_tables_are_not_listed(tmp_path):
+    dm = importlib.import_module("io_ops.docx_model")
+    d = docx.Document()
+    outer = d.add_table(rows=2, cols=2)
+    outer.cell(0, 0).text = "Leistung"
+    outer.cell(0, 1).text = "Preis"
+    inner = outer.cell(1, 0).add_table(rows=1, cols=2)
+    inner.cell(0, 0).text = "innen"
+    inner.cell(0, 1).text = "100 EUR"
+    outer.cell(1, 1).text = "1.200,00 EUR"
+    d.add_table(rows=1, cols=1).cell(0, 0).text = "zweite"
+    path = tmp_path / "nested.docx"
+    d.save(str(path))
+
+    m = dm.load_docx(str(path))
+    ref = docx.Document(str(path))
+    assert m.tables == [[[c.text for c in r.cells] for r in t.rows] for t in ref.tables]
+    assert len(m.tables) == 2 and m.tables[1] == [["zweite"]]
+
+
+def test_external_entities_are_not_expanded(tmp_path):
+    import io
+    dm = importlib.import_module("io_ops.docx_model")
+    secret = tmp_path / "secret.txt"
+    secret.write_text("GEHEIM", encoding="utf-8")
+    xml = (f'<?xml version="1.0"?><!DOCTYPE d [<!ENTITY x SYSTEM "{secret.as_uri()}">]>'
+           '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+           '<w:body><w:p><w:r><w:t>a&x;b</w:t></w:r></w:p></w:body></w:document>').encode()
+
+    m = dm.parse_document_xml(io.BytesIO(xml))
+
+    assert not any("GEHEIM" in p for p in m.paragraphs)
@@ -0,0 +1,125 @@
+import importlib
+import logging
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+TEXT = "Vertragsbeginn: 01.02.2024. Die Vergütung beträgt 1.200,00 EUR monatlich. Gerichtsstand ist Berlin."
+
+
+def test_from_config_builds_once_and_matches_fresh_instances(monkeypatch):
+    monkeypatch.chdir(ROOT)
+    es_mod = importlib.import_module("pipeline.extractor_set")
+    registry = importlib.import_module("core.registry")
+    registry.load_extractors()
+    classes = [importlib.import_module(f"extractors.{m}").__dict__[c] for m, c in (
+        ("dates", "DateExtractor"), ("money", "MoneyExtractor"), ("legal", "LegalExtractor"))]
+    # other tests empty the registry; pin the classes this test resolves against
+    monkeypatch.setitem(registry.REGISTRY, "extractors", classes)
+    cfg = {"use_extractors": ["money", "dates", "legal", "no_such_extractor"]}
+    es = es_mod.ExtractorSet.from_config(cfg)
+    assert es.classes == classes
+    instances = list(es)
+    for doc in ("a", "b"):
+        batches = es.extract(doc, TEXT)
+        fresh = [c().extract(doc, TEXT) for c in es.classes]
+        assert [b.model_dump() for b in batches] == [b.model_dump() for b in fresh]
+    assert list(es) == instances
+    assert es_mod.shared_extractor_set(cfg) is es_mod.shared_extractor_set(dict(cfg))
+
+
+def test_logger_mode_skips_failing_extractors(caplog):
+    es_mod = importlib.import_module("pipeline.extractor_set")
+    from core.schemas import ExtractBatch
+
+    class _Broken:
+        def __init__(self):
+            raise RuntimeError("no model")
+
+    class _Fails:
+        def extract(self, doc_id, text):
+            raise ValueError("bad text")
+
+    class _Ok:
+        def extract(self, doc_id, text):
+            return ExtractBatch(doc_id=doc_id, items=[])
+
+    es = es_mod.ExtractorSet([_Broken, _Fails, _Ok], logger=logging.getLogger("test.extractor_set"))
+    assert es.classes == [_Fails, _Ok]
+    with caplog.at_level(logging.ERROR):
+        assert [b.doc_id for b in es.extract("d", "x")] == ["d"]
+    assert "Extractor run failed: _Fails" in caplog.text
+
+
+class _Backtracking:
+    # catastrophic backtracking: runs for hours unless the worker is killed
+    __extractor_name__ = "backtracking"
+
+    def extract(self, doc_id, text):
+        import re
+        re.match(r"(a+)+$", "a" * 64 + "b")
+
+
+def test_parallel_mode_cancels_extractor_over_budget(monkeypatch):
+    import time
+    monkeypatch.chdir(ROOT)
+    es_mod = importlib.import_module("pipeline.extractor_set")
+    classes = [importlib.import_module(f"extractors.{m}").__dict__[c] for m, c in (
+        ("dates", "DateExtractor"), ("money", "MoneyExtractor"))]
+    serial = es_mod.ExtractorSet(classes).extract("d", TEXT)
+
+    es = es_mod.ExtractorSet(classes + [_Backtracking], mode="parallel", workers=2,
+                             budget_s=20, budgets_s={"backtracking": 0.5})
+    t0 = time.perf_counter()
+    batches = es.run("d", TEXT)
+    assert time.perf_counter() - t0 < 10
+    assert batches[-1] is None
+    assert [b.model_dump() for b in batches[:-1]] == [b.model_dump() for b in serial]
+    assert [(d["extractor"], d["status"]) for d in es.diagnostics] == [
+        ("dates", "ok"), ("money", "ok"), ("backtracking", "timeout")]
+
+    # only the killed worker left the pool; it is replaced on the next run
+    survivor = [w.process.pid for w in es._pool]
+    assert len(survivor) == 1
+    es.run("e", TEXT, instances=list(es)[:2])
+    pids = [w.process.pid for w in es._pool]
+    assert len(pids) == 2 and survivor[0] in pids
+    es.close()
+
+
+def test_parallel_pool_is_reused_across_documents(monkeypatch):
+    monkeypatch.chdir(ROOT)
+    es_mod = importlib.import_module("pipeline.extractor_set")
+    classes = [importlib.import_module(f"extractors.{m}").__dict__[c] for m, c in (
+        ("dates", "DateExtractor"), ("money", "MoneyExtractor"), ("legal", "LegalExtractor"))]
+    es = es_mod.ExtractorSet(classes, mode="parallel", workers=2)
+    try:
+        first = es.run("a", TEXT)
+        pids = {w.process.pid for w in es._pool}
+        second = es.run("b", TEXT.replace("Berlin", "Hamburg"))
+        assert {w.process.pid for w in es._pool} == pids
+        assert [b.doc_id for b in first + second] == ["a"] * 3 + ["b"] * 3
+        serial = es_mod.ExtractorSet(classes).extract("b", TEXT.replace("Berlin", "Hamburg"))
+        assert [b.model_dump() for b in second] == [b.model_dump() for b in serial]
+    finally:
+        es.close()
+    assert es._pool == []
+
+
+def test_skipped_extractor_is_not_cached(tmp_path, monkeypatch):
+    monkeypatch.chdir(ROOT)
+    cache = importlib.import_module("pipeline.cache")
+    stages = importlib.import_module("pipeline.stages")
+    es_mod = importlib.import_module("pipeline.extractor_set")
+    from core.document import DocumentText
+    doc = tmp_path / "c.txt"
+    doc.write_text(TEXT, encoding="utf-8")
+    reader = lambda p: (DocumentText(Path(p).read_text(encoding="utf-8")), [])
+    store = cache.ResultCache(cache.MemoryLRU(64))
+    dates = importlib.import_module("extractors.dates").DateExtractor
+    es = es_mod.ExtractorSet([dates, _Backtracking], mode="parallel", budgets_s={"backtracking": 0.3})
+
+    result, ran = stages.run_stages(doc, "c", reader, es, store=store)
+    assert ran["extract:dates"] == "run" and ran["extract:backtracking"] == "skipped"
+    assert [d["status"] for d in result["diagnostics"]] == ["ok", "timeout"]
+    _, ran = stages.run_stages(doc, "c", reader, es, store=store)
+    assert ran["extract:dates"] == "hit" and ran["extract:backtracking"] == "skipped"
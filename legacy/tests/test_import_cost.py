@@ -0,0 +1,30 @@
+import importlib
+import json
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_parse_importtime():
+    bench = importlib.import_module("bench.importtime")
+    err = ("import time: self [us] | cumulative | imported package\n"
+           "import time:       100 |        100 |   yaml.error\n"
+           "import time:       300 |        400 | yaml\n"
+           "import time:        50 |        450 | pipeline\n")
+    assert bench.parse_importtime(err) == {"yaml.error": (1, 100), "yaml": (0, 400), "pipeline": (0, 450)}
+
+
+def test_entry_points_do_not_import_heavy_modules():
+    bench = importlib.import_module("bench.importtime")
+    results = {m: {"ms": 0.0, "forbidden": bench.measure(m)[1]} for m in bench.ENTRY_POINTS}
+    baseline = json.loads(bench.BASELINE.read_text(encoding="utf-8"))
+    assert set(bench.ENTRY_POINTS) <= set(baseline["modules"])
+    assert bench.check(results, baseline) == []
+
+
+def test_extractors_load_on_first_use(monkeypatch):
+    monkeypatch.chdir(ROOT)
+    api = importlib.import_module("pipeline.runner_api")
+    names = {c.__extractor_name__ for c in api._enabled_extractor_classes({"use_extractors": ["money", "dates"]})}
+    assert names <= {"money", "dates"}
+    assert importlib.import_module("core.registry")._extractors_loaded
@@ -0,0 +1,86 @@
+import importlib
+import random
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+LINES = ["Die Vergütung beträgt 1.200,00 EUR monatlich.", "Vertragsbeginn: 01.02.2024, endet am 31.12.2025.",
+         "Kündigungsfrist 30 Tage.", "Netto 1.000 EUR, MwSt 19 %", "IBAN DE89370400440532013000",
+         "verlängert sich um 12 Monate", "Frist: 5. März 2024", "Text ohne Zahlen.", ""]
+
+
+def _contract(rnd, n):
+    return "\n".join(f"({i}) {rnd.choice(LINES)}" for i in range(n))
+
+
+def _edit(text, rnd, n):
+    lines = text.split("\n")
+    for _ in range(n):
+        i = rnd.randrange(len(lines))
+        op = rnd.random()
+        if op < .3:
+            lines.pop(i)
+        elif op < .6:
+            lines.insert(i, rnd.choice(LINES))
+        else:
+            lines[i] = rnd.choice(LINES) + " binnen 7 Tagen"
+    return "\n".join(lines)
+
+
+def test_revision_matches_full_extraction_and_scans_only_changes():
+    inc = importlib.import_module("pipeline.incremental")
+    from core.scan import DocumentScan
+    from extractors.dates import DateExtractor
+    from extractors.money import MoneyExtractor
+
+    scanned = []
+
+    class _Dates(DateExtractor):
+        def extract(self, doc_id, text):
+            scanned.append(len(text))
+            return super().extract(doc_id, text)
+
+    rnd = random.Random(3)
+    for cls in (MoneyExtractor, _Dates):
+        ext = cls()
+        for n in (0, 1, 4):
+            old = _contract(rnd, 8000)
+            new = _edit(old, rnd, n)
+            full = DocumentScan(new).attach(ext).extract("d", new)
+            before = DocumentScan(old).attach(ext).extract("d", old)
+            del scanned[:]
+            revised = inc.revise_spans(ext, "d", old, before, new)
+            assert revised.model_dump() == inc.in_text_order(full).model_dump()
+            if cls is _Dates:
+                # each change costs at most its zone plus one margin each side
+                assert sum(scanned) <= n * (4 * ext.context_margin + 200) < len(new)
+    assert inc.revise_spans(object(), "d", "a", None, "b") is None
+
+
+def test_extract_stage_revises_changed_document(monkeypatch):
+    monkeypatch.chdir(ROOT)
+    cache = importlib.import_module("pipeline.cache")
+    stages = importlib.import_module("pipeline.stages")
+    es_mod = importlib.import_module("pipeline.extractor_set")
+    from extractors.dates import DateExtractor
+    from extractors.legal import LegalExtractor
+    from extractors.money import MoneyExtractor
+
+    rnd = random.Random(5)
+    old = _contract(rnd, 3000) + "\nGerichtsstand ist Berlin."
+    new = _edit(old, rnd, 2)
+    classes = [DateExtractor, MoneyExtractor, LegalExtractor]
+    es = es_mod.ExtractorSet(classes, incremental=True)
+    store = cache.ResultCache(cache.MemoryLRU(64))
+
+    runner = stages.StageRunner(store)
+    stages.extract_stage(runner, "r1", "c", old, es)
+    assert set(runner.ran.values()) == {"run"}
+
+    runner = stages.StageRunner(store)
+    _, batches = stages.extract_stage(runner, "r2", "c", new, es)
+    assert runner.ran == {"extract:dates": "revised", "extract:money": "revised", "extract:legal": "run"}
+    assert [d["status"] for d in es.diagnostics] == ["ok"] * 3
+
+    runner = stages.StageRunner(cache.ResultCache(cache.MemoryLRU(64)))
+    _, fresh = stages.extract_stage(runner, "r2", "c", new, es)
+    assert [b.model_dump() for b in batches] == [b.model_dump() for b in fresh]
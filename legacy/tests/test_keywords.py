@@ -0,0 +1,56 @@
+import importlib
+import random
+import re
+
+WORDS = ["Frist", "frist", "endet am", "end", "Ende", "p.m", "PRO MONAT", "monatlich", "Jährlich", "JAHRLICH",
+         "ſ", "ı", "K", "in", "kraft", "قبل", "يورو", "€", "30", "12.03.2024", " ", " ", "\n", ".", "xx"]
+KEYWORDS = [("frist", "kündigungsfrist"), ("endet am", "end"), ("p.m", "pro monat", "/monat"), ("in kraft",), ("قبل",)]
+
+
+def _texts(n=60, seed=5, extra=()):
+    rnd = random.Random(seed)
+    words = WORDS + list(extra)
+    for _ in range(n):
+        yield "".join(rnd.choice(words) for _ in range(rnd.randint(1, 120)))
+
+
+def test_within_matches_window_test():
+    KeywordIndex = importlib.import_module("core.keywords").KeywordIndex
+    # "İ" lowercases to two code points: those texts keep answering from windows
+    for text in _texts(extra=["İ"]):
+        idx = KeywordIndex(text)
+        # enough queries that every keyword set switches to its index
+        for a in range(-5, len(text) + 1, 3):
+            for b in (a + 1, a + 17, a + 60):
+                if b <= 0:
+                    continue
+                for kws in KEYWORDS:
+                    assert idx.within(kws, a, b) == any(k in text[max(0, a):b].lower() for k in kws), (text, a, b, kws)
+
+
+def test_first_matches_ignorecase_search():
+    KeywordIndex = importlib.import_module("core.keywords").KeywordIndex
+    sla = importlib.import_module("extractors.sla_extra").SLAExtraExtractor
+    for text in _texts(seed=9, extra=["HALBJÄHRLICH", "viertelJahrlich", "quartalsweise", "İ"]):
+        idx = KeywordIndex(text, casefold=True)
+        for a in range(0, len(text) + 1, 2):
+            b = a + 40
+            m = sla.rx_period_generic.search(text[a:b])
+            assert idx.first(sla.period_words, a, b) == (m and (a + m.start(), a + m.end())), (text, a)
+
+
+def test_date_classes_unchanged():
+    dates = importlib.import_module("extractors.dates").DateExtractor
+
+    def reference(text, start, end, w=dates.window):
+        ctx = (text[max(0, start - w):start] + " " + text[end:end + w]).lower()
+        for subtype, kws, _ in dates._classes:
+            if any(k in ctx for k in kws):
+                return subtype
+        return None
+
+    ext = dates()
+    for text in _texts(n=40, seed=11, extra=["Gültig", "ab", "last", "date", "Beginn", "Deadline", "01.02.2025"]):
+        text = text * 5  # dense enough to index
+        for m in re.finditer(r"\d{2}\.\d{2}\.\d{4}", text):
+            assert ext._classify(text, m.start(), m.end()) == reference(text, m.start(), m.end())
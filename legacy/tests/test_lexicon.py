@@ -0,0 +1,43 @@
+import importlib
+import os
+
+YAML = """concepts:
+  - id: gwl
+    label: Gewährleistung
+    patterns:
+      - "Gewährleistung"
+      - "Response\\s*Time"
+"""
+
+
+def test_lexicon_compiled_once_per_process():
+    lexicon = importlib.import_module("extractors.lexicon")
+    a, b = lexicon.LexiconExtractor(), lexicon.LexiconExtractor()
+    assert a.lexicon is b.lexicon and a.concepts is b.concepts
+    assert a.extract("d", "Die Gewährleistung beträgt 12 Monate.").items
+
+
+def test_lexicon_reloads_when_file_changes(tmp_path):
+    lexicon = importlib.import_module("extractors.lexicon")
+    path = tmp_path / "lex.yml"
+    path.write_text(YAML, encoding="utf-8")
+    first = lexicon.load_lexicon(path)
+    assert [rx.pattern for rx in first.concepts[0]["patterns"]] == ["Gewährleistung", r"Response\s*Time"]
+    assert lexicon.load_lexicon(path) is first
+
+    path.write_text(YAML.replace("gwl", "garantie"), encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+    second = lexicon.load_lexicon(path)
+    assert second is not first and second.concepts[0]["id"] == "garantie"
+    assert second.digest != first.digest
+
+
+def test_cache_key_follows_lexicon_digest(monkeypatch):
+    cache = importlib.import_module("pipeline.cache")
+    lexicon = importlib.import_module("extractors.lexicon")
+    cls = lexicon.LexiconExtractor
+    v1 = cache.extractor_version(cls)
+    assert v1.startswith(cls.__version__ + "+")
+    monkeypatch.setattr(cls, "data_digest", classmethod(lambda c: "f" * 64))
+    assert cache.extractor_version(cls) != v1
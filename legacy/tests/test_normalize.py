@@ -0,0 +1,38 @@
+import importlib
+
+import pandas as pd
+
+TEXT = ("Dienstleistungsvertrag\n§ 3 Vergütung\nUmsatzsteuer (derzeit 19%)\n30 Tage nach Rechnungserhalt\n"
+        "§ 4 Laufzeit\ntritt am 01.02.2024 in Kraft und endet am 31.12.2025\n§ 6 Schlussbestimmungen\nGerichtsstand: Berlin.")
+
+
+def _spans():
+    rows = [("party", None, "§ 1 Vertragsgegenstand", None), ("party", "org", "Muster GmbH", "Muster GmbH"),
+            ("money", None, "Die Vergütung beträgt 1.200 EUR", None), ("money", None, "300 €", ""),
+            ("money", None, "300 €", None), ("money", "percent", "eur 5", None),
+            ("clause", None, "§ 1 Vertragsgegenstand\nDie Wartung", None),
+            ("date", "start_date", "01.01.2024", None)]
+    return pd.DataFrame({"doc_id": "d", "type": [r[0] for r in rows], "subtype": [r[1] for r in rows],
+                         "text_raw": [r[2] for r in rows], "value_norm": [r[2] for r in rows],
+                         "currency": [r[3] for r in rows], "span_id": [f"sp_{i:06d}" for i in range(1, 9)]})
+
+
+def test_normalize_fills_and_derives_facts():
+    normalize = importlib.import_module("pipeline.normalize")
+    df, key = normalize.normalize_spans(_spans(), TEXT)
+    # the title "party" is dropped; "€" fills only an empty-string currency, the word EUR any missing one
+    assert list(df["text_raw"][:7]) == ["Muster GmbH", "Die Vergütung beträgt 1.200 EUR", "300 €", "300 €", "eur 5",
+                                        "§ 1 Vertragsgegenstand\nDie Wartung", "01.01.2024"]
+    assert df["currency"][1:3].tolist() == ["EUR", "EUR"] and pd.isna(df["currency"][3]) and df["currency"][4] == "EUR"
+    assert df["subtype"][:7].tolist() == ["org", "total_fee", "unspecified", "unspecified", "percent", "subject", "start_date"]
+    derived = df[df["extractor"] == "Normalizer"]
+    assert derived["subtype"].tolist() == ["contract_type", "vat_rate_percent", "payment_terms_days_after_invoice",
+                                           "end_date", "jurisdiction"]
+    assert derived["span_id"].tolist() == [f"sp_{i:06d}" for i in range(8, 13)]
+    assert derived["value_norm"].tolist() == ["Dienstleistungsvertrag", 19.0, 30, "2025-12-31", "Berlin"]
+    k = key.iloc[0]
+    assert (k["party_1"], k["contract_type"], k["total_fee"], k["currency"]) == (
+        "Muster GmbH", "Dienstleistungsvertrag", "Die Vergütung beträgt 1.200 EUR", "EUR")
+    assert (k["start_date"], k["end_date"], k["jurisdiction_city"], k["governing_law"]) == (
+        "01.01.2024", "2025-12-31", "Berlin", None)
+    assert k["subject_snippet"] == "§ 1 Vertragsgegenstand" and k["vat_rate_percent"] == 19.0
@@ -0,0 +1,60 @@
+import importlib
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+
+def _make_pdf(path, pages):
+    doc = fitz.open()
+    for body in pages:
+        doc.new_page().insert_text((72, 72), body)
+    doc.save(str(path))
+    doc.close()
+
+
+def test_iter_pdf_pages_offsets_match_joined_text(tmp_path):
+    readers = importlib.import_module("io_ops.readers")
+    pdf = tmp_path / "annex.pdf"
+    _make_pdf(pdf, ["Seite eins", "Gerichtsstand ist Berlin.", "Seite drei"])
+
+    pages = list(readers.iter_pdf_pages(str(pdf)))
+    text, starts = readers.read_pdf_pages(str(pdf))
+
+    assert [p[0] for p in pages] == [1, 2, 3]
+    assert text == "\n".join(p[1] for p in pages) == readers.read_pdf_text(str(pdf))
+    for page_no, page_text, offset in pages:
+        assert text[offset:offset + len(page_text)] == page_text
+    assert starts == [p[2] for p in pages]
+
+
+def test_batches_to_df_fills_page_from_offsets(tmp_path):
+    readers = importlib.import_module("io_ops.readers")
+    writers = importlib.import_module("io_ops.writers")
+    from core.schemas import ExtractBatch, ExtractItem
+    pdf = tmp_path / "annex.pdf"
+    _make_pdf(pdf, ["Seite eins", "Gerichtsstand ist Berlin.", "Seite drei"])
+    doc = readers.read_pdf_document(str(pdf))
+    text = doc.text
+
+    items = [ExtractItem(item_type="clause", text_raw=w, start=text.index(w), end=text.index(w) + len(w),
+                         extractor="t", version="1") for w in ("eins", "Berlin", "drei")]
+    items.append(ExtractItem(item_type="other", text_raw="x", extractor="t", version="1"))
+    df = writers.batches_to_df([ExtractBatch(doc_id="annex", items=items)], doc)
+
+    assert df["page"].tolist()[:3] == [1, 2, 3]
+    assert df["page"].isna().iloc[3]
+
+
+def test_page_parallel_matches_serial(tmp_path):
+    readers = importlib.import_module("io_ops.readers")
+    pdf = tmp_path / "bundle.pdf"
+    n = readers.PDF_PAGES_PER_TASK * 3 + 5
+    _make_pdf(pdf, [f"Anlage {i}: Kosten {i},00 EUR" for i in range(1, n + 1)])
+
+    serial = readers.read_pdf_pages(str(pdf))
+    parallel = readers.read_pdf_pages(str(pdf), workers=3)
+
+    assert parallel == serial
+    assert len(parallel[1]) == n
+    assert "Anlage 40:" in parallel[0][parallel[1][39]:]
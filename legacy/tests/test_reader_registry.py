@@ -0,0 +1,47 @@
+import importlib
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _docx_bytes():
+    docx = pytest.importorskip("docx")
+    import io
+    d = docx.Document()
+    d.add_paragraph("§ 1 Vertragsgegenstand")
+    buf = io.BytesIO()
+    d.save(buf)
+    return buf.getvalue()
+
+
+def test_reader_chosen_by_content_not_suffix(tmp_path):
+    formats = importlib.import_module("io_ops.formats")
+    data = _docx_bytes()
+    renamed = tmp_path / "contract.bin"
+    renamed.write_bytes(data)
+    assert formats.detect_reader(str(renamed)).__reader_name__ == "docx"
+    assert formats.detect_reader(data).__reader_name__ == "docx"
+    doc, tables = formats.read_document(str(renamed))
+    assert "Vertragsgegenstand" in doc.text and tables == []
+
+    txt = tmp_path / "contract.pdf"
+    txt.write_text("Laufzeit 24 Monate", encoding="utf-8")
+    assert formats.detect_reader(str(txt)).__reader_name__ == "txt"
+    assert formats.detect_reader(b"junk\n%PDF-1.7\n").__reader_name__ == "pdf"
+    assert formats.read_document("Prämie".encode("latin-1"))[0].text == "Prämie"
+    with pytest.raises(ValueError, match="Unsupported"):
+        formats.read_document(b"\x00\x01\x02")
+    assert {".pdf", ".docx", ".txt"} <= set(formats.supported_suffixes())
+
+
+def test_txt_run_does_not_import_heavy_readers(tmp_path):
+    p = tmp_path / "a.txt"
+    p.write_text("Vertrag", encoding="utf-8")
+    code = ("import sys, pipeline.reader, io_ops.formats as f; f.read_document(sys.argv[1]);"
+            "print(sorted(m for m in ('fitz', 'docx', 'docx2txt', 'lxml') if m in sys.modules))")
+    out = subprocess.run([sys.executable, "-c", code, str(p)], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
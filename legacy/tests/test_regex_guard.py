@@ -0,0 +1,42 @@
+import importlib
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_cap_repeats_bounds_only_open_repeats():
+    cap = importlib.import_module("core.regex_guard").cap_repeats
+    assert cap(r"\bCISG\b.*?(?:nicht|keine)", 50) == r"\bCISG\b.{0,50}?(?:nicht|keine)"
+    assert cap(r"\d+[.,*+]?\d{2,}\s{1,3}x{4}", 50) == r"\d{1,50}[.,*+]?\d{2,50}\s{1,3}x{4}"
+    assert cap(r"a*+b?+c{2}+\*+[]*]+", 50) == r"a{0,50}+b?+c{2}+\*{1,50}[]*]{1,50}"
+    assert cap(r"[^]a]*x", 50) == r"[^]a]{0,50}x"
+
+
+def test_guarded_patterns_match_like_originals(monkeypatch):
+    monkeypatch.chdir(ROOT)
+    monkeypatch.syspath_prepend(str(ROOT))
+    bench = importlib.import_module("bench.regex")
+    guard = importlib.import_module("core.regex_guard").guard
+    text = bench.contract_text(20000)
+    for name, rx in bench.patterns():
+        g = guard(rx)
+        assert g.flags == rx.flags
+        assert [m.span() for m in g.finditer(text)] == [m.span() for m in rx.finditer(text)], name
+
+
+def test_guard_keeps_keyword_scans_linear(monkeypatch):
+    monkeypatch.chdir(ROOT)
+    monkeypatch.syspath_prepend(str(ROOT))
+    bench = importlib.import_module("bench.regex")
+    terms = importlib.import_module("extractors.terms").TermsExtractor
+    rx = terms.rx_min_term
+    text = bench.adversarial_text(rx, 32000)
+    assert "mindestlaufzeit" in text and not rx.search(text)
+    ext = terms()
+    t0 = time.perf_counter()
+    assert not list(ext.finditer(rx, text))
+    guarded = time.perf_counter() - t0
+    raw = bench.timed(rx, text, repeat=1)
+    # quadratic: every keyword reads to the end of the text without the guard
+    assert guarded * 4 < raw
@@ -0,0 +1,97 @@
+import importlib
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+class _Ext:
+    __extractor_name__ = "dates"
+    __version__ = "1.0"
+
+
+def test_memory_lru_evicts_oldest():
+    cache = importlib.import_module("pipeline.cache")
+    lru = cache.MemoryLRU(max_items=2)
+    lru.put("a", 1); lru.put("b", 2)
+    assert lru.get("a") == 1          # touch a -> b is now oldest
+    lru.put("c", 3)
+    assert lru.get("b") is None and lru.get("a") == 1 and lru.get("c") == 3
+
+
+def test_disk_store_size_eviction(tmp_path):
+    cache = importlib.import_module("pipeline.cache")
+    disk = cache.DiskStore(tmp_path, max_bytes=3000)
+    for i in range(5):
+        disk.put(f"{i:064x}", b"x" * 1000)
+    assert disk.size() <= 3000
+    assert disk.get(f"{4:064x}") == b"x" * 1000
+    assert disk.get(f"{0:064x}") is None
+
+
+def test_key_depends_on_extractor_version_and_policies(tmp_path):
+    cache = importlib.import_module("pipeline.cache")
+    pol = tmp_path / "policies.yml"
+    pol.write_text("rules: []\n", encoding="utf-8")
+    k1 = cache.pipeline_key("abc", [_Ext], policies_path=pol)
+    assert k1 == cache.pipeline_key("abc", [_Ext], policies_path=pol)
+
+    class _Ext2(_Ext):
+        __version__ = "1.1"
+    assert cache.pipeline_key("abc", [_Ext2], policies_path=pol) != k1
+    pol.write_text("rules: [{id: X}]\n", encoding="utf-8")
+    assert cache.pipeline_key("abc", [_Ext], policies_path=pol) != k1
+
+
+def test_process_document_served_from_cache(tmp_path, monkeypatch):
+    monkeypatch.chdir(ROOT)
+    cache = importlib.import_module("pipeline.cache")
+    runner = importlib.import_module("pipeline.runner_api")
+    rc = cache.ResultCache(cache.MemoryLRU(4), cache.DiskStore(tmp_path / "cache"))
+    monkeypatch.setattr(cache, "_default_cache", rc)
+    doc = tmp_path / "v1.txt"
+    doc.write_text("Der Vertrag beginnt am 01.01.2024. Kontakt: a@b.de\n", encoding="utf-8")
+
+    first = runner.process_document(str(doc))
+    monkeypatch.setattr(runner, "_read_input", lambda p: (_ for _ in ()).throw(AssertionError("reader called")))
+    copy = tmp_path / "v2.txt"
+    copy.write_bytes(doc.read_bytes())
+    second = runner.process_document(str(copy))
+
+    assert rc.hits["memory"] == 1
+    assert second["doc_id"] == "v2" and (second["spans"]["doc_id"] == "v2").all()
+    assert second["spans"].drop(columns="doc_id").equals(first["spans"].drop(columns="doc_id"))
+    # disk tier alone also serves the entry
+    rc.memory.clear()
+    assert runner.process_document(str(copy))["doc_id"] == "v2"
+    assert rc.hits["disk"] == 1
+
+
+def test_disk_store_scans_only_to_evict(tmp_path, monkeypatch):
+    cache = importlib.import_module("pipeline.cache")
+    disk = cache.DiskStore(tmp_path, max_bytes=10_000)
+    disk.put("0" * 64, b"x" * 1000)
+    scans = []
+    entries = disk.entries
+    monkeypatch.setattr(disk, "entries", lambda: scans.append(1) or entries())
+    for i in range(1, 8):
+        disk.put(f"{i:064x}", b"x" * 1000)
+    disk.put(f"{1:064x}", b"x" * 1000)  # overwriting an entry does not grow the total
+    assert scans == []
+    for i in range(8, 14):
+        disk.put(f"{i:064x}", b"x" * 1000)
+    assert scans and disk.size() <= 10_000 and disk.get("0" * 64) is None
+
+
+def test_ui_rerun_served_from_cache(monkeypatch):
+    import pandas as pd
+    from tests.helpers import FakeUpload
+    ui = importlib.import_module("app.ui_streamlit")
+    calls = []
+    monkeypatch.setattr(ui, "build_entities_links",
+                        lambda df, doc_id, text: calls.append(doc_id) or (pd.DataFrame(), pd.DataFrame()))
+    up = FakeUpload("rerun.txt", b"Cache-Test: Gerichtsstand Hamburg.")
+    first = ui.run_local_pipeline(up)
+    second = ui.run_local_pipeline(up)
+    assert calls == ["rerun"]  # entities, compliance, summaries and the workbook were not rebuilt
+    assert second[1].equals(first[1]) and second[0] == first[0]
+    assert second[6].getvalue() == first[6].getvalue()
@@ -0,0 +1,46 @@
+import importlib
+import random
+import re
+
+TEXT = ("§ 5 Vergütung\nAnfahrtskosten: 45,00 € pauschal. FAHRTKOSTEN 0,80 €/km. Verfügbarkeit 98,5 %.\n"
+        "Gerichtsstand ist München. Reaktionszeit innerhalb von 4 Stunden. Zahlung per SEPA-Lastschrift "
+        "monatlich im Voraus; ÜBERWEISUNG möglich. Kundennummer: K-77. Servicevertrag Nr. SV-1.\n"
+        "Pflichten des Kunden: Mitwirkung. Haftung ist begrenzt.\n")
+
+
+def test_literal_prefixes():
+    scan = importlib.import_module("core.scan")
+    assert scan.literal_prefixes(re.compile(r"\b(Anfahrt|Fahrtkosten)\b", re.I)) == ("anfa", "fahr")
+    assert scan.literal_prefixes(re.compile(r"[ÜU]berweisung")) == ("Uber", "Über")
+    # digit-led or too short: scanned the normal way
+    assert scan.literal_prefixes(re.compile(r"\d+\s*EUR")) is None
+    assert scan.literal_prefixes(re.compile(r"a\d")) is None
+
+
+def test_document_scan_matches_finditer():
+    scan = importlib.import_module("core.scan")
+    pats = [re.compile(p, f) for p, f in [
+        (r"\b(Anfahrt|Anfahrtskosten|Fahrtkosten)\b", re.I), (r"Gerichtsstand\b.*?([A-ZÄÖÜ]\w+)", re.I),
+        (r"\breaktionszeit\b.*?\b(\d{1,3})\s*(?:stunden|h)\b", re.I | re.S), (r"[ÜU]berweisung", re.I),
+        (r"(?<!x)ss|ſs", re.I), (r"Kunden-?Nr\.|Kundennummer", 0), (r"\d{1,3},\d{2}", 0)]]
+    words = re.findall(r"\w+|\W", TEXT) + ["ſ", "ı", "İ", "K", "ẞ", "ß", "SS", "xss"]
+    rnd = random.Random(3)
+    for _ in range(200):
+        text = "".join(rnd.choice(words) for _ in range(300))
+        ds = scan.DocumentScan(text, pats)
+        for rx in pats:
+            assert [m.span() for m in ds.finditer(rx, text)] == [m.span() for m in rx.finditer(text)], rx.pattern
+
+
+def test_extractors_same_items_with_shared_scan():
+    scan = importlib.import_module("core.scan")
+    names = ("extractors.payment", "extractors.sla", "extractors.ids", "extractors.obligations_liability")
+    classes = [getattr(importlib.import_module(n), a) for n, a in zip(names, (
+        "PaymentExtractor", "SLAExtractor", "IdsExtractor", "ObligationsLiabilityExtractor"))]
+    text = TEXT * 20
+    shared = scan.attach_scan([c() for c in classes], text)
+    for cls in classes:
+        plain = cls().extract("d", text).items
+        scanned = shared.attach(cls()).extract("d", text).items
+        assert [i.model_dump() for i in scanned] == [i.model_dump() for i in plain]
+        assert plain
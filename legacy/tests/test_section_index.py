@@ -0,0 +1,60 @@
+import importlib
+import random
+import re
+
+PARTS = ["§ 1 Vertragsgegenstand", "§3 Vergütung", "§ 4 Laufzeit", "§ 6 Gerichtsstand", "1. Vertragsgegenstand",
+         "1 Vertragsgegenstandes", "2) Pflichten", "3 Zahlung", "4. KÜNDIGUNG", "§ 30 Foo", "gemäß § 3 Abs. 2",
+         "5. Sonstiges", "§ 2 leistungsumfang", "\n", "\n\n", "  ", "\r\n", " text "]
+TITLES = {1: "Vertragsgegenstand", 2: "Pflichten|Leistungsumfang", 3: "Vergütung|Verguetung|Zahlung",
+          4: "Vertragsdauer|Laufzeit|Kündigung|Kuendigung"}
+
+
+def _texts(n=1500, seed=1):
+    rnd = random.Random(seed)
+    for _ in range(n):
+        yield "".join(rnd.choice(PARTS) for _ in range(rnd.randint(0, 25)))
+
+
+def _paragraph(text, num):
+    # pipeline.normalize._section before the index
+    m = re.search(rf"(§\s*{num}\s+\w+.*?)(?=\n\s*§\s*\d+\s+\w+|$)", text, re.S | re.I)
+    return m.group(1) if m else None
+
+
+def _span(text, num):
+    # service_contract._find_section / the UI's _find_section_span before the index
+    rx = {n: re.compile(rf"(§\s*{n}\s+({t})|^\s*{n}[.)]?\s+({t}))", re.I | re.M) for n, t in TITLES.items()}
+    m = rx[num].search(text)
+    if not m:
+        return None
+    ends = [n.start() for n in (rx[k].search(text, m.end()) for k in TITLES if k > num) if n]
+    return m.start(), min(ends + [len(text)])
+
+
+def test_lookups_match_header_regexes():
+    SectionIndex = importlib.import_module("core.sections").SectionIndex
+    for text in _texts():
+        idx = SectionIndex(text)
+        for num in range(1, 7):
+            assert idx.section(num) == _paragraph(text, num), (text, num)
+        for num in TITLES:
+            assert idx.span(num) == _span(text, num), (text, num)
+
+
+def test_subject_section_unchanged():
+    sections = importlib.import_module("extractors.sections")
+    head = re.compile(r"(^|\n)\s*1[.)]?\s+Vertragsgegenstand\b", re.I)
+    nxt = re.compile(r"(?:\n|\r)(?:\s*§\s*\d+\s+\w+|\s*\d+[.)]\s+\w+)", re.I)
+    for text in _texts(seed=2):
+        m = head.search(text)
+        n = m and nxt.search(text, m.end())
+        expected = m and text[m.start():n.start() if n else len(text)].strip()
+        assert sections._extract_section(text) == (expected or None), text
+
+
+def test_index_shared_per_text():
+    SectionIndex = importlib.import_module("core.sections").SectionIndex
+    text = "§ 1 Vertragsgegenstand\nA\n§ 3 Vergütung\nB"
+    idx = SectionIndex.of(text)
+    assert SectionIndex.of(text) is idx
+    assert idx.get("3") == "§ 3 Vergütung\nB" and idx.get("2") is None
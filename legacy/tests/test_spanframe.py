@@ -0,0 +1,70 @@
+import importlib
+import sys
+
+import pandas as pd
+
+
+def _spans():
+    rows = [("date", "start_date", "01.02.2024"), ("money", "cost_per_month", None), ("money", "vat_percent", "19 %"),
+            ("clause", None, "x"), ("date", "start_date", "01.03.2024"), ("money", "cost_per_month", "100 EUR"),
+            ("clause", "jurisdiction", "Berlin")]
+    return pd.DataFrame({"type": [r[0] for r in rows], "subtype": [r[1] for r in rows], "value_norm": [r[2] for r in rows],
+                         "text_raw": [str(r[2]) for r in rows], "span_id": [f"s{i}" for i in range(len(rows))]},
+                        index=[10, 3, 7, 1, 4, 9, 2])
+
+
+def test_lookups_match_boolean_masks():
+    SpanFrame = importlib.import_module("core.spanframe").SpanFrame
+    df = _spans()
+    sf = SpanFrame(df)
+    for t, st in [("money", "cost_per_month"), (None, "start_date"), ("clause", None), (None, None), ("date", "vat_percent")]:
+        mask = pd.Series(True, index=df.index)
+        if t is not None: mask &= df["type"] == t
+        if st is not None: mask &= df["subtype"] == st
+        assert sf.rows(t, st).equals(df[mask])
+        assert sf.exists(t, st) == bool(mask.any())
+    assert pd.isna(sf.first("cost_per_month")) and sf.values("cost_per_month") == ["100 EUR"]
+    assert sf.first("start_date") == "01.02.2024" and sf.first("missing", default="") == ""
+    assert sf.span_ids("start_date", 1) == ["s0"] and sf.span_ids(type="money", n=2) == ["s1", "s2"]
+    assert not SpanFrame(None).exists() and SpanFrame(None).values("x") == [] and SpanFrame.of(sf) is sf
+
+
+def test_rules_and_summary_accept_a_spanframe(monkeypatch):
+    # other tests leave stub rules / rules.engine modules in sys.modules
+    for name in ("rules", "rules.engine"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    SpanFrame = importlib.import_module("core.spanframe").SpanFrame
+    engine = importlib.import_module("rules.engine")
+    summarize = importlib.import_module("pipeline.summarize")
+    df = _spans()
+    policies = {"rules": [{"id": "r1", "type": "presence", "target": "clause", "subtype": "jurisdiction"},
+                          {"id": "r2", "type": "presence_any", "options": [{"type": "money", "subtype": None}, {"subtype": "vat_percent"}]},
+                          {"id": "r3", "type": "start_before_end"}]}
+    out = engine.evaluate_compliance({"spans": SpanFrame(df)}, policies)
+    assert out.equals(engine.evaluate_compliance(df, policies))
+    assert out["passed"].tolist() == [True, True, True]
+    assert summarize.summarize(SpanFrame(df)).equals(summarize.summarize(df))
+    row = summarize.summarize(df).iloc[0]
+    assert (row["StartDate"], row["VAT_Percent"], row["Cost_pM_EUR"], row["Jurisdiction"]) == ("2024-02-01", "19 %", "", "Berlin")
+
+
+def test_span_schema_survives_normalize_and_concat():
+    spanframe = importlib.import_module("core.spanframe")
+    from core.spans import SpanBuffer
+    from io_ops.writers import batches_to_df
+    from pipeline.normalize import normalize_spans
+    frames = []
+    for doc_id, fee in (("a", "Die Vergütung beträgt 300 €"), ("b", "1.200 EUR")):
+        buf = SpanBuffer(doc_id, "MoneyExtractor", "1")
+        buf.add("money", fee, start=0, end=len(fee))
+        buf.add("clause", "§ 1 Vertragsgegenstand\nWartung")
+        df = batches_to_df([buf])
+        assert isinstance(df["subtype"].dtype, pd.CategoricalDtype) and str(df["start"].dtype) == "Int64"
+        df, _ = normalize_spans(df, "Dienstleistungsvertrag\n" + fee)
+        assert isinstance(df["subtype"].dtype, pd.CategoricalDtype)
+        frames.append(df)
+    assert frames[0]["subtype"].tolist()[:2] == ["total_fee", "subject"] and frames[1]["currency"][0] == "EUR"
+    corpus = spanframe.concat_spans(frames)
+    assert all(isinstance(corpus[c].dtype, pd.CategoricalDtype) for c in spanframe.CATEGORY_COLUMNS)
+    assert corpus["doc_id"].tolist() == ["a"] * len(frames[0]) + ["b"] * len(frames[1])
+    assert corpus["start"].tolist()[:2] == [0, pd.NA]
@@ -0,0 +1,39 @@
+import importlib
+import pickle
+
+import pytest
+
+TEXT = "Vertragsbeginn: 01.02.2024. Die Vergütung beträgt 1.200,00 EUR monatlich, zahlbar binnen 30 Tagen. Netto 1.000 EUR"
+
+
+def test_buffer_matches_extract_items():
+    spans = importlib.import_module("core.spans")
+    from core.schemas import ExtractItem
+    buf = spans.SpanBuffer("d", "X", "1.0")
+    buf.add("money", "30 Tage", "duration_days", "30", unit="days", start=5, end=12)
+    buf.add("date", "01.02.2024", confidence=1)
+    assert buf.validate() is buf and buf.confidence == [1.0, 1.0]
+    assert [it.model_dump() for it in buf.items] == [
+        ExtractItem(item_type="money", subtype="duration_days", text_raw="30 Tage", value_norm="30", unit="days",
+                    start=5, end=12, extractor="X", version="1.0").model_dump(),
+        ExtractItem(item_type="date", text_raw="01.02.2024", extractor="X", version="1.0").model_dump()]
+    assert pickle.loads(pickle.dumps(buf)).model_dump() == buf.model_dump() == buf.batch().model_dump()
+
+    buf.add("amount", "x")
+    with pytest.raises(ValueError, match="row 2: invalid item_type"):
+        buf.validate()
+
+
+def test_frame_from_buffers_and_batches():
+    writers = importlib.import_module("io_ops.writers")
+    money = importlib.import_module("extractors.money").MoneyExtractor
+    legal = importlib.import_module("extractors.legal").LegalExtractor
+    batches = [money().extract("d", TEXT), legal().extract("d", TEXT + " Gerichtsstand ist Berlin.")]
+    assert type(batches[0]).__name__ == "SpanBuffer" and type(batches[1]).__name__ == "ExtractBatch"
+    df = writers.batches_to_df(batches)
+    items = [it for b in batches for it in b.items]
+    assert len(df) == len(items) and list(df["span_id"])[-1] == f"sp_{len(items):06d}"
+    assert list(df["type"]) == [it.item_type for it in items]
+    assert list(df["text_raw"]) == [it.text_raw for it in items]
+    assert list(df["extractor"]) == [it.extractor for it in items]
+    assert "net_amount_eur" in set(df["subtype"])
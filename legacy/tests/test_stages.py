@@ -0,0 +1,51 @@
+import importlib
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _fake_extractor(name, version):
+    from core.schemas import ExtractBatch, ExtractItem
+
+    class _Ext:
+        __extractor_name__ = name
+        __version__ = version
+        calls = 0
+
+        def extract(self, doc_id, text):
+            type(self).calls += 1
+            i = text.find("Berlin")
+            return ExtractBatch(doc_id=doc_id, items=[ExtractItem(
+                item_type="clause", subtype="jurisdiction", text_raw="Berlin", value_norm="Berlin",
+                start=i, end=i + 6, extractor=name, version=version)])
+    return _Ext
+
+
+def test_policy_change_reruns_only_compliance(tmp_path, monkeypatch):
+    monkeypatch.chdir(ROOT)
+    cache = importlib.import_module("pipeline.cache")
+    stages = importlib.import_module("pipeline.stages")
+    store = cache.ResultCache(cache.MemoryLRU(64))
+    doc = tmp_path / "c.txt"
+    doc.write_text("Gerichtsstand ist Berlin.\n", encoding="utf-8")
+    pol = tmp_path / "policies.yml"
+    pol.write_text("rules: []\n", encoding="utf-8")
+    from core.document import DocumentText
+    reader = lambda p: (DocumentText(Path(p).read_text(encoding="utf-8")), [])
+    a, b = _fake_extractor("a", "1.0"), _fake_extractor("b", "1.0")
+
+    _, ran = stages.run_stages(doc, "c", reader, [a, b], store=store, policies_path=str(pol))
+    assert set(ran.values()) == {"run"}
+
+    _, ran = stages.run_stages(doc, "c", reader, [a, b], store=store, policies_path=str(pol))
+    assert set(ran.values()) == {"hit"}
+
+    pol.write_text("rules:\n  - {id: R-X, type: presence, target: clause, severity: low}\n", encoding="utf-8")
+    _, ran = stages.run_stages(doc, "c", reader, [a, b], store=store, policies_path=str(pol))
+    assert [k for k, v in ran.items() if v == "run"] == ["compliance"]
+
+    b2 = _fake_extractor("b", "1.1")
+    _, ran = stages.run_stages(doc, "c", reader, [a, b2], store=store, policies_path=str(pol))
+    assert ran["read"] == "hit" and ran["extract:a"] == "hit"
+    assert all(ran[k] == "run" for k in ("extract:b", "spans", "normalize", "post", "compliance", "summary"))
+    assert a.calls == 1 and b.calls == 1 and b2.calls == 1
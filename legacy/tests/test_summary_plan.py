@@ -0,0 +1,46 @@
+import importlib
+
+import pandas as pd
+
+
+def _spans():
+    rows = [("party", "A", "Muster GmbH", "Muster GmbH"), ("party", None, "Max Mustermann", "Max Mustermann"),
+            ("date", "start_date", "01.02.2024", "01.02.2024"), ("date", "end_date", "31.01.2025", "31.01.2025"),
+            ("money", "total_fee", "1200 €", "1200"), ("money", "vat_percent", "19 ٪", "19"),
+            ("other", "vat_rate_percent", "19 %", "19"), ("clause", "subject", "§ 1 Wartung", "Wartung der Anlage")]
+    return pd.DataFrame({"type": [r[0] for r in rows], "subtype": [r[1] for r in rows], "text_raw": [r[2] for r in rows],
+                         "value_norm": [r[3] for r in rows], "currency": "EUR"})
+
+
+def test_one_pass_fills_all_outputs():
+    summarize = importlib.import_module("pipeline.summarize")
+    df = _spans()
+    en, de, key = summarize.summaries(df, sections={"1": "Gegenstand ist die Wartung"})
+    assert en.equals(summarize.summarize(df)) and de.equals(summarize.summarize_de(df))
+    assert key == summarize.summarize_keyfacts("", {"1": "Gegenstand ist die Wartung"}, df)
+    row = en.iloc[0]
+    assert (row["Parties"], row["Subject"], row["StartDate"], row["EndDate"]) == (
+        "Muster GmbH | Max Mustermann", "Wartung der Anlage", "2024-02-01", "2025-01-31")
+    # TermMonths falls back to the months between start and end
+    assert (row["TermMonths"], row["TotalAmount"], row["Currency"], row["VAT_Percent"]) == ("11", "1200", "EUR", "19 %")
+    assert list(de.columns[:4]) == ["Parteien", "Betreff", "Beginn", "Ende"] and de.iloc[0]["Gesamtbetrag"] == "1200"
+    assert (key["party_1"], key["party_2"], key["total_fee"], key["currency"], key["vat_rate_percent"]) == (
+        "Muster GmbH", "Max Mustermann", 1200.0, "EUR", 19)
+    assert key["subject_snippet"] == "Gegenstand ist die Wartung..." and key["contract_type"] is None
+    assert summarize.summaries(df, keyfacts=False)[2] is None
+
+
+def test_fields_read_each_selection_once():
+    summarize = importlib.import_module("pipeline.summarize")
+    plan = summarize.PLAN
+    assert len(plan.groups) < len(plan.fields)
+    # lookups of CONTRACT_SCHEMA facts come from the schema
+    from core.contract_schema import CONTRACT_SCHEMA
+    start = CONTRACT_SCHEMA["term"]["start_date"]
+    assert ("date", "start_date") == (start["type"], start["subtype"]) and len(plan.groups[("date", "start_date")]) == 2
+    en, de, key = plan.run(None, {})
+    assert set(en.values()) == {""} and list(de) == list(summarize.summarize_de(None).columns)
+    assert key == {"party_1": None, "party_2": None, "contract_type": None, "subject_snippet": None, "total_fee": None,
+                   "currency": None, "vat_rate_percent": None, "payment_terms_days": None, "start_date": None,
+                   "end_date": None, "termination_notice_weeks_to_month_end": None, "governing_law": None,
+                   "jurisdiction_city": None}
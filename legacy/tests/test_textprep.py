@@ -0,0 +1,58 @@
+import importlib
+import random
+import re
+
+import pytest
+
+
+def _reference(s):
+    # the previous multi-pass implementation, kept as the behavioural spec
+    if not s:
+        return s
+    s = s.replace("\r\n", "\n").replace("\r", "\n").replace("\xa0", " ")
+    s = s.replace("–", "-").replace("—", "-").replace("‚", "'").replace("“", '"').replace("”", '"')
+    s = re.sub(r"§\s*(\d+)", r"§ \1", s)
+    s = "\n".join(re.sub(r"[ \t\r\f\v]+", " ", line).strip() for line in s.split("\n"))
+    out, prev_blank = [], False
+    for ln in s.split("\n"):
+        blank = ln.strip() == ""
+        if blank and prev_blank:
+            continue
+        out.append(ln)
+        prev_blank = blank
+    return "\n".join(out).strip()
+
+
+@pytest.mark.parametrize("src", [
+    "", "  §1 Vertragsgegenstand\r\n\r\n\r\nDer  Vertrag –\tgilt\xa0ab “heute”.  \n",
+    "§\n12 Haftung", "a 　 \t b\n \n\x0c\nc", "Preis:\t\t1.200,00 €\r\rEnde  ",
+])
+def test_normalize_text_matches_reference(src):
+    tp = importlib.import_module("pipeline.textprep")
+    assert tp.normalize_text(src) == _reference(src)
+
+
+def test_normalize_text_fuzz_and_offset_map():
+    tp = importlib.import_module("pipeline.textprep")
+    rnd = random.Random(7)
+    alphabet = list("ab§12 \t\r\n\xa0–—‚“”　\x85\x0c\x0b.,")
+    for _ in range(3000):
+        src = "".join(rnd.choice(alphabet) for _ in range(rnd.randint(0, 30)))
+        norm, omap = tp.normalize_text_with_map(src)
+        assert norm == _reference(src)
+        if norm:
+            # characters that were not rewritten map back onto themselves
+            for i, j in enumerate(omap.to_source(list(range(len(norm))))):
+                if norm[i] not in " \n-'\"":
+                    assert src[j] == norm[i]
+
+
+def test_span_to_source_highlights_original():
+    tp = importlib.import_module("pipeline.textprep")
+    src = "§3   Vergütung:\r\n\r\n\r\n  Die  Vergütung beträgt 1.200,00\xa0EUR."
+    norm, omap = tp.normalize_text_with_map(src)
+    i = norm.index("1.200,00 EUR")
+    s, e = omap.span_to_source(i, i + len("1.200,00 EUR"))
+    assert src[s:e] == "1.200,00\xa0EUR"
+    s, e = omap.span_to_source(0, len("§ 3 Vergütung"))
+    assert src[s:e] == "§3   Vergütung"
@@ -0,0 +1,38 @@
+import importlib
+
+import pandas as pd
+
+
+def test_numbers_and_dates_parse_like_the_scalar_helpers():
+    values = importlib.import_module("core.values")
+    s = pd.Series(["1.200,50 €", "19 %", "19,5", "1.200", None, "Berlin", 30, "01.02.24", "15/10/2025",
+                   " 2024-02-01 ", "31.02.2024", "1.2/2024", "19 %"], index=[5, 5, 1, 2, 3, 4, 6, 7, 8, 9, 10, 11, 12])
+    nums = values.parse_numbers(s)
+    assert nums.index.equals(s.index) and str(nums.dtype) == "float64"
+    assert nums.tolist()[:4] == [1200.5, 19.0, 19.5, 1.2] and nums.isna().tolist()[4:6] == [True, True]
+    assert (nums.iloc[6], nums.iloc[-1]) == (30.0, 19.0)
+    dates = values.parse_dates(s)
+    assert dates.dtype.kind == "M" and dates.isna().tolist()[:7] == [True] * 7
+    assert [d.strftime("%Y-%m-%d") for d in dates.iloc[7:10]] == ["2024-02-01", "2025-10-15", "2024-02-01"]
+    assert dates.iloc[10:12].isna().all()
+    assert [values.iso_date(v) for v in ("1.2.24", "2024-02-01", "31.12.2025", "Mai 2024", "")] == [
+        "2024-02-01", "2024-02-01", "2025-12-31", "Mai 2024", None]
+
+
+def test_normalize_adds_typed_columns_read_by_rules(monkeypatch):
+    import sys
+    for name in ("rules", "rules.engine"):
+        monkeypatch.delitem(sys.modules, name, raising=False)
+    engine = importlib.import_module("rules.engine")
+    from pipeline.normalize import normalize_spans
+    rows = [("date", "start_date", "01.09.2025"), ("date", "end_date", "15/10/2025"), ("money", "cost_per_month", "100,50 EUR")]
+    df = pd.DataFrame({"type": [r[0] for r in rows], "subtype": [r[1] for r in rows],
+                       "text_raw": [r[2] for r in rows], "value_norm": [r[2] for r in rows]})
+    out, _ = normalize_spans(df, "")
+    assert out["value_num"].tolist()[2] == 100.5 and out["value_date"].iloc[1] == pd.Timestamp("2025-10-15")
+    policies = {"rules": [{"id": "r1", "type": "start_before_end"},
+                          {"id": "r2", "type": "min_value", "where": {"subtype": "cost_per_month"}, "threshold": 100}]}
+    res = engine.evaluate_compliance(out, policies)
+    assert res["passed"].tolist() == [True, True]
+    # a frame without the typed columns (not normalized) parses value_norm on the fly
+    assert engine.evaluate_compliance(df, policies)["passed"].tolist() == [True, True]